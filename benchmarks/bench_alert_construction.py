@@ -0,0 +1,67 @@
+"""Construction time and memory of ``IndividualAlert`` objects for a
+500-feature ``/alerts`` payload.
+
+Alerts build their geometry, datetimes and series on first access. "eager"
+touches all of them straight after construction, which is the work (and
+memory) the constructor used to do up front; "lazy" only reads ``event`` and
+``id``, which is what most consumers do.
+
+Run with::
+
+    python benchmarks/bench_alert_construction.py [number of features]
+"""
+
+import copy
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.endpoints.alerts import IndividualAlert
+from payloads import alerts_payload
+
+
+def read_event_and_id(alert):
+    return alert.event, alert.id
+
+
+def read_everything(alert):
+    return (alert.points, alert.polygon, alert.sent, alert.sent_utc,
+            alert.effective_utc, alert.onset_utc, alert.expires_utc,
+            alert.ends_utc, alert.series)
+
+
+def measure(features, access, repeat = 5):
+    best = float('inf')
+    for _ in range(repeat):
+        payload = copy.deepcopy(features)
+        start = time.perf_counter()
+        alerts = [IndividualAlert(feature) for feature in payload]
+        for alert in alerts:
+            access(alert)
+        best = min(best, time.perf_counter() - start)
+
+    payload = copy.deepcopy(features)
+    tracemalloc.start()
+    alerts = [IndividualAlert(feature) for feature in payload]
+    for alert in alerts:
+        access(alert)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, memory
+
+
+def main(n = 500):
+    features = alerts_payload(n)['features']
+    print(f'{n} features')
+    for name, access in [('eager (all attributes)', read_everything),
+                         ('lazy (event and id)', read_event_and_id)]:
+        seconds, memory = measure(features, access)
+        print(f'{name:<24} {seconds * 1000:8.2f} ms   '
+              f'{memory / 1024 ** 2:7.2f} MiB   {memory / n:9.0f} bytes/alert')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,69 @@
+"""Memory retained per ``IndividualAlert`` once the decoded response has been
+dropped, for a large ``/alerts`` payload.
+
+"features" is the decoded JSON on its own, which is what a collection of
+alerts would cost if it kept the response around. "alerts" is the alerts
+after the response is gone, untouched and with every attribute accessed.
+
+Run with::
+
+    python benchmarks/bench_alert_memory.py [number of features]
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.endpoints.alerts import IndividualAlert
+from payloads import alerts_payload
+from bench_alert_construction import read_everything
+
+
+def retained(build, features):
+    # The memory still allocated after build() returns, with only what it
+    # returns kept alive. The payload is decoded while tracing (as it would be
+    # from a response), so the parts of it that are kept are counted too.
+    encoded = json.dumps(features)
+    gc.collect()
+    tracemalloc.start()
+    payload = json.loads(encoded)
+    kept = build(payload)
+    del payload
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory, kept
+
+
+def features_only(payload):
+    return list(payload)
+
+
+def alerts(payload):
+    return [IndividualAlert(feature) for feature in payload]
+
+
+def alerts_touched(payload):
+    built = alerts(payload)
+    for alert in built:
+        read_everything(alert)
+    return built
+
+
+def main(n = 10000):
+    features = alerts_payload(n)['features']
+    print(f'{n} features')
+    for name, build in [('features (decoded JSON)', features_only),
+                        ('alerts (untouched)', alerts),
+                        ('alerts (all attributes)', alerts_touched)]:
+        memory, _ = retained(build, features)
+        print(f'{name:<26} {memory / 1024 ** 2:8.2f} MiB   '
+              f'{memory / n:9.0f} bytes/alert')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,57 @@
+"""Time to match many locations (i.e. assets) against the alerts, for 1500
+alerts (about 1000 of them with polygons) and 10k, 100k and 1M random
+locations over the CONUS.
+
+"loop" calls ``alerts_at`` for each location; it's only timed on the first
+10k locations and scaled up. "vectorized" uses ``alerts_at_points``, which
+drops the locations outside of the alerts' bounding box and checks the rest
+in chunks against the spatial index.
+
+Run with::
+
+    python benchmarks/bench_alert_points_matrix.py [number of alerts]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nwsapy.services.set_data as set_data
+from payloads import alerts_payload
+
+LOOP_SAMPLE = 10000
+
+
+def main(n = 1500):
+    alerts = set_data.for_alerts((alerts_payload(n), {}))
+    alerts.alerts_at(0, 0)  # build the spatial index up front.
+    rng = np.random.default_rng(0)
+    print(f'{n} alerts')
+
+    for size in (10000, 100000, 1000000):
+        lats = rng.uniform(25, 48, size)
+        lons = rng.uniform(-124, -67, size)
+
+        sample = min(size, LOOP_SAMPLE)
+        start = time.perf_counter()
+        found_loop = [len(alerts.alerts_at(lat, lon))
+                      for lat, lon in zip(lats[:sample].tolist(), lons[:sample].tolist())]
+        loop_seconds = (time.perf_counter() - start) * size / sample
+
+        start = time.perf_counter()
+        point_index, alert_index = alerts.alerts_at_points(lats, lons)
+        vectorized_seconds = time.perf_counter() - start
+
+        counts = np.bincount(point_index, minlength = size)[:sample]
+        assert counts.tolist() == found_loop
+        print(f'{size:>9} locations  loop {loop_seconds:8.3f} s'
+              f'{" (scaled)" if sample < size else "         "}'
+              f'  vectorized {vectorized_seconds:8.3f} s  {len(point_index)} matches')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
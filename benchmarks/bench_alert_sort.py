@@ -0,0 +1,63 @@
+"""Time to rank alerts, for 5000 alerts re-ranked 100 times (as when a
+dashboard re-ranks on every refresh).
+
+"sorted" calls ``sorted()`` with a key function over the alert attributes,
+as consumers used to. "sort_by"/"top_k" use the key arrays of the
+collection, built on the first call (the build time is reported on its own).
+
+Run with::
+
+    python benchmarks/bench_alert_sort.py [number of alerts]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nwsapy.services.set_data as set_data
+from nwsapy.endpoints.alerts import ORDINAL_PROPERTIES
+from payloads import alerts_payload
+
+RANKS = {value: rank for rank, value in enumerate(ORDINAL_PROPERTIES['severity'])}
+
+
+def key(alert):
+    return (-RANKS[alert.severity], alert.expires_utc)
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main(n = 5000, repeat = 100):
+    alerts = set_data.for_alerts((alerts_payload(n), {}))
+    for alert in alerts:  # parse the times up front, for a fair comparison.
+        alert.expires_utc
+    print(f'{n} alerts, re-ranked {repeat} times')
+
+    found_sorted, sorted_seconds = timed(lambda: sorted(alerts, key = key), repeat)
+    found_top, top_sorted_seconds = timed(lambda: sorted(alerts, key = key)[:10], repeat)
+
+    start = time.perf_counter()
+    alerts.sort_by('-severity', 'expires')
+    build_seconds = time.perf_counter() - start
+
+    found_sort_by, sort_by_seconds = timed(lambda: alerts.sort_by('-severity', 'expires'), repeat)
+    found_top_k, top_k_seconds = timed(lambda: alerts.top_k('severity', 10), repeat)
+
+    assert found_sorted == found_sort_by
+    assert [RANKS[a.severity] for a in found_top] == [RANKS[a.severity] for a in found_top_k]
+    print(f'sorted()            {sorted_seconds * 1000:8.3f} ms')
+    print(f'sort_by()           {sort_by_seconds * 1000:8.3f} ms '
+          f'(key arrays built once in {build_seconds * 1000:.1f} ms)')
+    print(f'sorted()[:10]       {top_sorted_seconds * 1000:8.3f} ms')
+    print(f'top_k(10)           {top_k_seconds * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,59 @@
+"""Time to find the alerts covering a location, for 1500 alerts (about 1000
+of them with polygons, like a national outbreak) and 1000 random locations.
+
+"loop" checks ``polygon.contains`` on every alert, as consumers used to.
+"index" uses ``alerts_at``, backed by an STRtree built on the first call
+(the build time is reported on its own).
+
+Run with::
+
+    python benchmarks/bench_alert_spatial.py [number of alerts]
+"""
+
+import os
+import random
+import sys
+import time
+
+from shapely.geometry import Point
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nwsapy.services.set_data as set_data
+from payloads import alerts_payload
+
+
+def loop(alerts, lat, lon):
+    point = Point(lon, lat)
+    return [alert for alert in alerts
+            if alert.polygon is not None and alert.polygon.contains(point)]
+
+
+def main(n = 1500, queries = 1000):
+    alerts = set_data.for_alerts((alerts_payload(n), {}))
+    rng = random.Random(0)
+    locations = [(rng.uniform(25, 48), rng.uniform(-124, -67)) for _ in range(queries)]
+    for alert in alerts:  # build the polygons up front, for a fair loop.
+        alert.polygon
+    print(f'{n} alerts, {queries} locations')
+
+    start = time.perf_counter()
+    found_loop = [loop(alerts, lat, lon) for lat, lon in locations]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    alerts.alerts_at(0, 0)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found_index = [alerts.alerts_at(lat, lon) for lat, lon in locations]
+    index_seconds = time.perf_counter() - start
+
+    assert [len(found) for found in found_loop] == [len(found) for found in found_index]
+    print(f'loop   {loop_seconds / queries * 1000:8.3f} ms/location')
+    print(f'index  {index_seconds / queries * 1000:8.3f} ms/location '
+          f'(built once in {build_seconds * 1000:.1f} ms)')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
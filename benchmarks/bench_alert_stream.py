@@ -0,0 +1,94 @@
+"""Time to the first alert, total time and peak memory of reading a large
+``/alerts`` response (2000 features) from a local HTTPS stub that sends the
+body in pieces, like a slow link.
+
+"whole" reads and decodes the whole body, then makes the alerts (what
+``get_alerts()`` does). "stream" decodes each feature as its bytes arrive
+and makes its alert straight away (what ``get_alerts(stream = True)`` does).
+Each alert is dropped once it's been read, as a consumer writing them out
+would.
+
+Run with::
+
+    python benchmarks/bench_alert_stream.py [number of features]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nwsapy.services.set_data as set_data
+from nwsapy.services.request import create_session, request_from_api, stream_from_api
+from payloads import alerts_payload
+from stub_server import StubHandler, StubServer
+
+
+class SlowHandler(StubHandler):
+    """Sends ``body`` in ``piece`` byte writes, ``delay`` seconds apart."""
+    body = b''
+    piece = 16384
+    delay = 0.001
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/geo+json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        for start in range(0, len(self.body), self.piece):
+            self.wfile.write(self.body[start:start + self.piece])
+            self.wfile.flush()
+            time.sleep(self.delay)
+
+
+def whole(session, url):
+    response = request_from_api(url, {}, session = session)
+    yield from set_data.for_alerts(response)
+
+
+def stream(session, url):
+    yield from set_data.for_alert_stream(stream_from_api(url, {}, session = session))
+
+
+def consume(read, session, url):
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for alert in read(session, url):
+        if first is None:
+            first = time.perf_counter() - start
+        alert.event
+        count += 1
+    return first, time.perf_counter() - start, count
+
+
+def measure(read, session, url):
+    # tracemalloc slows everything down, so the memory is measured on its
+    # own run.
+    first, total, count = consume(read, session, url)
+    tracemalloc.start()
+    consume(read, session, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first, total, peak, count
+
+
+def main(n = 2000):
+    SlowHandler.body = json.dumps(alerts_payload(n)).encode()
+    print(f'{n} features, {len(SlowHandler.body) / 1024 ** 2:.1f} MiB')
+    with StubServer(SlowHandler) as server:
+        os.environ['REQUESTS_CA_BUNDLE'] = server.cert
+        session = create_session()
+        url = server.url + '/alerts'
+        for name, read in [('whole', whole), ('stream', stream)]:
+            first, total, peak, count = measure(read, session, url)
+            print(f'{name:<7} first alert {first * 1000:8.1f} ms   '
+                  f'all {count} {total * 1000:8.1f} ms   '
+                  f'peak {peak / 1024 ** 2:7.2f} MiB')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,70 @@
+"""Time to go from the decoded features of a 500-feature ``/alerts`` payload
+to a dataframe.
+
+"per-alert" is how ``to_df`` used to work: an ``IndividualAlert`` per feature,
+then a dataframe built from a dictionary per alert, transposed and filled
+(every column has object dtype). "table" parses the features into an
+``AlertTable`` and builds the same columns from its typed columns. "typed"
+is ``to_df(derived = False)``, which leaves out the local times and the
+derived columns (points, polygon, ...).
+
+Run with::
+
+    python benchmarks/bench_alert_table.py [number of features]
+"""
+
+import copy
+import os
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.endpoints.alerts import AlertTable, IndividualAlert
+from payloads import alerts_payload
+
+
+def per_alert(features):
+    alerts = [IndividualAlert(feature) for feature in features]
+    d = OrderedDict()
+    for index, alert in enumerate(alerts):
+        d[index] = alert.to_dict()
+    df = pd.DataFrame.from_dict(d).transpose()
+    df = df.reindex(sorted(df.columns), axis = 1)
+    return df.fillna(value = np.nan)
+
+
+def table(features):
+    return AlertTable(features).to_df()
+
+
+def typed(features):
+    return AlertTable(features).to_df(derived = False)
+
+
+def measure(features, build, repeat = 5):
+    best = float('inf')
+    for _ in range(repeat):
+        payload = copy.deepcopy(features)
+        start = time.perf_counter()
+        df = build(payload)
+        best = min(best, time.perf_counter() - start)
+    return best, df
+
+
+def main(n = 500):
+    features = alerts_payload(n)['features']
+    print(f'{n} features')
+    for name, build in [('per-alert', per_alert), ('table', table), ('typed', typed)]:
+        seconds, df = measure(features, build)
+        n_typed = sum(dtype != object for dtype in df.dtypes)
+        print(f'{name:<10} {seconds * 1000:8.2f} ms   '
+              f'{n_typed:3d}/{len(df.columns)} typed columns')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,74 @@
+"""Time to find the alerts in effect at a time, and in a window, for 10000
+alerts and 1000 random times over the two days the alerts were sent in.
+
+"loop" compares the times of every alert, as consumers used to. "index" uses
+``active_at`` and ``overlapping``, backed by sorted arrays of the times built
+on the first call (the build time is reported on its own).
+
+Run with::
+
+    python benchmarks/bench_alert_time_index.py [number of alerts]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nwsapy.services.set_data as set_data
+from payloads import alerts_payload
+
+
+def start(alert):
+    return alert.effective_utc or alert.onset_utc or alert.sent_utc
+
+
+def end(alert):
+    return alert.ends_utc or alert.expires_utc
+
+
+def loop_active_at(alerts, at):
+    return [alert for alert in alerts
+            if start(alert) <= at and (end(alert) is None or at < end(alert))]
+
+
+def loop_overlapping(alerts, first, last):
+    return [alert for alert in alerts
+            if start(alert) < last and (end(alert) is None or first < end(alert))]
+
+
+def main(n = 10000, queries = 1000):
+    alerts = set_data.for_alerts((alerts_payload(n), {}))
+    for alert in alerts:  # parse the times up front, for a fair loop.
+        alert.sent_utc
+    rng = random.Random(0)
+    base = datetime(2022, 5, 1, 4, tzinfo = timezone.utc)
+    times = [base + timedelta(minutes = rng.randint(0, 2880)) for _ in range(queries)]
+    window = timedelta(hours = 1)
+    print(f'{n} alerts, {queries} queries')
+
+    start_time = time.perf_counter()
+    found_loop = [loop_active_at(alerts, at) for at in times]
+    found_loop += [loop_overlapping(alerts, at, at + window) for at in times]
+    loop_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    alerts.active_at(base)
+    build_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    found_index = [alerts.active_at(at) for at in times]
+    found_index += [alerts.overlapping(at, at + window) for at in times]
+    index_seconds = time.perf_counter() - start_time
+
+    assert found_loop == found_index
+    print(f'loop   {loop_seconds / queries / 2 * 1000:8.3f} ms/query')
+    print(f'index  {index_seconds / queries / 2 * 1000:8.3f} ms/query '
+          f'(built once in {build_seconds * 1000:.1f} ms)')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
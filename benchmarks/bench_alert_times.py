@@ -0,0 +1,52 @@
+"""Time to parse the five times (sent, effective, onset, expires, ends) of
+every alert in a 500-feature ``/alerts`` payload.
+
+"per-alert" is ``IndividualAlert._set_times``: ``datetime.fromisoformat``
+and a conversion to UTC for each time of each alert. "vectorized" is what
+``AlertTable`` does: one numpy parse per time for all of the alerts, into
+UTC ``datetime64`` arrays (local times are only made when they're accessed).
+
+Run with::
+
+    python benchmarks/bench_alert_times.py [number of features]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.endpoints.alerts import ALERT_TIMES, IndividualAlert, _parse_times
+from payloads import alerts_payload
+
+
+def per_alert(properties):
+    set_times = IndividualAlert._set_times
+    return [set_times(None, {time: props[time] for time in ALERT_TIMES})
+            for props in properties]
+
+
+def vectorized(properties):
+    return {time: _parse_times([props[time] for props in properties])
+            for time in ALERT_TIMES}
+
+
+def measure(properties, parse, repeat = 20):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(properties)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n = 500):
+    properties = [feature['properties'] for feature in alerts_payload(n)['features']]
+    print(f'{n} features')
+    for name, parse in [('per-alert', per_alert), ('vectorized', vectorized)]:
+        print(f'{name:<11} {measure(properties, parse) * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,54 @@
+"""Time to find the alerts in a zone, for 1500 alerts and 1000 lookups of
+zones that have alerts.
+
+"scan" checks ``affected_zones`` of every alert, as consumers used to.
+"index" uses ``by_zone``, backed by an index by zone built on the first call
+(the build time is reported on its own).
+
+Run with::
+
+    python benchmarks/bench_alert_zones.py [number of alerts]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nwsapy.services.set_data as set_data
+from payloads import alerts_payload
+
+
+def scan(alerts, zone):
+    return [alert for alert in alerts if zone in alert.affected_zones]
+
+
+def main(n = 1500, queries = 1000):
+    alerts = set_data.for_alerts((alerts_payload(n), {}))
+    zones = sorted({zone for alert in alerts for zone in alert.affected_zones})
+    rng = random.Random(0)
+    lookups = [rng.choice(zones) for _ in range(queries)]
+    print(f'{n} alerts, {len(zones)} zones, {queries} lookups')
+
+    start = time.perf_counter()
+    found_scan = [scan(alerts, zone) for zone in lookups]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    alerts.zones_with_alerts()
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found_index = [alerts.by_zone(zone) for zone in lookups]
+    index_seconds = time.perf_counter() - start
+
+    assert found_scan == found_index
+    print(f'scan   {scan_seconds / queries * 1000:8.3f} ms/lookup')
+    print(f'index  {index_seconds / queries * 1000:8.3f} ms/lookup '
+          f'(built once in {build_seconds * 1000:.1f} ms)')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
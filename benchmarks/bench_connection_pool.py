@@ -0,0 +1,56 @@
+"""Per-call latency of ``request_from_api`` with and without a pooled,
+keep-alive session, against a local HTTPS stub of the NWS API.
+
+Run with::
+
+    python benchmarks/bench_connection_pool.py [number of calls]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.services.request import create_session, request_from_api
+from stub_server import StubHandler, StubServer
+
+
+class GlossaryHandler(StubHandler):
+    routes = {'/glossary': {'glossary': [{'term': 'Zulu', 'definition': 'UTC'}]}}
+
+
+def time_calls(url, headers, n, session = None):
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        request_from_api(url, headers, session = session)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings):
+    ms = [t * 1000 for t in timings]
+    print(f'{name:<16} mean: {statistics.mean(ms):7.3f} ms   '
+          f'median: {statistics.median(ms):7.3f} ms   '
+          f'p95: {sorted(ms)[int(len(ms) * 0.95)]:7.3f} ms')
+
+
+def main(n = 200):
+    headers = {'User-Agent': '(NWSAPy benchmark, localhost)'}
+    with StubServer(GlossaryHandler) as server:
+        # requests.get and Session.get both pick this up to verify the stub.
+        os.environ['REQUESTS_CA_BUNDLE'] = server.cert
+        url = f'{server.url}/glossary'
+
+        print(f'{n} calls to {url}')
+        report('without pool', time_calls(url, headers, n))
+
+        session = create_session()
+        report('with pool', time_calls(url, headers, n, session = session))
+        session.close()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,51 @@
+"""Decode time per MB of each installed JSON decoder, for ``/alerts`` (500
+features), ``/points`` and ``/glossary`` payloads.
+
+Run with::
+
+    python benchmarks/bench_json_decoder.py
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.services.json_decoder import DECODERS, get_decoder
+from payloads import alerts_payload, glossary_payload, point_payload
+
+
+def measure(decode, body, repeat = 20):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(body)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    bodies = {
+        'alerts': json.dumps(alerts_payload(500)).encode(),
+        'point': json.dumps(point_payload()).encode(),
+        'glossary': json.dumps(glossary_payload()).encode(),
+    }
+    decoders = {}
+    for name in DECODERS:
+        try:
+            decoders[name] = get_decoder(name)
+        except ImportError:
+            print(f'{name} is not installed, skipping.')
+
+    for payload, body in bodies.items():
+        mb = len(body) / 1024 ** 2
+        print(f'{payload} ({len(body) / 1024:.1f} KiB)')
+        for name, decode in decoders.items():
+            seconds = measure(decode, body)
+            print(f'    {name:<8} {seconds * 1000:8.3f} ms   {seconds * 1000 / mb:8.2f} ms/MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Sustained throughput of many threads making requests through
+``request_from_api``, against a local HTTPS stub that throttles clients going
+over its allowed rate (429 with ``Retry-After``), with and without
+``RateLimiter``.
+
+Run with::
+
+    python benchmarks/bench_rate_limit.py [allowed requests per second]
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.services.rate_limit import RateLimiter
+from nwsapy.services.request import create_session, request_from_api
+from stub_server import StubHandler, StubServer
+
+
+class ThrottlingHandler(StubHandler):
+    """Allows ``rate`` requests per second (with bursts of up to ``rate``),
+    answers the rest with a 429 and ``Retry-After: 1``, like the NWS API.
+    """
+    rate = 20
+    served = 0
+    throttled = 0
+    lock = threading.Lock()
+
+    @classmethod
+    def reset(cls, rate):
+        cls.rate = cls.tokens = rate
+        cls.updated = time.monotonic()
+        cls.served = cls.throttled = 0
+
+    @classmethod
+    def allow(cls):
+        with cls.lock:
+            now = time.monotonic()
+            cls.tokens = min(cls.rate, cls.tokens + (now - cls.updated) * cls.rate)
+            cls.updated = now
+            if cls.tokens < 1:
+                cls.throttled += 1
+                return False
+            cls.tokens -= 1
+            cls.served += 1
+            return True
+
+    def do_GET(self):
+        if not self.allow():
+            self.send_json(429, {'correlationId': 'stub', 'title': 'Too Many Requests',
+                                 'status': 429, 'detail': 'Rate limit exceeded'},
+                           headers = {'Retry-After': '1'})
+            return
+        self.send_json(200, {'status': 'OK'})
+
+
+def run(url, headers, n_requests, n_threads, rate_limiter = None):
+    session = create_session(pool_maxsize = n_threads)
+
+    def call(_):
+        values, _ = request_from_api(url, headers, session = session,
+                                     rate_limiter = rate_limiter)
+        return 'correlationId' not in values
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(n_threads) as pool:
+        ok = sum(pool.map(call, range(n_requests)))
+    elapsed = time.perf_counter() - start
+    session.close()
+    return ok, elapsed
+
+
+def main(rate = 20):
+    n_requests, n_threads = 10 * rate, 16
+    headers = {'User-Agent': '(NWSAPy benchmark, localhost)'}
+
+    with StubServer(ThrottlingHandler) as server:
+        os.environ['REQUESTS_CA_BUNDLE'] = server.cert
+        print(f'{n_requests} requests from {n_threads} threads, '
+              f'stub allows {rate} requests/s (burst {rate})\n')
+
+        for name, limiter in [('no limiter', None),
+                              ('RateLimiter', RateLimiter(rate = rate, burst = rate,
+                                                          max_retries = 5))]:
+            ThrottlingHandler.reset(rate)
+            ok, elapsed = run(server.url, headers, n_requests, n_threads, limiter)
+            retries = limiter.retries if limiter is not None else 0
+            print(f'{name:<12} succeeded: {ok:>4}/{n_requests}   '
+                  f'throttled by stub: {ThrottlingHandler.throttled:>4}   '
+                  f'retries: {retries:>3}   '
+                  f'throughput: {ok / elapsed:6.1f} successful requests/s')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,57 @@
+"""Time to validate the parameters of an alerts query with 50 events and 50
+areas (plus a severity and urgency), as ``get_alerts`` does before making
+the request.
+
+"lists" rebuilds the data validation list for every value and scans it, as
+the checks used to. "tables" is ``check_active_alerts_dvt``, which looks
+each value up in tables built once (regardless of case).
+
+Run with::
+
+    python benchmarks/bench_validation.py [number of runs]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nwsapy.services.validation import (DataValidationChecker, valid_areas, valid_products,
+                                        valid_severity, valid_urgency)
+
+LISTS = {'area': valid_areas, 'event': valid_products,
+         'severity': valid_severity, 'urgency': valid_urgency}
+
+
+def check_with_lists(params):
+    for key, value in params.items():
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        for val in value:
+            if val not in LISTS[key]():
+                raise ValueError(val)
+
+
+def main(runs = 10000):
+    params = {'event': valid_products()[-50:], 'area': valid_areas()[:50],
+              'severity': ['Extreme', 'Severe'], 'urgency': 'Immediate'}
+    checker = DataValidationChecker()
+    print(f"{len(params['event'])} events, {len(params['area'])} areas, {runs} runs")
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        check_with_lists(params)
+    lists_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        checker.check_active_alerts_dvt(params)
+    tables_seconds = time.perf_counter() - start
+
+    print(f'lists   {lists_seconds / runs * 1e6:8.1f} us/query')
+    print(f'tables  {tables_seconds / runs * 1e6:8.1f} us/query')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
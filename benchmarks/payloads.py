@@ -0,0 +1,109 @@
+"""Synthetic NWS API payloads for the benchmarks, shaped like real responses
+from ``/alerts``, ``/points`` and ``/glossary``.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+EVENTS = ['Tornado Warning', 'Severe Thunderstorm Warning', 'Flood Watch',
+          'Flash Flood Warning', 'Winter Storm Warning', 'Heat Advisory',
+          'Special Weather Statement', 'Small Craft Advisory', 'Wind Advisory',
+          'Red Flag Warning']
+SEVERITIES = ['Extreme', 'Severe', 'Moderate', 'Minor', 'Unknown']
+URGENCIES = ['Immediate', 'Expected', 'Future', 'Past', 'Unknown']
+CERTAINTIES = ['Observed', 'Likely', 'Possible', 'Unlikely', 'Unknown']
+STATES = ['TX', 'OK', 'KS', 'FL', 'GA', 'AL', 'MS', 'LA', 'CO', 'NE']
+
+
+def _polygon(rng, n_vertices = 20):
+    lat, lon = rng.uniform(25, 48), rng.uniform(-124, -67)
+    ring = []
+    for i in range(n_vertices):
+        angle = 2 * math.pi * i / n_vertices
+        radius = rng.uniform(0.1, 0.4)
+        ring.append([round(lon + radius * 1.3 * math.cos(angle), 4),
+                     round(lat + radius * math.sin(angle), 4)])
+    ring.append(ring[0])
+    return {'type': 'Polygon', 'coordinates': [ring]}
+
+
+def alert_feature(i, rng = None, sent = None):
+    """A single alert feature. About 1 in 3 alerts have no geometry (zone
+    based alerts), as with the API.
+    """
+    rng = rng or random.Random(i)
+    tz = timezone(timedelta(hours = -rng.choice([4, 5, 6, 7])))
+    sent = sent or datetime(2022, 5, 1, tzinfo = tz) + timedelta(minutes = rng.randint(0, 2880))
+    iso = lambda d: d.isoformat() if d is not None else None
+    state = rng.choice(STATES)
+    zones = [f'{state}Z{rng.randint(1, 250):03d}' for _ in range(rng.randint(1, 8))]
+    alert_id = f'urn:oid:2.49.0.1.840.0.{i:040x}.001.1'
+    return {
+        'id': f'https://api.weather.gov/alerts/{alert_id}',
+        'type': 'Feature',
+        'geometry': _polygon(rng) if i % 3 else None,
+        'properties': {
+            '@id': f'https://api.weather.gov/alerts/{alert_id}',
+            '@type': 'wx:Alert',
+            'id': alert_id,
+            'areaDesc': '; '.join(f'County {z}' for z in zones),
+            'geocode': {'SAME': ['048' + z[-3:] for z in zones], 'UGC': zones},
+            'affectedZones': [f'https://api.weather.gov/zones/forecast/{z}' for z in zones],
+            'references': [],
+            'sent': iso(sent),
+            'effective': iso(sent),
+            'onset': iso(sent + timedelta(minutes = rng.randint(0, 120))),
+            'expires': iso(sent + timedelta(hours = rng.randint(1, 24))),
+            'ends': iso(sent + timedelta(hours = rng.randint(1, 48))) if i % 4 else None,
+            'status': 'Actual',
+            'messageType': rng.choice(['Alert', 'Update', 'Cancel']),
+            'category': 'Met',
+            'severity': rng.choice(SEVERITIES),
+            'certainty': rng.choice(CERTAINTIES),
+            'urgency': rng.choice(URGENCIES),
+            'event': rng.choice(EVENTS),
+            'sender': 'w-nws.webmaster@noaa.gov',
+            'senderName': f'NWS Office {state}',
+            'headline': f'Alert {i} issued by NWS Office {state}',
+            'description': 'A long description of the hazard. ' * 30,
+            'instruction': 'Take the recommended actions. ' * 5,
+            'response': 'Execute',
+            'parameters': {'AWIPSidentifier': ['SVSXXX'], 'NWSheadline': ['HEADLINE']},
+        },
+    }
+
+
+def alerts_payload(n = 500, seed = 0):
+    """A ``/alerts`` response with ``n`` features."""
+    rng = random.Random(seed)
+    return {'@context': [], 'type': 'FeatureCollection',
+            'features': [alert_feature(i, rng) for i in range(n)],
+            'title': 'Current watches, warnings, and advisories',
+            'updated': '2022-05-01T00:00:00+00:00'}
+
+
+def point_payload(lat = 33.0, lon = -90.0):
+    """A ``/points/{lat},{lon}`` response."""
+    return {'properties': {
+        '@id': f'https://api.weather.gov/points/{lat},{lon}', '@type': 'wx:Point',
+        'cwa': 'JAN', 'forecastOffice': 'https://api.weather.gov/offices/JAN',
+        'gridId': 'JAN', 'gridX': 47, 'gridY': 51,
+        'forecast': 'https://api.weather.gov/gridpoints/JAN/47,51/forecast',
+        'forecastHourly': 'https://api.weather.gov/gridpoints/JAN/47,51/forecast/hourly',
+        'forecastGridData': 'https://api.weather.gov/gridpoints/JAN/47,51',
+        'observationStations': 'https://api.weather.gov/gridpoints/JAN/47,51/stations',
+        'relativeLocation': {'properties': {'city': 'Yazoo City', 'state': 'MS',
+                                            'distance': {'value': 1024.2},
+                                            'bearing': {'value': 131}}},
+        'forecastZone': 'https://api.weather.gov/zones/forecast/MSZ041',
+        'county': 'https://api.weather.gov/zones/county/MSC163',
+        'fireWeatherZone': 'https://api.weather.gov/zones/fire/MSZ041',
+        'timeZone': 'America/Chicago', 'radarStation': 'KDGX'}}
+
+
+def glossary_payload(n = 2000):
+    """A ``/glossary`` response with ``n`` terms."""
+    return {'glossary': [{'term': f'Term {i}',
+                          'definition': f'The definition of term {i}. ' * 8}
+                         for i in range(n)]}
@@ -0,0 +1,97 @@
+"""A local HTTPS stub of the NWS API, used by the benchmarks so that they
+measure NWSAPy (and not api.weather.gov or the network in between).
+
+The stub serves canned JSON payloads over HTTP/1.1 with keep-alive, using a
+throw-away self-signed certificate generated with ``openssl``.
+"""
+
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves ``routes`` (path -> JSON-serializable payload). Unknown paths
+    get a NWS API-like 404 problem response.
+    """
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes.
+    routes = {}
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path in self.routes:
+            self.send_json(200, self.routes[path])
+        else:
+            self.send_json(404, {'correlationId': 'stub', 'title': 'Not Found',
+                                 'status': 404, 'detail': self.path})
+
+    def send_json(self, status, payload, headers = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/geo+json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep the benchmark output clean.
+
+
+def make_certificate(directory):
+    """Creates a self-signed certificate for localhost with ``openssl``.
+
+    :return: The paths to the certificate and the key.
+    :rtype: tuple[str, str]
+    """
+    cert = os.path.join(directory, 'stub.pem')
+    key = os.path.join(directory, 'stub.key')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+                    '-days', '1', '-subj', '/CN=localhost',
+                    '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1',
+                    '-keyout', key, '-out', cert],
+                   check = True, capture_output = True)
+    return cert, key
+
+
+class StubServer:
+    """Runs a ``StubHandler`` subclass on a random localhost port in a
+    background thread. Use as a context manager::
+
+        with StubServer(handler) as server:
+            requests.get(server.url + '/glossary', verify = server.cert)
+    """
+
+    def __init__(self, handler = StubHandler, use_tls = True):
+        self.handler = handler
+        self.use_tls = use_tls
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cert = None
+
+    def __enter__(self):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self.handler)
+        self.httpd.daemon_threads = True
+        scheme = 'http'
+        if self.use_tls:
+            self.cert, key = make_certificate(self._tmp.name)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.cert, key)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket,
+                                                    server_side = True)
+            scheme = 'https'
+        self.url = f'{scheme}://localhost:{self.httpd.server_address[1]}'
+        self._thread = threading.Thread(target = self.httpd.serve_forever,
+                                        daemon = True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._tmp.cleanup()
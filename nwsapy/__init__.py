@@ -64,4 +64,5 @@ Dataframe:
 """
 
 from nwsapy.entrypoint import NWSAPy
+from nwsapy.async_entrypoint import AsyncNWSAPy
 nwsapy = api_connector = NWSAPy() # leaving this here for backwards compatability
\ No newline at end of file
@@ -0,0 +1,381 @@
+"""Asynchronous interface between the package and the user. ``AsyncNWSAPy``
+has the same ``get_*`` methods as ``NWSAPy``, except that each one is a
+coroutine that needs to be awaited::
+
+    import asyncio
+    from nwsapy import AsyncNWSAPy
+
+    async def main():
+        async with AsyncNWSAPy(max_concurrency = 20) as api:
+            api.set_user_agent("My App", "My website/email")
+            points = await asyncio.gather(*[api.get_point(lat, -90)
+                                            for lat in (30, 31, 32)])
+
+    asyncio.run(main())
+
+The same data validation, URL construction and data setting is used as
+``NWSAPy``, so the objects that are returned are identical to the
+synchronous ones.
+
+.. note::
+    This requires ``aiohttp`` to be installed (``pip install nwsapy[async]``).
+"""
+
+import asyncio
+
+from .entrypoint import NWSAPy, _as_utc, _page_of_alerts, _point_keys, _result_or_error, _points_result
+from .services.cache import canonical_url
+from .services.validation import DataValidationChecker
+from .services.request import async_request_from_api, async_stream_from_api, create_async_session
+from .services.single_flight import AsyncSingleFlight
+from .services.snapshot import ACTIVE_ALERTS_URL
+from .services.alert_watch import AlertWatcher
+from .core.inheritance.request_error import RequestError
+from .endpoints.alerts import IndividualAlert
+import nwsapy.services.set_data as set_data
+
+
+async def _alerts_from_stream(response):
+    # Asynchronous version of set_data.for_alert_stream.
+    values, _ = response
+    if isinstance(values, dict):
+        yield RequestError(response)
+        return
+    async for feature in values:
+        yield IndividualAlert(feature)
+
+
+class AsyncNWSAPy(NWSAPy):
+    """Asynchronous version of :class:`nwsapy.NWSAPy`.
+
+    :param max_concurrency: The maximum number of requests that can be in
+        flight at any given time. Other requests wait for a free slot.
+    :type max_concurrency: int
+    :param pool_maxsize: The maximum number of connections to keep alive.
+    :type pool_maxsize: int
+    """
+
+    def __init__(self, max_concurrency = 10, pool_maxsize = 100):
+        self._max_concurrency = max_concurrency
+        self._pool_maxsize = pool_maxsize
+
+        # The session and semaphore belong to the event loop, so they're
+        # created on the first request (which runs inside the loop).
+        self._session = None
+        self._semaphore = None
+        self._init_state()
+        self._single_flight = AsyncSingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def set_connection_pool(self, pool_maxsize = 100, max_concurrency = None):
+        """Sets the size of the connection pool and, optionally, the maximum
+        number of requests in flight. Takes effect on the next request made
+        after the current pool is closed with ``close``.
+
+        :param pool_maxsize: The maximum number of connections to keep alive.
+        :type pool_maxsize: int
+        :param max_concurrency: The maximum number of requests in flight.
+        :type max_concurrency: int
+        """
+        self._pool_maxsize = pool_maxsize
+        if max_concurrency is not None:
+            self._max_concurrency = max_concurrency
+            self._semaphore = None
+
+    async def close(self):
+        """Closes all of the connections in the connection pool. The pool
+        will reconnect on the next request.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _open_session(self):
+        if self._session is None or self._session.closed:
+            self._session = create_async_session(self._pool_maxsize)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    async def _request(self, url, as_response_object = False, headers = None):
+        self._open_session()
+        async with self._semaphore:
+            headers = self._user_agent_to_d if headers is None else headers
+            return await async_request_from_api(url, headers,
+                                                self._session,
+                                                as_response_object = as_response_object,
+                                                cache = self._cache,
+                                                rate_limiter = self._rate_limiter,
+                                                decoder = self._decoder)
+
+    async def _get(self, url, set_data_for):
+        return await self._single_flight.do(canonical_url(url),
+                                            lambda: self._fetch(url, set_data_for))
+
+    async def _fetch(self, url, set_data_for):
+        if self._revalidation is None:
+            return set_data_for(await self._request(url))
+
+        headers = dict(self._user_agent_to_d,
+                       **self._revalidation.conditional_headers(url))
+        response = await self._request(url, headers = headers)
+        previous = self._revalidation.get(url) if response[0] is None else None
+        if response[0] is None and previous is None:
+            response = await self._request(url)
+        return self._set_revalidated(url, response, previous, set_data_for)
+
+    async def _update_snapshot(self):
+        if not self._snapshot.is_stale():
+            return None
+        response = await self._single_flight.do('snapshot:' + ACTIVE_ALERTS_URL,
+                                                lambda: self._request(ACTIVE_ALERTS_URL))
+        return None if self._snapshot.update(response) else response
+
+    async def _stream_alerts(self, url):
+        # The semaphore is only held while the request is made, not while
+        # the body is being read.
+        self._open_session()
+        async with self._semaphore:
+            response = await async_stream_from_api(url, self._user_agent_to_d,
+                                                   self._session,
+                                                   rate_limiter = self._rate_limiter,
+                                                   decoder = self._decoder)
+        return _alerts_from_stream(response)
+
+    async def warm(self, points):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.warm`. The points are
+        requested concurrently.
+
+        :rtype: list[nwsapy.endpoints.point.Point]
+        """
+        return await asyncio.gather(*[self.get_point(lat, lon)
+                                      for lat, lon in points])
+
+    async def make_request(self, url):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.make_request`.
+
+        :param url: The URL to make a request to the NWS API.
+        :type url: string
+        :return: A response object containing the request for the query. The
+            body has already been read.
+        :rtype: aiohttp.ClientResponse
+        """
+        self._check_user_agent()
+        return await self._request(url, as_response_object = True)
+
+    async def get_glossary(self):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_glossary`.
+
+        :rtype: nwsapy.endpoints.glossary.Glossary
+        """
+        self._check_user_agent()
+        url = 'https://api.weather.gov/glossary'
+        return await self._get(url, set_data.for_glossary)
+
+    async def get_point(self, lat, lon):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_point`.
+
+        :rtype: nwsapy.endpoints.point.Point
+        """
+        self._check_user_agent()
+        url = self._point_url(lat, lon)
+        point = self._cached_point(lat, lon)
+        if point is None:
+            point = await self._get(url, set_data.for_point)
+            self._add_cached_point(lat, lon, point)
+        return point
+
+    async def get_points(self, coords, max_concurrency = 10, as_df = False):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_points`.
+
+        :rtype: list[nwsapy.endpoints.point.Point or RequestError] or pandas.DataFrame
+        """
+        keys, unique_keys = _point_keys(coords)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get(key):
+            async with semaphore:
+                try:
+                    return _result_or_error(await self.get_point(*key))
+                except Exception as err:
+                    return _result_or_error(err)
+
+        points = await asyncio.gather(*[get(key) for key in unique_keys])
+        return _points_result(keys, dict(zip(unique_keys, points)), as_df)
+
+    async def ping_server(self):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.ping_server`.
+
+        :rtype: nwsapy.endpoints.server_ping.ServerPing
+        """
+        self._check_user_agent()
+        url = 'https://api.weather.gov'
+        return await self._get(url, set_data.for_server_ping)
+
+    async def get_active_alerts(self, stream = False, **kwargs):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_active_alerts`.
+        Takes the same keyword arguments. With ``stream = True``, returns an
+        asynchronous generator of the alerts (``async for alert in ...``).
+
+        :rtype: nwsapy.endpoints.alerts.ActiveAlerts
+        """
+        self._check_user_agent()
+        url = self._alerts_url(kwargs)
+        if stream:
+            return await self._stream_alerts(url)
+        return await self._get(url, set_data.for_active_alerts)
+
+    def watch_active_alerts(self, interval = 30, **kwargs):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.watch_active_alerts`.
+        Returns an asynchronous generator (``async for change in ...``), so
+        it isn't awaited.
+
+        :rtype: async_generator
+        """
+        self._check_user_agent()
+        url = self._alerts_url(kwargs)
+        return self._watch(url, interval)
+
+    async def _watch(self, url, interval):
+        watcher = AlertWatcher()
+        etag = None
+        while True:
+            headers = dict(self._user_agent_to_d)
+            if etag is not None:
+                headers['If-None-Match'] = etag
+            try:
+                values, response_headers = await self._request(url, headers = headers)
+            except Exception as err:
+                yield _result_or_error(err)
+            else:
+                # values is None if nothing changed (304 Not Modified).
+                if values is not None and set_data.nws_api_gave_error(values):
+                    yield RequestError((values, response_headers))
+                elif values is not None:
+                    etag = response_headers.get('ETag')
+                    for change in watcher.diff(values['features']):
+                        yield change
+            await asyncio.sleep(interval)
+
+    async def get_alerts(self, stream = False, **kwargs):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_alerts`. Takes
+        the same keyword arguments. With ``stream = True``, returns an
+        asynchronous generator of the alerts (``async for alert in ...``).
+
+        :rtype: nwsapy.endpoints.alerts.ActiveAlerts
+        """
+        self._check_user_agent()
+        url = self._alerts_url(kwargs, is_active_alerts = False)
+        if stream:
+            return await self._stream_alerts(url)
+        return await self._get(url, set_data.for_active_alerts)
+
+    def iter_alerts(self, max_alerts = None, since = None, **kwargs):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.iter_alerts`. Returns
+        an asynchronous generator (``async for alert in ...``, not awaited); the
+        next page is requested in a task while the current one is being used.
+
+        :rtype: async_generator
+        """
+        self._check_user_agent()
+        url = self._alerts_url(kwargs, is_active_alerts = False)
+        return self._iter_alert_pages(url, max_alerts, _as_utc(since))
+
+    async def _iter_alert_pages(self, url, max_alerts, since):
+        count = 0
+        page = asyncio.ensure_future(self._get(url, set_data.for_alerts))
+        try:
+            while page is not None:
+                alerts = await page
+                remaining = None if max_alerts is None else max_alerts - count
+                alerts_to_give, carry_on = _page_of_alerts(alerts, since, remaining)
+
+                page = None
+                if carry_on and alerts.next_url != url:
+                    url = alerts.next_url
+                    page = asyncio.ensure_future(self._get(url, set_data.for_alerts))
+
+                for alert in alerts_to_give:
+                    yield alert
+                count += len(alerts_to_give)
+        finally:
+            if page is not None:
+                page.cancel()
+
+    async def get_alert_by_id(self, id):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_alert_by_id`.
+
+        :rtype: nwsapy.endpoints.alerts.AlertById
+        """
+        self._check_user_agent()
+        url = f'https://api.weather.gov/alerts/{id}'
+        return await self._get(url, set_data.for_alert_by_id)
+
+    async def get_alert_by_area(self, area):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_alert_by_area`.
+
+        :rtype: nwsapy.endpoints.alerts.AlertByArea
+        """
+        self._check_user_agent()
+        if self._snapshot is not None:
+            area = self._area(area)
+            error = await self._update_snapshot()
+            return set_data.for_alert_by_area(error or self._snapshot.by_area(area))
+
+        url = self._alert_by_area_url(area)
+        return await self._get(url, set_data.for_alert_by_area)
+
+    async def get_alert_by_zone(self, zone):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_alert_by_zone`.
+
+        :rtype: nwsapy.endpoints.alerts.AlertByZone
+        """
+        self._check_user_agent()
+        if self._snapshot is not None:
+            error = await self._update_snapshot()
+            return set_data.for_alert_by_zone(error or self._snapshot.by_zone(zone))
+
+        url = f"https://api.weather.gov/alerts/active/zone/{zone}"
+        return await self._get(url, set_data.for_alert_by_zone)
+
+    async def get_alert_by_marine_region(self, marine_region):
+        """Asynchronous version of
+        :meth:`nwsapy.NWSAPy.get_alert_by_marine_region`.
+
+        :rtype: nwsapy.endpoints.alerts.AlertByMarineRegion
+        """
+        self._check_user_agent()
+        if self._snapshot is not None:
+            marine_region = DataValidationChecker().check_if_valid_marine_region(marine_region)
+            error = await self._update_snapshot()
+            return set_data.for_alert_by_marine_region(
+                error or self._snapshot.by_marine_region(marine_region))
+
+        url = self._alert_by_marine_region_url(marine_region)
+        return await self._get(url, set_data.for_alert_by_marine_region)
+
+    async def get_alert_count(self):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_alert_count`.
+
+        :rtype: nwsapy.endpoints.alerts.AlertCount
+        """
+        self._check_user_agent()
+        if self._snapshot is not None:
+            error = await self._update_snapshot()
+            return set_data.for_alert_count(error or self._snapshot.count())
+
+        url = "https://api.weather.gov/alerts/active/count"
+        return await self._get(url, set_data.for_alert_count)
+
+    async def get_alert_types(self):
+        """Asynchronous version of :meth:`nwsapy.NWSAPy.get_alert_types`.
+
+        :rtype: nwsapy.endpoints.alerts.AlertByType
+        """
+        self._check_user_agent()
+        url = 'https://api.weather.gov/alerts/types'
+        return await self._get(url, set_data.for_alert_type)
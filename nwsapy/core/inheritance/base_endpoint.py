@@ -27,6 +27,10 @@ from nwsapy.core.inheritance.iterator import BaseIterator
 class BaseEndpoint(BaseIterator):
     
     has_any_request_errors = False
+
+    # True when the API said the data hasn't changed since the last request
+    # (304 Not Modified) and this object was reused instead of rebuilt.
+    revalidated = False
     
     def __init__(self):
         super().__init__()
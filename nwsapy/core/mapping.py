@@ -246,4 +246,12 @@ colors = {'911 Telephone Outage': {'hex': 'C0C0C0', 'rgb': '192 192 192'},
           'Winter Storm Warning': {'hex': 'FF69B4', 'rgb': '255 105 180'},
           'Winter Storm Watch': {'hex': '4682B4', 'rgb': '70 130 180'},
           'Winter Weather Advisory': {'hex': '7B68EE', 'rgb': '123 104 238'}
-          }
\ No newline at end of file
+          }
+# The marine areas (the first 2 letters of their zone IDs) in each marine region.
+marine_region_areas = {'AL': ['PK'],
+                       'AT': ['AM', 'AN'],
+                       'GL': ['LC', 'LE', 'LH', 'LM', 'LO', 'LS', 'SL'],
+                       'GM': ['GM'],
+                       'PA': ['PZ'],
+                       'PI': ['PH', 'PM', 'PS']
+                       }
@@ -4,18 +4,78 @@
 #   Base endpoint
 #   All endpoints associated with /path/to/endpoint
 
+import sys
+from bisect import bisect_left
 import shapely
-from shapely.geometry import Point
-from datetime import datetime
-from collections import OrderedDict
-from warnings import warn
+from shapely.geometry import Point, box, shape
+from shapely.strtree import STRtree
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 import pytz
 import numpy as np
 
 from nwsapy.core.inheritance.base_endpoint import BaseEndpoint
+from nwsapy.services.validation import DataValidationChecker
+
+# The times of an alert. Each one has a local time (i.e. ``sent``) and a UTC
+# time (i.e. ``sent_utc``) attribute.
+ALERT_TIMES = ('sent', 'effective', 'onset', 'expires', 'ends')
+
+# The properties of an alert, in the order the API gives them. Each one (other
+# than the times) is stored in a slot of the same name.
+ALERT_PROPERTIES = ('@id', '@type', 'id', 'areaDesc', 'geocode', 'affectedZones',
+                    'references', 'sent', 'effective', 'onset', 'expires', 'ends',
+                    'status', 'messageType', 'category', 'severity', 'certainty',
+                    'urgency', 'event', 'sender', 'senderName', 'headline',
+                    'description', 'instruction', 'response', 'parameters')
+_PROPERTY_SLOTS = tuple(p for p in ALERT_PROPERTIES
+                        if p.isidentifier() and p not in ALERT_TIMES)
+_SLOTTED = frozenset(_PROPERTY_SLOTS)
+
+# Properties with a handful of possible values. These are interned so that
+# every alert shares one copy of i.e. "Severe Thunderstorm Warning".
+_INTERNED = frozenset(('status', 'messageType', 'category', 'severity',
+                       'certainty', 'urgency', 'event', 'sender', 'senderName',
+                       'response'))
+
+def _time_attribute(name):
+    # A property for one of the times, converted on first access.
+    return property(lambda self: self._time_d[name])
+
+# Times that are missing when the alert doesn't expire (or end), so they're
+# later than any other time.
+_OPEN_ENDED = frozenset(('expires', 'ends'))
+
+def _is_before(alert, other, time):
+    # Whether a UTC time of `alert` is before that of `other`. Other missing
+    # times can't be compared, so they're neither before nor after.
+    mine, theirs = getattr(alert, time + '_utc'), getattr(other, time + '_utc')
+    if mine is None or theirs is None:
+        return time in _OPEN_ENDED and mine is not None and theirs is None
+    return mine < theirs
+
+def _memoized(func):
+    # Like functools.cached_property (which needs a __dict__), but memoized in
+    # a slot named _<name>_memo, which is None until it's computed.
+    slot = f'_{func.__name__.lstrip("_")}_memo'
+
+    def getter(self):
+        value = getattr(self, slot)
+        if value is None:
+            value = func(self)
+            setattr(self, slot, value)
+        return value
+
+    getter.__doc__ = func.__doc__
+    return property(getter)
 
 class IndividualAlert:
+    # Each property is stored once, in a slot. There's no __dict__, so renamed
+    # attributes (i.e. affected_zones) are properties rather than copies.
+    __slots__ = _PROPERTY_SLOTS + (
+        '_times', '_geometry', '_extra', '_geometry_d_memo', '_time_d_memo',
+        '_affected_zones_memo', '_area_desc_memo', '_d_memo', '_series_memo')
+
     def __init__(self, alert_list):
         # These need to get updated, tjhey're not parameters - they're attributes.ß
         """Individual alert class, holds properties describing each individual 
@@ -51,34 +111,113 @@ class IndividualAlert:
         severity: The severity level of the alert. Type: str
         status: The status level of the alert. Type: str
         urgency: The urgency level of the alert. Type: str
+
+        The geometry (``points``, ``polygon``), the times, ``series`` and
+        ``to_dict`` are only built the first time they're used, since most
+        of the time only a few attributes of an alert are read.
         """
-        alert_d = alert_list['properties'] # prep to set all attributes
+        properties = alert_list['properties']
+        self._geometry = alert_list['geometry']
+        self._times = tuple(properties[time] for time in ALERT_TIMES)
+
+        # set the attributes for the class. Anything the API sends that there
+        # isn't a slot for (i.e. @id) goes into _extra.
+        extra = {}
+        for k, v in properties.items():
+            if k in _SLOTTED:
+                setattr(self, k, sys.intern(v) if k in _INTERNED and v else v)
+            elif k not in ALERT_TIMES:
+                extra[k] = v
+        self._extra = extra
 
-        # set all attributes, starting with geometry.
-        geom_d = self._format_geometry(alert_list['geometry'])
-        alert_d.update(geom_d)
+        self._geometry_d_memo = self._time_d_memo = self._d_memo = None
+        self._affected_zones_memo = self._area_desc_memo = self._series_memo = None
 
-        # set all times
-        times = {'sent': alert_d['sent'], 'effective': alert_d['effective'],
-                 'onset': alert_d['onset'], 'expires': alert_d['expires'], 
-                 'ends': alert_d['ends']}
-        time_d = self._set_times(times)
-        alert_d.update(time_d)
+    def __getattr__(self, name):
+        # Only called when there's no slot/property by that name: properties
+        # without a slot (i.e. getattr(alert, '@id')).
+        if name.startswith('__'):
+            raise AttributeError(name)
+        try:
+            return object.__getattribute__(self, '_extra')[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(f"'IndividualAlert' object has no attribute '{name}'")
 
+    # Attributes renamed from camelCase.
+    @property
+    def message_type(self):
+        return self.messageType
+
+    @property
+    def sender_name(self):
+        return self.senderName
+
+    @_memoized
+    def affected_zones(self):
         # fix the affected zones so it's only the zoneID.
-        alert_d['affected_zones'] = [zone.split("/")[-1] for zone in alert_d['affectedZones']]
-        alert_d['area_desc'] = alert_d['areaDesc'].split(";")
-        alert_d['message_type'] = alert_d['messageType']
-        alert_d['sender_name'] = alert_d['senderName']
+        return [zone.split("/")[-1] for zone in self.affectedZones]
 
-        # set the attributes for the class.
-        for k, v in alert_d.items():
-            setattr(self, k, v)
+    @_memoized
+    def area_desc(self):
+        return self.areaDesc.split(";")
 
-        # used for to_dict(). __dict__ doesn't get class variables.
-        self._d = alert_d
-        
-        self._series = pd.Series(data = self._d)
+    @_memoized
+    def _geometry_d(self):
+        return self._format_geometry(self._geometry)
+
+    @property
+    def points(self):
+        return self._geometry_d['points']
+
+    @property
+    def polygon(self):
+        return self._geometry_d['polygon']
+
+    @_memoized
+    def _time_d(self):
+        return self._set_times(dict(zip(ALERT_TIMES, self._times)))
+
+    sent = _time_attribute('sent')
+    sent_utc = _time_attribute('sent_utc')
+    effective = _time_attribute('effective')
+    effective_utc = _time_attribute('effective_utc')
+    onset = _time_attribute('onset')
+    onset_utc = _time_attribute('onset_utc')
+    expires = _time_attribute('expires')
+    expires_utc = _time_attribute('expires_utc')
+    ends = _time_attribute('ends')
+    ends_utc = _time_attribute('ends_utc')
+
+    @_memoized
+    def _d(self):
+        # used for to_dict(). Same order as the response, with the geometry,
+        # the UTC times and the renamed attributes added on.
+        alert_d = {}
+        for k in ALERT_PROPERTIES:
+            if k in ALERT_TIMES:
+                alert_d[k] = self._time_d[k]
+            elif k in _SLOTTED:
+                if hasattr(self, k):
+                    alert_d[k] = getattr(self, k)
+            elif k in self._extra:
+                alert_d[k] = self._extra[k]
+        for k, v in self._extra.items():
+            alert_d.setdefault(k, v)
+        alert_d.update(self._geometry_d)
+        alert_d.update(self._time_d)
+        alert_d['affected_zones'] = self.affected_zones
+        alert_d['area_desc'] = self.area_desc
+        alert_d['message_type'] = self.message_type
+        alert_d['sender_name'] = self.sender_name
+        return alert_d
+
+    @_memoized
+    def series(self):
+        return pd.Series(data = self._d)
+
+    @property
+    def _series(self):
+        return self.series
 
     def _format_geometry(self, geometries):
         
@@ -92,7 +231,7 @@ class IndividualAlert:
                 points = []
                 polygons = []
                 for polygon in geometries['coordinates']:
-                    polygon_points = [Point(x[0], x[0]) for x in polygon[0]]
+                    polygon_points = [Point(x[0], x[1]) for x in polygon[0]]
                     points.append(polygon_points)
                     polygons.append(shapely.geometry.Polygon(polygon_points))
 
@@ -146,17 +285,17 @@ class IndividualAlert:
         :return: True if the alert was sent before ``other``.
         :rtype: bool
         """
-        return self.sent_utc > other.sent_utc
+        return _is_before(self, other, 'sent')
 
     def sent_after(self, other):
         """Method to compare sent times. All times are compared in UTC.
 
         :param other: Another individual alert object.
         :type other: alerts.IndividualAlert
-        :return: True if the alert was after before ``other``.
+        :return: True if the alert was sent after ``other``.
         :rtype: bool
         """
-        return self.sent_utc < other.sent_utc
+        return _is_before(other, self, 'sent')
 
     def effective_before(self, other):
         """Method to compare effective times. All times are compared in UTC.
@@ -166,7 +305,7 @@ class IndividualAlert:
         :return: True if the alert was effective before ``other``.
         :rtype: bool
         """
-        return self.effective_utc > other.effective_utc
+        return _is_before(self, other, 'effective')
 
     def effective_after(self, other):
         """Method to compare effective times. All times are compared in UTC.
@@ -176,7 +315,7 @@ class IndividualAlert:
         :return: True if the alert was effective after ``other``.
         :rtype: bool
         """
-        return self.effective_utc < other.effective_utc
+        return _is_before(other, self, 'effective')
 
     def onset_before(self, other):
         """Method to compare onset times. All times are compared in UTC.
@@ -186,7 +325,7 @@ class IndividualAlert:
         :return: True if the alert was onset before ``other``.
         :rtype: bool
         """
-        return self.onset_utc > other.onset_utc
+        return _is_before(self, other, 'onset')
 
     def onset_after(self, other):
         """Method to compare onset times. All times are compared in UTC.
@@ -196,53 +335,830 @@ class IndividualAlert:
         :return: True if the alert was onset after ``other``.
         :rtype: bool
         """
-        return self.onset_utc < other.onset_utc
+        return _is_before(other, self, 'onset')
 
     def expires_before(self, other):
-        """Method to compare expire times. All times are compared in UTC.
+        """Method to compare expire times. All times are compared in UTC. An alert
+        without an expiry time is taken to never expire.
 
         :param other: Another individual alert object.
         :type other: alerts.IndividualAlert
         :return: True if the alert expires before ``other``.
         :rtype: bool
         """
-        return self.expires_utc > other.expires_utc
+        return _is_before(self, other, 'expires')
 
     def expires_after(self, other):
-        """Method to compare expire times. All times are compared in UTC.
+        """Method to compare expire times. All times are compared in UTC. An alert
+        without an expiry time is taken to never expire.
 
         :param other: Another individual alert object.
         :type other: alerts.IndividualAlert
-        :return: True if the alert expires before ``other``.
+        :return: True if the alert expires after ``other``.
         :rtype: bool
         """
-        return self.expires_utc < other.expires_utc
+        return _is_before(other, self, 'expires')
 
     def ends_before(self, other):
-        """Method to compare end times. All times are compared in UTC.
+        """Method to compare end times. All times are compared in UTC. An alert
+        without an end time is taken to never end.
 
         :param other: Another individual alert object.
         :type other: alerts.IndividualAlert
         :return: True if the alert ends before ``other``.
         :rtype: bool
         """
-        return self.ends_utc > other.ends_utc
+        return _is_before(self, other, 'ends')
 
     def ends_after(self, other):
-        """Method to compare end times. All times are compared in UTC.
+        """Method to compare end times. All times are compared in UTC. An alert
+        without an end time is taken to never end.
 
         :param other: Another individual alert object.
         :type other: alerts.IndividualAlert
         :return: True if the alert ends after ``other``.
         :rtype: bool
         """
-        return self.ends_utc < other.ends_utc
+        return _is_before(other, self, 'ends')
+
+# Properties stored as categoricals in an AlertTable, they only have a handful
+# of possible values.
+CATEGORICAL_PROPERTIES = ('status', 'messageType', 'category', 'severity',
+                          'certainty', 'urgency', 'event', 'sender',
+                          'senderName', 'response')
+
+# Properties with an order to their values, from the lowest to the highest
+# (i.e. sorting by ``-severity`` puts Extreme alerts first).
+ORDINAL_PROPERTIES = {
+    'severity': ('Unknown', 'Minor', 'Moderate', 'Severe', 'Extreme'),
+    'urgency': ('Unknown', 'Past', 'Future', 'Expected', 'Immediate'),
+    'certainty': ('Unknown', 'Unlikely', 'Possible', 'Likely', 'Observed'),
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo = timezone.utc)
+
+# The layout of the times the API sends, i.e. 2022-05-01T19:14:00-05:00.
+_ISO_LENGTH = 25
+
+def _parse_times_slowly(values):
+    # One value at a time, for times that aren't in the API's usual layout
+    # (i.e. with fractions of a second or a Z).
+    utc = np.full(len(values), np.datetime64('NaT'), dtype = 'datetime64[ns]')
+    offsets = np.zeros(len(values), dtype = np.int16)
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        time = datetime.fromisoformat(value)
+        if time.tzinfo is None:
+            time = time.replace(tzinfo = timezone.utc)
+        utc[i] = (time - _EPOCH) // timedelta(microseconds = 1) * 1000
+        offsets[i] = time.utcoffset() // timedelta(minutes = 1)
+    return utc, offsets
+
+def _parse_times(values):
+    # ISO 8601 strings (or None) to UTC datetime64[ns] and the UTC offset of
+    # each one, in minutes. All of the values are parsed at once by numpy:
+    # the first 19 characters are the local time, the last 6 the offset.
+    missing = np.fromiter((value is None for value in values), dtype = bool,
+                          count = len(values))
+    strings = [value or '1970-01-01T00:00:00+00:00' for value in values]
+    lengths = np.fromiter(map(len, strings), dtype = np.int64, count = len(strings))
+    if not (lengths == _ISO_LENGTH).all():
+        return _parse_times_slowly(values)
+
+    # the characters of each string, as unicode code points.
+    characters = np.array(strings, dtype = f'U{_ISO_LENGTH}') \
+        .view(np.uint32).reshape(len(strings), _ISO_LENGTH)
+    sign = characters[:, 19]
+    if not (np.isin(sign, (ord('+'), ord('-'))) & (characters[:, 22] == ord(':'))).all():
+        return _parse_times_slowly(values)
+
+    digits = characters.astype(np.int16) - ord('0')
+    offsets = (digits[:, 20] * 10 + digits[:, 21]) * 60 + digits[:, 23] * 10 + digits[:, 24]
+    offsets = np.where(sign == ord('-'), -offsets, offsets).astype(np.int16)
+
+    local = np.ascontiguousarray(characters[:, :19]).view('U19')[:, 0] \
+        .astype('datetime64[s]')
+    utc = (local - offsets.astype('timedelta64[m]')).astype('datetime64[ns]')
+    utc[missing] = np.datetime64('NaT')
+    offsets[missing] = 0
+    return utc, offsets
+
+def _object_array(values):
+    # np.array would turn lists of lists into a 2D array.
+    array = np.empty(len(values), dtype = object)
+    array[:] = values
+    return array
+
+class AlertTable:
+    """The alerts of a response, stored as one typed array per property
+    rather than one object per alert:
+
+    - the times are UTC ``datetime64[ns]`` arrays, named with ``_utc``
+      (i.e. ``sent_utc``). ``NaT`` if the alert doesn't have that time.
+    - ``event``, ``severity``, ``urgency``, ``status`` (and the other
+      properties with a handful of values) are ``pandas.Categorical``.
+    - the text (and lists/dictionaries, i.e. ``geocode``) are object arrays.
+
+    Indexing or iterating over the table gives :class:`AlertRow` objects,
+    which behave like :class:`IndividualAlert` objects.
+
+    :param features: The ``features`` of an alerts response.
+    :type features: list[dict]
+    :ivar columns: The arrays, by property name.
+    :ivar geometry: The GeoJSON geometry of each alert (or None).
+    """
+
+    def __init__(self, features):
+        properties = [feature['properties'] for feature in features]
+        names = list(ALERT_PROPERTIES)
+        for props in properties:
+            for k in props:
+                if k not in names:
+                    names.append(k)
+
+        self.columns = {}
+        self._offsets = {}
+        self._categories = {}
+        for name in names:
+            values = [props.get(name) for props in properties]
+            if name in ALERT_TIMES:
+                utc, offsets = _parse_times(values)
+                self.columns[name + '_utc'] = utc
+                self._offsets[name] = offsets
+            elif name in CATEGORICAL_PROPERTIES:
+                column = pd.Categorical(values)
+                self.columns[name] = column
+                self._categories[name] = _object_array(list(column.categories))
+            else:
+                self.columns[name] = _object_array(values)
+
+        self.geometry = _object_array([feature.get('geometry') for feature in features])
+        self._rows = [None] * len(features)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        row = self._rows[index]
+        if row is None:
+            row = self._rows[index] = AlertRow(self, index % len(self))
+        return row
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def value(self, name, index):
+        """Returns the value of a property for one alert.
+
+        :param name: The name of the property (i.e. ``event``).
+        :type name: str
+        :param index: The index of the alert.
+        :type index: int
+        :raises KeyError: If there's no column with that name.
+        """
+        column = self.columns[name]
+        if name in self._categories:
+            code = column.codes[index]
+            return None if code < 0 else self._categories[name][code]
+        return column[index]
+
+    def feature(self, index):
+        """Returns one alert as the GeoJSON feature it was parsed from (the
+        times are written back in ISO 8601, in their local time).
+
+        :param index: The index of the alert.
+        :type index: int
+        :rtype: dict
+        """
+        time_d = self.times(index)
+        properties = {}
+        for name in self.columns:
+            if name.endswith('_utc') and name[:-len('_utc')] in ALERT_TIMES:
+                local = time_d[name[:-len('_utc')]]
+                properties[name[:-len('_utc')]] = None if local is None else local.isoformat()
+            else:
+                properties[name] = self.value(name, index)
+        return {'id': properties.get('@id'), 'type': 'Feature',
+                'geometry': self.geometry[index], 'properties': properties}
+
+    def times(self, index):
+        """Returns the local and UTC times of one alert, as ``datetime``
+        objects. The local times are only made here, when they're needed.
+
+        :param index: The index of the alert.
+        :type index: int
+        :rtype: dict
+        """
+        time_d = {}
+        for time in ALERT_TIMES:
+            utc = self.columns[time + '_utc'][index]
+            if np.isnat(utc):
+                time_d[time] = time_d[time + '_utc'] = None
+                continue
+            utc = _EPOCH.astimezone(pytz.utc) + \
+                timedelta(microseconds = int(utc.astype('int64')) // 1000)
+            offset = timezone(timedelta(minutes = int(self._offsets[time][index])))
+            time_d[time] = utc.astimezone(offset)
+            time_d[time + '_utc'] = utc
+        return time_d
+
+    def local_times(self, name):
+        """Returns one of the times of every alert in its local time, as
+        ``datetime`` objects (None where it's missing).
+
+        :param name: The name of the time (i.e. ``sent``).
+        :type name: str
+        :rtype: numpy.ndarray
+        """
+        utc = pd.DatetimeIndex(self.columns[name + '_utc']).tz_localize('UTC')
+        offsets = self._offsets[name]
+        local = np.full(len(self), None, dtype = object)
+        missing = np.asarray(utc.isna())
+        # one conversion per UTC offset, rather than one per alert.
+        for offset in np.unique(offsets[~missing]):
+            rows = np.flatnonzero((offsets == offset) & ~missing)
+            tz = timezone(timedelta(minutes = int(offset)))
+            local[rows] = list(utc[rows].tz_convert(tz).to_pydatetime())
+        return local
+
+    def to_df(self, derived = True):
+        """Returns the alerts in a pandas dataframe, one column per property
+        (alphabetized). The arrays are used as they are, so this doesn't copy
+        the data.
+
+        The columns are the same as those of ``IndividualAlert.to_dict()``:
+        the properties, the local (i.e. ``sent``) and UTC (``sent_utc``)
+        times, and the derived ``points``, ``polygon``, ``affected_zones``,
+        ``area_desc``, ``message_type`` and ``sender_name``.
+
+        :param derived: Whether to include the local times and the derived
+            columns. They're built alert by alert, so leaving them out is a
+            lot quicker.
+        :type derived: bool
+        :return: Dataframe of the values of the alerts.
+        :rtype: pandas.DataFrame
+        """
+        data = {}
+        for name, column in self.columns.items():
+            if name.endswith('_utc'):
+                column = pd.DatetimeIndex(column).tz_localize('UTC')
+            data[name] = column
+
+        if derived:
+            for name in ALERT_TIMES:
+                if name + '_utc' in self.columns:
+                    data[name] = self.local_times(name)
+            geometry = [row._geometry_d for row in self]
+            data['points'] = _object_array([g['points'] for g in geometry])
+            data['polygon'] = _object_array([g['polygon'] for g in geometry])
+            if 'affectedZones' in self.columns:
+                data['affected_zones'] = _object_array(
+                    [[zone.split("/")[-1] for zone in zones] if zones is not None else None
+                     for zones in self.columns['affectedZones']])
+            if 'areaDesc' in self.columns:
+                data['area_desc'] = _object_array(
+                    [None if area is None else area.split(";") for area in self.columns['areaDesc']])
+            for name, alias in (('messageType', 'message_type'), ('senderName', 'sender_name')):
+                if name in self.columns:
+                    data[alias] = self.columns[name]
+
+        return pd.DataFrame({name: data[name] for name in sorted(data)}, copy = False)
+
+class AlertRow(IndividualAlert):
+    """A view of one alert in an :class:`AlertTable`. It has the same
+    attributes and methods as :class:`IndividualAlert`, read from the table's
+    columns when they're accessed. Copying or pickling it gives an
+    :class:`IndividualAlert`.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+        self._geometry_d_memo = self._time_d_memo = self._d_memo = None
+        self._affected_zones_memo = self._area_desc_memo = self._series_memo = None
+
+    def __reduce__(self):
+        # Copied and pickled as a standalone IndividualAlert, rather than with
+        # the whole table.
+        return (IndividualAlert, (self._table.feature(self._index),))
+
+    def __getattr__(self, name):
+        # The slots of IndividualAlert aren't set, so properties end up here.
+        if name.startswith('__') or name in ('_table', '_index'):
+            raise AttributeError(name)
+        try:
+            return self._table.value(name, self._index)
+        except KeyError:
+            raise AttributeError(f"'AlertRow' object has no attribute '{name}'")
+
+    @property
+    def _geometry(self):
+        return self._table.geometry[self._index]
+
+    @property
+    def _extra(self):
+        return {name: self._table.value(name, self._index)
+                for name in self._table.columns
+                if name not in _SLOTTED and not name.endswith('_utc')}
+
+    @_memoized
+    def _time_d(self):
+        return self._table.times(self._index)
+
+# The bounds used for missing start and end times in the time index.
+_TIME_MIN = np.iinfo(np.int64).min
+_TIME_MAX = np.iinfo(np.int64).max
+
+def _first_time(*columns, missing):
+    # The first of the times that isn't missing, as nanoseconds since the
+    # epoch (or `missing` if they're all missing).
+    times = np.full(len(columns[0]), missing, dtype = np.int64)
+    unset = np.ones(len(times), dtype = bool)
+    for column in columns:
+        found = unset & ~np.isnat(column)
+        times[found] = column[found].astype(np.int64)
+        unset &= ~found
+    return times
+
+def _to_ns(time):
+    # A time (datetime, pandas.Timestamp or numpy.datetime64, UTC if it has no
+    # timezone) as nanoseconds since the epoch. None is now.
+    if time is None:
+        return pd.Timestamp.now(tz = 'UTC').value
+    time = pd.Timestamp(time)
+    if time.tzinfo is None:
+        time = time.tz_localize('UTC')
+    return time.value
 
 class BaseAlert(BaseEndpoint):
+
+    # The indexes below are built the first time they're needed and kept
+    # until the values are set again (or ``invalidate`` is called).
+
+    # The spatial index: the STRtree over the alerts with a geometry, and the
+    # index of the alert of each geometry.
+    _tree = None
+    _tree_alerts = None
+
+    # The zone index: the alerts in each zone, and the zone IDs sorted (for
+    # prefix lookups).
+    _zones = None
+    _zone_ids = None
+
+    # The time index: the start/end of each alert and its expiry (as
+    # nanoseconds since the epoch), each with the order that sorts it.
+    _times = None
+
+    # The arrays to sort by, by property name.
+    _sort_values = None
+
+    _values = None
     
     def __init__(self):
         super(BaseEndpoint, self).__init__()
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+        self.invalidate()
+
+    def invalidate(self):
+        """Drops the indexes used by the queries (``alerts_at``, ``by_zone``,
+        ``active_at``, ``sort_by``, ...), so they're built again the next time
+        they're needed. This is done when ``values`` is set, but not when a
+        list of alerts is changed in place (i.e. ``alerts.values.append(...)``),
+        so call it after doing that.
+        """
+        self._tree = self._tree_alerts = None
+        self._zones = self._zone_ids = None
+        self._times = None
+        self._sort_values = None
+
+    def _spatial_index(self):
+        if isinstance(self.values, dict):  # an error, there's no alerts.
+            return None, None
+
+        if self._tree is None:
+            if isinstance(self.values, AlertTable):
+                geometries = self.values.geometry
+            else:
+                geometries = [alert._geometry for alert in self.values]
+            indices = [i for i, geometry in enumerate(geometries) if geometry is not None]
+            self._tree = STRtree([shape(geometries[i]) for i in indices])
+            self._tree_alerts = np.array(indices, dtype = np.int64)
+        return self._tree, self._tree_alerts
+
+    def _query(self, geometry, predicate):
+        tree, tree_alerts = self._spatial_index()
+        if tree is None:
+            return []
+        found = np.sort(tree_alerts[tree.query(geometry, predicate = predicate)])
+        return [self.values[i] for i in found]
+
+    def alerts_at(self, lat, lon):
+        """Returns the alerts whose polygon covers a location (including its
+        edge). Alerts without a polygon (i.e. zone based alerts) are never
+        returned.
+
+        The polygons are put in a spatial index (an R-tree) the first time
+        this, ``alerts_intersecting`` or ``alerts_within_bbox`` is called,
+        so each lookup only checks the polygons near the location. If a list
+        of alerts is changed in place, call ``invalidate`` afterwards.
+
+        :param lat: The latitude of the location.
+        :type lat: float
+        :param lon: The longitude of the location.
+        :type lon: float
+        :return: The alerts, in the same order as the collection.
+        :rtype: list[IndividualAlert]
+        """
+        return self._query(Point(lon, lat), 'intersects')
+
+    def alerts_at_points(self, lats, lons, chunk_size = 100000):
+        """Finds which alerts cover each of many locations at once, i.e. to
+        check a set of assets against the alerts. Locations outside of the
+        bounding box of all of the alerts are dropped first, then the rest
+        are checked in chunks against the spatial index (see ``alerts_at``)
+        with vectorized geometry predicates.
+
+        The result is sparse: one pair of indices for each location inside
+        an alert. For example, to get the alerts covering location ``i``::
+
+            point_index, alert_index = alerts.alerts_at_points(lats, lons)
+            alerts_for_i = [alerts[j] for j in alert_index[point_index == i]]
+
+        :param lats: The latitudes of the locations.
+        :type lats: numpy.ndarray or list[float]
+        :param lons: The longitudes of the locations.
+        :type lons: numpy.ndarray or list[float]
+        :param chunk_size: The number of locations to check at a time. Limits
+            the memory used for the point geometries.
+        :type chunk_size: int
+        :return: The index of the location and the index of the alert (in
+            this collection) for each match, sorted by location then alert.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        lats = np.asarray(lats, dtype = np.float64)
+        lons = np.asarray(lons, dtype = np.float64)
+        tree, tree_alerts = self._spatial_index()
+        if tree is None or len(tree_alerts) == 0:
+            empty = np.empty(0, dtype = np.int64)
+            return empty, empty
+
+        # only the locations inside the bounds of all of the alerts can match.
+        min_lon, min_lat, max_lon, max_lat = shapely.total_bounds(tree.geometries)
+        candidates = np.flatnonzero((lats >= min_lat) & (lats <= max_lat) &
+                                    (lons >= min_lon) & (lons <= max_lon))
+
+        point_index, alert_index = [], []
+        for start in range(0, len(candidates), chunk_size):
+            chunk = candidates[start:start + chunk_size]
+            points = shapely.points(lons[chunk], lats[chunk])
+            found_points, found_geometries = tree.query(points, predicate = 'intersects')
+            point_index.append(chunk[found_points])
+            alert_index.append(tree_alerts[found_geometries])
+
+        if not point_index:
+            empty = np.empty(0, dtype = np.int64)
+            return empty, empty
+        point_index = np.concatenate(point_index)
+        alert_index = np.concatenate(alert_index)
+        order = np.lexsort((alert_index, point_index))
+        return point_index[order], alert_index[order]
+
+    def alerts_intersecting(self, geometry):
+        """Returns the alerts whose polygon intersects a geometry.
+
+        :param geometry: The geometry, with longitude as x and latitude as y.
+        :type geometry: shapely.geometry.base.BaseGeometry
+        :return: The alerts, in the same order as the collection.
+        :rtype: list[IndividualAlert]
+        """
+        return self._query(geometry, 'intersects')
+
+    def alerts_within_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        """Returns the alerts whose polygon lies entirely within a bounding
+        box. For alerts that are only partly in it, use
+        ``alerts_intersecting(shapely.geometry.box(...))``.
+
+        :param min_lat: The southern edge of the box.
+        :type min_lat: float
+        :param min_lon: The western edge of the box.
+        :type min_lon: float
+        :param max_lat: The northern edge of the box.
+        :type max_lat: float
+        :param max_lon: The eastern edge of the box.
+        :type max_lon: float
+        :return: The alerts, in the same order as the collection.
+        :rtype: list[IndividualAlert]
+        """
+        return self._query(box(min_lon, min_lat, max_lon, max_lat), 'contains')
         
+    def _zone_index(self):
+        if isinstance(self.values, dict):  # an error, there's no alerts.
+            return {}, []
+
+        if self._zones is None:
+            if isinstance(self.values, AlertTable):
+                zone_lists = self.values.columns.get('affectedZones', ())
+            else:
+                zone_lists = [getattr(alert, 'affectedZones', None) for alert in self.values]
+
+            zones = {}
+            for index, zone_list in enumerate(zone_lists):
+                for zone in zone_list or ():
+                    zones.setdefault(zone.split("/")[-1], []).append(index)
+            self._zones = zones
+            self._zone_ids = sorted(zones)
+        return self._zones, self._zone_ids
+
+    def _matching_zones(self, zone):
+        # The zone IDs matching a zone, or a prefix ending in "*".
+        zones, zone_ids = self._zone_index()
+        zone = zone.upper()
+        if not zone.endswith('*'):
+            return [zone] if zone in zones else []
+        prefix = zone[:-1]
+        start = bisect_left(zone_ids, prefix)
+        end = bisect_left(zone_ids, prefix + '\U0010ffff', start)
+        return zone_ids[start:end]
+
+    def by_zone(self, zone_or_list):
+        """Returns the alerts in one or more NWS zones or counties, without
+        making any requests. A zone ending in ``*`` matches every zone
+        starting with it, i.e. ``FLZ*`` for all of Florida's public zones.
+
+        The alerts are put in an index by zone the first time this or
+        ``zones_with_alerts`` is called, so each lookup only touches the
+        alerts in that zone.
+
+        :param zone_or_list: A 6 character NWS zone or county (ex: FLZ050),
+            a prefix ending in ``*``, or a list of them.
+        :type zone_or_list: str or list[str]
+        :return: The alerts in any of the zones, in the same order as the
+            collection. Alerts in more than one of the zones are only
+            returned once.
+        :rtype: list[IndividualAlert]
+        """
+        if isinstance(zone_or_list, str):
+            zone_or_list = [zone_or_list]
+
+        zones, _ = self._zone_index()
+        found = set()
+        for zone in zone_or_list:
+            for zone_id in self._matching_zones(zone):
+                found.update(zones[zone_id])
+        return [self.values[i] for i in sorted(found)]
+
+    def zones_with_alerts(self, prefix = None):
+        """Returns the NWS zones and counties that have at least one alert.
+
+        :param prefix: Only return the zones starting with this (ex: FLZ).
+            A trailing ``*`` is allowed.
+        :type prefix: str
+        :return: The zone IDs, sorted.
+        :rtype: list[str]
+        """
+        _, zone_ids = self._zone_index()
+        if prefix is None:
+            return list(zone_ids)
+        return self._matching_zones(prefix.rstrip('*') + '*')
+
+    def _time_column(self, name):
+        # A UTC time of every alert as datetime64[ns] (NaT if it's missing).
+        if isinstance(self.values, AlertTable):
+            return self.values.columns[name + '_utc']
+        return np.array([np.datetime64('NaT') if time is None
+                         else np.datetime64(time.replace(tzinfo = None), 'ns')
+                         for time in (getattr(alert, name + '_utc') for alert in self.values)],
+                        dtype = 'datetime64[ns]')
+
+    def _time_index(self):
+        if isinstance(self.values, dict):  # an error, there's no alerts.
+            return None
+
+        if self._times is None:
+            columns = {name: self._time_column(name) for name in
+                       ('sent', 'effective', 'onset', 'expires', 'ends')}
+            # An alert is in effect from `effective` (or its onset, or when it
+            # was sent) until it `ends` (or expires). Without either, it
+            # doesn't end.
+            start = _first_time(columns['effective'], columns['onset'], columns['sent'],
+                                missing = _TIME_MIN)
+            end = _first_time(columns['ends'], columns['expires'], missing = _TIME_MAX)
+            expires = _first_time(columns['expires'], missing = _TIME_MAX)
+
+            self._times = {}
+            for name, times in (('start', start), ('end', end), ('expires', expires)):
+                order = np.argsort(times, kind = 'stable')
+                self._times[name] = (times, order, times[order])
+        return self._times
+
+    def _alerts_for(self, indices):
+        # The alerts at the indices, in the same order as the collection.
+        return [self.values[i] for i in np.sort(indices)]
+
+    def _in_effect(self, after, before):
+        # The indices of the alerts that start before `before` (inclusive if
+        # it's a point in time) and end after `after`. Two binary searches
+        # give the alerts that started and the alerts that haven't ended; the
+        # smaller of the two is then checked against the other time (in one
+        # numpy operation). That check is O(min(started, not ended)), which can
+        # be most of the alerts even if few match, i.e. a time in the middle
+        # of many long alerts that don't overlap it.
+        times = self._time_index()
+        if times is None:
+            return np.empty(0, dtype = np.int64)
+        starts, start_order, sorted_starts = times['start']
+        ends, end_order, sorted_ends = times['end']
+
+        side = 'right' if after == before else 'left'
+        started = start_order[:np.searchsorted(sorted_starts, before, side)]
+        not_ended = end_order[np.searchsorted(sorted_ends, after, 'right'):]
+        if len(started) <= len(not_ended):
+            return started[ends[started] > after]
+        if side == 'right':
+            return not_ended[starts[not_ended] <= before]
+        return not_ended[starts[not_ended] < before]
+
+    def active_at(self, time = None):
+        """Returns the alerts in effect at a time: from when they're
+        ``effective`` (or their ``onset``/``sent`` time, if it's missing) up
+        to when they ``ends`` (or ``expires``, if there's no end time). Alerts
+        with neither are taken to never end.
+
+        The times are put in sorted arrays the first time this,
+        ``overlapping`` or ``expiring_within`` is called. A query is then a
+        binary search for the alerts that started and for those that haven't
+        ended, and a vectorized check of whichever of the two has fewer
+        alerts: O(log n + min(started, not ended)). That's usually far fewer
+        than all of the alerts, but can be close to all of them even when few
+        are in effect.
+
+        :param time: The time. Times without a timezone are taken to be UTC.
+            Defaults to now.
+        :type time: datetime.datetime
+        :return: The alerts, in the same order as the collection.
+        :rtype: list[IndividualAlert]
+        """
+        time = _to_ns(time)
+        return self._alerts_for(self._in_effect(time, time))
+
+    def overlapping(self, start, end):
+        """Returns the alerts in effect at any time between two times. See
+        ``active_at`` for when an alert is in effect, and for the cost.
+
+        :param start: The start of the window. Times without a timezone are
+            taken to be UTC.
+        :type start: datetime.datetime
+        :param end: The end of the window (not included).
+        :type end: datetime.datetime
+        :return: The alerts, in the same order as the collection.
+        :rtype: list[IndividualAlert]
+        """
+        start, end = _to_ns(start), _to_ns(end)
+        if end <= start:
+            return []
+        return self._alerts_for(self._in_effect(start, end))
+
+    def expiring_within(self, delta, now = None):
+        """Returns the alerts that expire (``expires``) within a time from
+        now. Alerts that already expired, or without an expiry time, aren't
+        returned. This is a range of the sorted expiry times, so only the
+        alerts returned are looked at.
+
+        :param delta: How long from now, i.e. ``timedelta(hours = 1)``.
+        :type delta: datetime.timedelta
+        :param now: The time to count from. Times without a timezone are taken
+            to be UTC. Defaults to now.
+        :type now: datetime.datetime
+        :return: The alerts, in the same order as the collection.
+        :rtype: list[IndividualAlert]
+        """
+        times = self._time_index()
+        if times is None:
+            return []
+        now = _to_ns(now)
+        _, order, sorted_expires = times['expires']
+        first = np.searchsorted(sorted_expires, now, 'left')
+        last = np.searchsorted(sorted_expires, now + pd.Timedelta(delta).value, 'right')
+        return self._alerts_for(order[first:last])
+
+    def _property_values(self, name):
+        # The values of a property for every alert, as an array (or a
+        # pandas.Categorical).
+        if isinstance(self.values, AlertTable):
+            if name not in self.values.columns:
+                raise KeyError(f'The alerts have no property `{name}`.')
+            return self.values.columns[name]
+        return _object_array([getattr(alert, name, None) for alert in self.values])
+
+    def _sort_value(self, name):
+        # The values of a property as int64 that sort the same way, and which
+        # of them are missing. Built once per property.
+        if self._sort_values is None:
+            self._sort_values = {}
+
+        if name not in self._sort_values:
+            if name in ALERT_TIMES:
+                times = self._time_column(name)
+                missing = np.isnat(times)
+                values = np.where(missing, 0, times.astype(np.int64))
+            elif name in ORDINAL_PROPERTIES:
+                ranks = {value: rank for rank, value in enumerate(ORDINAL_PROPERTIES[name])}
+                codes, uniques = pd.factorize(self._property_values(name))
+                uniques = np.array([ranks.get(value, -1) for value in uniques] + [-1])
+                values = uniques[codes].astype(np.int64)
+                missing = values < 0
+            else:
+                codes, _ = pd.factorize(self._property_values(name), sort = True)
+                values = codes.astype(np.int64)
+                missing = values < 0
+            self._sort_values[name] = (values, missing)
+        return self._sort_values[name]
+
+    def _sort_array(self, key):
+        # The array to sort by for a key: smaller values come first, and
+        # missing values come last either way.
+        name = key.lstrip('-')
+        if name.endswith('_utc'):
+            name = name[:-len('_utc')]
+        values, missing = self._sort_value(name)
+        if key.startswith('-'):
+            values = -values
+        return np.where(missing, np.iinfo(np.int64).max, values)
+
+    def sort_by(self, *keys):
+        """Returns the alerts sorted by one or more properties, i.e.
+        ``sort_by('-severity', 'expires')`` for the most severe first, then
+        the ones expiring soonest. A key starting with ``-`` sorts from the
+        highest to the lowest. Ties keep the order of the collection and
+        alerts missing a value come last.
+
+        Times (``sent``, ``expires``, ...) sort in time order, ``severity``,
+        ``urgency`` and ``certainty`` in the order of ``ORDINAL_PROPERTIES``,
+        and other properties (i.e. ``event``) alphabetically. The arrays that
+        are sorted are built once per property and kept, so sorting again is
+        cheap.
+
+        :param keys: The names of the properties (i.e. ``sent`` or
+            ``-severity``).
+        :type keys: str
+        :raises ValueError: If no keys are given.
+        :raises KeyError: If the alerts don't have a property.
+        :return: The same alert objects as the collection, in sorted order.
+        :rtype: list[IndividualAlert]
+        """
+        if not keys:
+            raise ValueError('At least one key to sort by is needed.')
+        if isinstance(self.values, dict):  # an error, there's no alerts.
+            return []
+
+        # lexsort sorts by the last array first, and keeps ties in order.
+        order = np.lexsort([self._sort_array(key) for key in reversed(keys)])
+        return [self.values[i] for i in order]
+
+    def top_k(self, key, k):
+        """Returns the ``k`` alerts with the highest value of a property,
+        highest first, i.e. ``top_k('severity', 10)`` for the 10 most severe
+        alerts. A key starting with ``-`` gives the lowest values instead.
+        See ``sort_by`` for how properties are ordered.
+
+        Only the ``k`` alerts are sorted, so this is quicker than sorting all
+        of the alerts when ``k`` is small.
+
+        :param key: The name of the property (i.e. ``sent``).
+        :type key: str
+        :param k: The number of alerts.
+        :type k: int
+        :raises KeyError: If the alerts don't have a property.
+        :return: The same alert objects as the collection, in order. Ties
+            keep the order of the collection.
+        :rtype: list[IndividualAlert]
+        """
+        if isinstance(self.values, dict) or k <= 0:
+            return []
+
+        # the highest first is the same as sorting by the opposite key.
+        values = self._sort_array(key[1:] if key.startswith('-') else '-' + key)
+        if k < len(values):
+            kth = np.partition(values, k - 1)[k - 1]
+            better = np.flatnonzero(values < kth)
+            ties = np.flatnonzero(values == kth)[:k - len(better)]
+            chosen = np.concatenate([better, ties])
+        else:
+            chosen = np.arange(len(values))
+        order = chosen[np.lexsort((chosen, values[chosen]))]
+        return [self.values[i] for i in order]
+
     def to_dict(self):
         """Returns the alerts in a dictionary format, where the keys are numbers
         which map to an individual alert.
@@ -262,9 +1178,16 @@ class BaseAlert(BaseEndpoint):
         
         return d
     
-    def to_df(self):
+    def to_df(self, derived = True):
         """Returns the values of the alerts in a pandas dataframe structure.
+        The columns are typed: the UTC times (i.e. ``sent_utc``) are
+        datetimes and properties such as ``event`` and ``severity`` are
+        categorical. See :meth:`AlertTable.to_df`.
 
+        :param derived: Whether to include the local times (i.e. ``sent``)
+            and the derived columns (``points``, ``polygon``, ...). Leaving
+            them out is a lot quicker.
+        :type derived: bool
         :return: Dataframe of the values of the alerts.
         :rtype: pandas.DataFrame
         """
@@ -272,21 +1195,7 @@ class BaseAlert(BaseEndpoint):
         if isinstance(self.values, dict):
             return pd.DataFrame(data = self.values)
         
-        # Performance issue: appending to a dataframe. This isn't ideal, so 
-        # solution to this is found here:
-        #   https://stackoverflow.com/questions/27929472/improve-row-append-performance-on-pandas-dataframes
-        # ... it's a lot faster, wow.
-        
-        d = OrderedDict()
-        
-        # self.values index is arbitrary.
-        for index, individual_alert in enumerate(self.values):
-            d[index] = individual_alert._d
-        
-        df = pd.DataFrame.from_dict(d).transpose()
-        df = df.reindex(sorted(df.columns), axis = 1) # alphabetize columns.
-        df = df.fillna(value = np.nan)
-        return df
+        return self.values.to_df(derived = derived)
 
 class ActiveAlerts(BaseAlert):
     
@@ -294,6 +1203,10 @@ class ActiveAlerts(BaseAlert):
         super(BaseAlert, self).__init__()
 
 class Alerts(BaseAlert):
+
+    # The URL of the next (older) page of alerts, from the API's pagination.
+    # None if this is the last page.
+    next_url = None
     
     def __init__(self):
         super(BaseAlert, self).__init__()
@@ -323,27 +1236,145 @@ class AlertByType(BaseEndpoint):
     def __init__(self):
         super(BaseEndpoint, self).__init__()
 
+def _is_error(values):
+    # The API gives back a problem (with a correlationId) on errors.
+    return isinstance(values, dict) and 'correlationId' in values
+
+def _checked_area(area):
+    # A valid area as its 2 letter abbreviation.
+    return DataValidationChecker().check_if_valid_area(area)
+
+def _checked_marine_region(region):
+    return DataValidationChecker().check_if_valid_marine_region(region)
+
 class AlertCount(BaseEndpoint):
+
+    # The codes of the areas, regions and zones, sorted (for prefix lookups).
+    # Kept until the values are set again (or ``invalidate`` is called).
+    _codes = None
+
+    _values = None
     
     def __init__(self):
         super(BaseEndpoint, self).__init__()
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+        self.invalidate()
+
+    def invalidate(self):
+        """Drops the sorted codes used by the filters, so they're sorted again
+        the next time they're needed. This is done when ``values`` is set,
+        but not when codes are added or removed in place (i.e.
+        ``count.values['zones']['TXZ211'] = 3``), so call it after doing that.
+        """
+        self._codes = None
     
     def to_dict(self):
         return self.values
 
-    # The dataframe method could get pretty interesting. There's a few different
-    # ways that it could be implemented, but for the sake of v1.0.0, this
-    # method is left out.
-    
-    # Figure out what these methods do in the original package.
+    def to_df(self):
+        """Returns the counts of the areas, marine regions and zones in a
+        pandas dataframe, one row per code: ``kind`` (categorical: ``area``,
+        ``region`` or ``zone``), ``code`` and ``count`` (integer).
+
+        :return: Dataframe of the counts.
+        :rtype: pandas.DataFrame
+        """
+        # if it's an error
+        if _is_error(self.values):
+            return pd.DataFrame(data = self.values, index = [0])
+
+        kinds, codes, counts = [], [], []
+        for kind, key in (('area', 'areas'), ('region', 'regions'), ('zone', 'zones')):
+            kind_counts = self.values.get(key) or {}
+            kinds.extend([kind] * len(kind_counts))
+            codes.extend(kind_counts)
+            counts.extend(kind_counts.values())
+
+        return pd.DataFrame({
+            'kind': pd.Categorical(kinds, categories = ['area', 'region', 'zone']),
+            'code': pd.array(codes, dtype = 'string'),
+            'count': np.array(counts, dtype = np.int64),
+        })
+
+    def _count_index(self, key):
+        # The counts for `key` (i.e. "zones") and their codes sorted. Built
+        # the first time they're needed.
+        if self._codes is None:
+            self._codes = {}
+        counts = self.values.get(key) or {}
+        if key not in self._codes:
+            self._codes[key] = sorted(counts)
+        return counts, self._codes[key]
+
+    def _filter_by(self, key, codes, check = None):
+        # The counts of the codes (0 if there's none). A code ending in "*"
+        # gives the count of every code starting with it.
+        if _is_error(self.values):
+            return {}
+        if isinstance(codes, str):
+            codes = [codes]
+
+        counts, sorted_codes = self._count_index(key)
+        filtered = {}
+        for code in codes:
+            code = code.upper()
+            if code.endswith('*'):
+                prefix = code[:-1]
+                start = bisect_left(sorted_codes, prefix)
+                end = bisect_left(sorted_codes, prefix + '\U0010ffff', start)
+                for match in sorted_codes[start:end]:
+                    filtered[match] = counts[match]
+                continue
+
+            if check is not None:
+                code = check(code)
+            filtered[code] = counts.get(code, 0)
+        return filtered
+
     def filter_zones(self, zone):
-        warn("This method has not been implemented yet.")
-        return {}
+        """Returns the number of active alerts in NWS zones or counties.
+
+        :param zone: A 6 character NWS zone or county (ex: TXZ211), a prefix
+            ending in ``*`` (ex: ``TXZ*`` for every Texas public zone), or a
+            list of them.
+        :type zone: str or list[str]
+        :return: The number of alerts by zone. Zones without alerts are 0,
+            prefixes give every zone with alerts that starts with them.
+        :rtype: dict
+        """
+        return self._filter_by('zones', zone)
 
     def filter_land_areas(self, area):
-        warn("This method has not been implemented yet.")
-        return {}
+        """Returns the number of active alerts in areas (states or marine
+        areas).
+
+        :param area: 2 letter state abbreviation or full state name (i.e.
+            Florida), a prefix ending in ``*``, or a list of them.
+            :ref:`Data Validation Table <Area DVT>`
+        :type area: str or list[str]
+        :raises DataValidationError: If an area isn't valid.
+        :return: The number of alerts by area (2 letter abbreviation). Areas
+            without alerts are 0.
+        :rtype: dict
+        """
+        return self._filter_by('areas', area, _checked_area)
     
     def filter_marine_regions(self, region):
-        warn("This method has not been implemented yet.")
-        return {}
\ No newline at end of file
+        """Returns the number of active alerts in marine regions.
+
+        :param region: A 2 letter marine region, a prefix ending in ``*``,
+            or a list of them. :ref:`Data Validation Table <Marine DVT>`
+        :type region: str or list[str]
+        :raises DataValidationError: If a marine region isn't valid.
+        :return: The number of alerts by marine region. Regions without
+            alerts are 0.
+        :rtype: dict
+        """
+        return self._filter_by('regions', region, _checked_marine_region)
@@ -20,16 +20,95 @@ as "parameters" in this documentation in the respective method.
 
 # needed: https://api.weather.gov/openapi.json
 
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
 from warnings import warn
 
-from nwsapy.core.mapping import full_state_to_two_letter_abbreviation
+import pandas as pd
+
+from nwsapy.core.inheritance.request_error import RequestError
 
 from .services.validation import DataValidationChecker
 from .services.url_constructor import construct_alert_url
-from .services.request import request_from_api
+from .services.request import request_from_api, create_session, stream_from_api
+from .services.json_decoder import default_decoder, get_decoder
+from .services.cache import DiskCache, ResponseCache, RevalidationCache, canonical_url
+from .services.point_cache import PointCache
+from .services.alert_watch import AlertWatcher
+from .services.snapshot import ACTIVE_ALERTS_URL, AlertSnapshot
+from .services.rate_limit import RateLimiter
+from .services.single_flight import SingleFlight
 import nwsapy.services.set_data as set_data
 
 
+def _point_keys(coords):
+    # The API only resolves points to 4 decimal places, so coordinates that
+    # round to the same key are the same point and only requested once. Bad
+    # values are left as they are, they fail validation in get_point.
+    def rounded(value):
+        return round(value, 4) if isinstance(value, (int, float)) else value
+
+    keys = [(rounded(lat), rounded(lon)) for lat, lon in coords]
+    return keys, list(dict.fromkeys(keys))
+
+def _result_or_error(point):
+    # Objects the API gave an error for (i.e. points) become RequestErrors,
+    # same as failures.
+    if isinstance(point, Exception):
+        values = {'title': type(point).__name__, 'detail': str(point),
+                  'status': None, 'correlationId': None}
+        return RequestError((values, {}))
+    if point.has_any_request_errors:
+        return RequestError((point.values, point.response_headers))
+    return point
+
+def _as_utc(time):
+    # Times without a timezone are taken to be UTC.
+    if time is not None and time.tzinfo is None:
+        time = time.replace(tzinfo = timezone.utc)
+    return time
+
+def _page_of_alerts(alerts, since, remaining):
+    # The alerts of a page to give back, and if the pages should carry on.
+    # Alerts come newest first, so the first one sent before `since` ends it.
+    if alerts.has_any_request_errors:
+        return [RequestError((alerts.values, alerts.response_headers))], False
+
+    page = []
+    for alert in alerts:
+        if since is not None and alert.sent_utc is not None and alert.sent_utc < since:
+            return page, False
+        if remaining is not None and len(page) >= remaining:
+            return page, False
+        page.append(alert)
+    carry_on = remaining is None or len(page) < remaining
+    return page, carry_on and len(page) > 0 and alerts.next_url is not None
+
+def _points_result(keys, points_by_key, as_df):
+    # A point given more than once is only requested once, the repeats get a
+    # copy of it so they don't share state with each other.
+    points = []
+    seen = set()
+    for key in keys:
+        point = points_by_key[key]
+        points.append(copy.copy(point) if key in seen else point)
+        seen.add(key)
+    if not as_df:
+        return points
+
+    rows = []
+    for (lat, lon), point in zip(keys, points):
+        row = {'latitude': lat, 'longitude': lon}
+        if isinstance(point, RequestError):
+            row['error'] = getattr(point, 'detail', None)
+        else:
+            row.update(point.values)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
 
 class NWSAPy:
     _app = None
@@ -37,6 +116,26 @@ class NWSAPy:
     _user_agent = None
     _user_agent_to_d = {'User-Agent': _user_agent}
 
+    def __init__(self, pool_connections = 10, pool_maxsize = 10):
+        # Every get_* method goes through this session, so connections to the
+        # API are kept alive and reused between requests.
+        self._session = create_session(pool_connections, pool_maxsize)
+        self._init_state()
+
+        # Identical requests made at the same time (i.e. from many threads)
+        # share a single request to the API.
+        self._single_flight = SingleFlight()
+
+    def _init_state(self):
+        # The settings shared by NWSAPy and AsyncNWSAPy, all off by default.
+        # New settings go here so that both classes get them.
+        self._cache = None
+        self._revalidation = None
+        self._rate_limiter = None
+        self._point_cache = None
+        self._decoder = default_decoder
+        self._snapshot = None
+
     def _check_user_agent(self):
         if self._user_agent is None:
             msg = "Be sure to set the user agent before calling any " \
@@ -69,6 +168,320 @@ class NWSAPy:
         self._user_agent = f"({self._app}, {contact})"
         self._user_agent_to_d = dict({'User-Agent': self._user_agent})
     
+    def set_connection_pool(self, pool_connections = 10, pool_maxsize = 10):
+        """Sets the size of the connection pool used to make requests to the
+        API. Connections in the pool are kept alive and reused, so repeated
+        ``get_*`` calls don't need to reconnect to the API each time.
+
+        :param pool_connections: The number of host connection pools to cache.
+        :type pool_connections: int
+        :param pool_maxsize: The maximum number of connections to keep alive
+            per host. Increase this if making requests from many threads.
+        :type pool_maxsize: int
+        """
+        self._session.close()
+        self._session = create_session(pool_connections, pool_maxsize)
+
+    def set_rate_limit(self, rate = 5, burst = 10, max_retries = 3,
+                       backoff = 0.5):
+        """Limits the rate of requests made to the API, and retries requests
+        that the API throttled (429 Too Many Requests/503 Service Unavailable).
+        Throttled requests are retried after the ``Retry-After`` time given by
+        the API or, if there isn't one, after a jittered exponential backoff.
+        While backing off, every other request waits too.
+
+        The limit is shared by all threads using this object.
+
+        :param rate: The maximum number of requests per second. None turns off
+            the rate limit and retries.
+        :type rate: float
+        :param burst: The number of requests that can be made at once before
+            being limited to ``rate``.
+        :type burst: int
+        :param max_retries: The number of times a throttled request is retried.
+        :type max_retries: int
+        :param backoff: The backoff before the first retry, in seconds. Doubles
+            with each retry.
+        :type backoff: float
+        """
+        if rate is None:
+            self._rate_limiter = None
+        else:
+            self._rate_limiter = RateLimiter(rate, burst, max_retries, backoff)
+
+    def set_point_cache(self, radius_km = 1.0):
+        """Turns on answering ``get_point`` from points already requested.
+        Every location in a forecast grid cell (about 2.5 km wide) has the same
+        metadata, so when a location is within ``radius_km`` of a point that
+        was already requested, that point is returned.
+
+        A location isn't answered from the cache if the requested points
+        within ``radius_km`` are in different grid cells, since it could be in
+        either one. A larger radius gives more hits, but more chances of
+        returning the neighbouring cell; use ``stats()`` to tune it.
+
+        .. note::
+            Attributes that depend on the exact location, such as the
+            distance/bearing to the nearest city and ``id``, are those of the
+            point that was requested.
+
+        :param radius_km: How close (in km) a requested point needs to be.
+            0 turns the point cache off.
+        :type radius_km: float
+        """
+        self._point_cache = PointCache(radius_km) if radius_km else None
+
+    def _cached_point(self, lat, lon):
+        if self._point_cache is None:
+            return None
+        return self._point_cache.get(lat, lon)
+
+    def _add_cached_point(self, lat, lon, point):
+        if self._point_cache is not None and not point.has_any_request_errors:
+            self._point_cache.add(lat, lon, point)
+
+    def set_cache(self, maxsize = 256, ttl = None):
+        """Turns on caching of responses. While a response is fresh, calling
+        the same ``get_*`` method with the same arguments won't make a request
+        to the API. How long a response is fresh for comes from the
+        ``Cache-Control``/``Expires`` headers the API sends, unless it's
+        overridden by ``ttl``.
+
+        .. code-block:: python
+
+            # keep points and the glossary for a day, never cache active alerts.
+            api_connector.set_cache(ttl = {'/points': 86400, '/glossary': 86400,
+                                           '/alerts/active': 0})
+
+        :param maxsize: The maximum number of responses to keep. The least
+            recently used response is dropped first. 0 turns caching off.
+        :type maxsize: int
+        :param ttl: Time to live overrides (in seconds) by endpoint path.
+        :type ttl: dict
+        """
+        self._cache = ResponseCache(maxsize, ttl) if maxsize > 0 else None
+
+    def set_disk_cache(self, path, ttl = None, max_bytes = 100 * 1024 ** 2):
+        """Turns on caching of responses in a SQLite database on disk, in
+        place of the in-memory cache (see ``set_cache``). Cached responses
+        survive restarts and are shared by all processes using the same file.
+
+        By default, points and the glossary are kept for a week, alert types
+        for a day and alerts aren't kept. Everything else is kept for as long
+        as the API says it's fresh.
+
+        With ``AsyncNWSAPy``, the database is read and written in a thread so
+        the event loop isn't blocked.
+
+        :param path: The path to the database file.
+        :type path: str
+        :param ttl: Time to live overrides (in seconds) by endpoint path.
+        :type ttl: dict
+        :param max_bytes: The maximum total size of the responses to keep. The
+            least recently used responses are removed first.
+        :type max_bytes: int
+        """
+        self._cache = DiskCache(path, ttl, max_bytes)
+
+    def warm(self, points):
+        """Requests a list of points so that they're in the cache (see
+        ``set_cache`` and ``set_disk_cache``) for later ``get_point`` calls.
+
+        :param points: Latitude/longitude pairs, i.e. ``[(33, -90), (35, -97)]``.
+        :type points: list[tuple]
+        :return: The point objects, in the same order as ``points``.
+        :rtype: list[nwsapy.endpoints.point.Point]
+        """
+        if self._cache is None:
+            warn("No cache has been set, so warming it has no effect. Call "
+                 "`set_cache` or `set_disk_cache` first.")
+        return [self.get_point(lat, lon) for lat, lon in points]
+
+    def clear_cache(self):
+        """Removes all cached responses."""
+        if self._cache is not None:
+            self._cache.clear()
+        if self._revalidation is not None:
+            self._revalidation.clear()
+
+    def set_revalidation(self, maxsize = 64):
+        """Turns on conditional requests. The ``ETag``/``Last-Modified`` of
+        each response is remembered along with the object that was returned,
+        and the next request for the same data asks the API if it has changed.
+        If it hasn't, the API doesn't send it again and the same object is
+        returned without being rebuilt. This is useful when polling, i.e.
+        calling ``get_active_alerts`` every few seconds.
+
+        The ``revalidated`` attribute of the returned object is True when the
+        data was reused. Each call gets its own object, so the flag of an
+        object returned earlier doesn't change.
+
+        :param maxsize: The maximum number of requests (URLs) to remember.
+            0 turns conditional requests off.
+        :type maxsize: int
+        """
+        self._revalidation = RevalidationCache(maxsize) if maxsize > 0 else None
+
+    def set_json_decoder(self, decoder = None):
+        """Sets the decoder used for the JSON bodies of responses. By default
+        the fastest one installed is used (``orjson``, then ``ujson``, then
+        the standard library's ``json``).
+
+        :param decoder: The name of the decoder (``'orjson'``, ``'ujson'`` or
+            ``'json'``), a function that takes the bytes of a body and returns
+            the decoded values, or None for the default.
+        :type decoder: str, callable or None
+        :raises ValueError: If the name isn't a known decoder.
+        :raises ImportError: If the decoder isn't installed.
+        """
+        self._decoder = get_decoder(decoder)
+
+    def set_snapshot(self, max_age = 60):
+        """Turns on snapshot mode. ``get_alert_by_area``, ``get_alert_by_zone``,
+        ``get_alert_by_marine_region`` and ``get_alert_count`` are answered
+        from one copy of the active alerts (``/alerts/active``), which is
+        requested at most once every ``max_age`` seconds, instead of making a
+        request each. They return the same objects as they do without it.
+
+        This is useful when asking about many areas or zones at once, i.e. for
+        a dashboard. Use ``stats()`` to see how many copies were requested.
+
+        .. note::
+            The alerts for an area are the alerts with a zone in it (zone IDs
+            start with the area, i.e. ``FLZ050`` is in ``FL``). The land and
+            marine counts are worked out the same way, so they can differ
+            slightly from what the API counts.
+
+        :param max_age: How long (in seconds) a copy of the active alerts is
+            used for. None or 0 turns snapshot mode off.
+        :type max_age: float
+        """
+        self._snapshot = AlertSnapshot(max_age) if max_age else None
+
+    def stats(self):
+        """Returns counters on how requests were handled, to help tune the
+        caches and connection pool.
+
+        - ``requests``: the number of ``get_*`` calls that were not coalesced.
+        - ``coalesced``: ``get_*`` calls that waited on an identical call
+          already in flight and shared its result, instead of making a request.
+        - ``cache_hits``/``cache_misses``: lookups in the response cache.
+        - ``retries``: requests retried after the API throttled them.
+        - ``point_cache_hits``/``point_cache_misses``: ``get_point`` calls
+          answered (or not) from nearby points, see ``set_point_cache``.
+        - ``snapshot_updates``: copies of the active alerts requested for
+          snapshot mode, see ``set_snapshot``.
+
+        :return: The counters.
+        :rtype: dict
+        """
+        return {
+            'requests': self._single_flight.calls,
+            'coalesced': self._single_flight.coalesced,
+            'cache_hits': self._cache.hits if self._cache is not None else 0,
+            'cache_misses': self._cache.misses if self._cache is not None else 0,
+            'retries': self._rate_limiter.retries if self._rate_limiter is not None else 0,
+            'point_cache_hits': self._point_cache.hits if self._point_cache is not None else 0,
+            'point_cache_misses': self._point_cache.misses if self._point_cache is not None else 0,
+            'snapshot_updates': self._snapshot.updates if self._snapshot is not None else 0,
+        }
+
+    def close(self):
+        """Closes all of the connections in the connection pool. The pool
+        will reconnect on the next request.
+        """
+        self._session.close()
+
+    def _request(self, url, as_response_object = False, headers = None):
+        # Single point where the get_* methods talk to the API.
+        headers = self._user_agent_to_d if headers is None else headers
+        return request_from_api(url, headers,
+                                as_response_object = as_response_object,
+                                session = self._session, cache = self._cache,
+                                rate_limiter = self._rate_limiter,
+                                decoder = self._decoder)
+
+    def _get(self, url, set_data_for):
+        # Requests the URL and sets the data using the set_data function.
+        # Callers asking for the same URL at the same time share the request,
+        # and each waiting caller gets its own copy of the object.
+        return self._single_flight.do(canonical_url(url),
+                                      lambda: self._fetch(url, set_data_for))
+
+    def _fetch(self, url, set_data_for):
+        if self._revalidation is None:
+            return set_data_for(self._request(url))
+
+        headers = dict(self._user_agent_to_d,
+                       **self._revalidation.conditional_headers(url))
+        response = self._request(url, headers = headers)
+        previous = self._revalidation.get(url) if response[0] is None else None
+        if response[0] is None and previous is None:
+            # Forgotten since the request was made; request it in full.
+            response = self._request(url)
+        return self._set_revalidated(url, response, previous, set_data_for)
+
+    def _set_revalidated(self, url, response, previous, set_data_for):
+        # Reuses the previous object if the API said it's not modified,
+        # otherwise sets the data and remembers the object for next time.
+        # The flag is set on a shallow copy, so the remembered object (and
+        # what earlier calls returned) isn't changed; the data is shared.
+        values, response_headers = response
+        if values is None:
+            reused = copy.copy(previous)
+            reused.revalidated = True
+            return reused
+
+        obj = set_data_for(response)
+        if not obj.has_any_request_errors:
+            self._revalidation.set(url, response_headers, obj)
+        return obj
+
+    def _update_snapshot(self):
+        # Requests a new copy of the active alerts for snapshot mode if it's
+        # stale. Returns the response if the API gave an error, else None.
+        if not self._snapshot.is_stale():
+            return None
+        response = self._single_flight.do('snapshot:' + ACTIVE_ALERTS_URL,
+                                          lambda: self._request(ACTIVE_ALERTS_URL))
+        return None if self._snapshot.update(response) else response
+
+    def _stream_alerts(self, url):
+        # Streamed responses skip the caches and aren't coalesced, every call
+        # reads its own response.
+        response = stream_from_api(url, self._user_agent_to_d,
+                                   session = self._session,
+                                   rate_limiter = self._rate_limiter,
+                                   decoder = self._decoder)
+        return set_data.for_alert_stream(response)
+
+    # The validation and URL construction for the get_* methods live here so
+    # that they're shared between NWSAPy and AsyncNWSAPy.
+    def _point_url(self, lat, lon):
+        dvt = DataValidationChecker()
+        dvt.check_lat_lon(lat, lon)
+        return f'https://api.weather.gov/points/{lat}%2C{lon}'
+
+    def _alerts_url(self, kwargs, is_active_alerts = True):
+        dvt = DataValidationChecker() # insantiate dvt
+        # validate the kwargs, and the limit for /alerts.
+        kwargs = dvt.check_active_alerts_dvt(kwargs, is_all_alerts = not is_active_alerts)
+        return construct_alert_url(kwargs, is_active_alerts = is_active_alerts)
+
+    def _area(self, area):
+        # validates it, and converts it to a 2 letter abbreviation in the
+        # event it's not one.
+        dvt = DataValidationChecker()
+        return dvt.check_if_valid_area(area)
+
+    def _alert_by_area_url(self, area):
+        return f'https://api.weather.gov/alerts/active/area/{self._area(area)}'
+
+    def _alert_by_marine_region_url(self, marine_region):
+        dvt = DataValidationChecker()
+        marine_region = dvt.check_if_valid_marine_region(marine_region)
+        return f"https://api.weather.gov/alerts/active/region/{marine_region}"
+
     def make_request(self, url):
         """Makes a request to the NWS API with a given URL. This method allows
         you to have full control over the data without the functionality
@@ -84,7 +497,7 @@ class NWSAPy:
         :rtype: request.Response
         """
         self._check_user_agent()
-        response = request_from_api(url, self._user_agent_to_d, as_response_object = True)
+        response = self._request(url, as_response_object = True)
     
         return response
     
@@ -108,11 +521,8 @@ class NWSAPy:
         # construct the URL (this case, hardcode it; it's static.)
         url = 'https://api.weather.gov/glossary'
         
-        # make the request
-        response = request_from_api(url, self._user_agent_to_d)
-        
-        # Set the data, return the nwsapy.endpoint.Glossary object.
-        glossary = set_data.for_glossary(response)
+        # make the request, set the data into the nwsapy.endpoint.Glossary object.
+        glossary = self._get(url, set_data.for_glossary)
       
         # return it.
         return glossary
@@ -123,27 +533,67 @@ class NWSAPy:
         
         | Endpoint: ``/points/{point}``  
         | Description: Returns metadata about a given latitude/longitude point.
+
+        If the point cache is on (see ``set_point_cache``), a nearby point
+        that was already requested may be returned instead.
                 
         :return: An object containing information from the `/point` endpoint.
         :rtype: nwsapy.endpoints.point.Point
         """
         self._check_user_agent()
         
-        # validate the data
-        dvt = DataValidationChecker()
-        dvt.check_lat_lon(lat, lon)
-        
-        # Construct the URL
-        url = f'https://api.weather.gov/points/{lat}%2C{lon}'
-        
-        # Make the request
-        response_tuple = request_from_api(url, self._user_agent_to_d)
+        # validate the data and construct the URL
+        url = self._point_url(lat, lon)
+
+        # A nearby point that's already resolved has the same metadata.
+        point = self._cached_point(lat, lon)
+        if point is not None:
+            return point
         
-        # Set the data
-        point = set_data.for_point(response_tuple)
+        # Make the request and set the data
+        point = self._get(url, set_data.for_point)
+        self._add_cached_point(lat, lon, point)
         
         return point
     
+    def get_points(self, coords, max_concurrency = 10, as_df = False):
+        """Gets the metadata of many latitude/longitude points at once. Points
+        are rounded to 4 decimal places (what the API resolves to), duplicates
+        are only requested once and the rest are requested concurrently.
+
+        Points that can't be retrieved (bad coordinates, API errors, connection
+        errors) don't raise; they're a
+        :class:`nwsapy.core.inheritance.request_error.RequestError` in place of
+        the point.
+
+        .. note::
+            Set the connection pool size (see ``set_connection_pool``) to at
+            least ``max_concurrency`` so all of the connections are reused.
+
+        :param coords: Latitude/longitude pairs, i.e. ``[(33, -90), (35, -97)]``.
+        :type coords: list[tuple]
+        :param max_concurrency: The maximum number of requests at a time.
+        :type max_concurrency: int
+        :param as_df: Return a single dataframe (one row per point, with
+            ``latitude``, ``longitude`` and ``error`` columns) instead of a list.
+        :type as_df: bool
+        :return: The points, in the same order as ``coords``.
+        :rtype: list[nwsapy.endpoints.point.Point or RequestError] or pandas.DataFrame
+        """
+        keys, unique_keys = _point_keys(coords)
+
+        def get(key):
+            try:
+                return _result_or_error(self.get_point(*key))
+            except Exception as err:
+                return _result_or_error(err)
+
+        with ThreadPoolExecutor(max_workers = max_concurrency) as pool:
+            points = pool.map(get, unique_keys)
+            points_by_key = dict(zip(unique_keys, points))
+
+        return _points_result(keys, points_by_key, as_df)
+
     def ping_server(self):
         """Pings the server for integrity and/or testing.
 
@@ -152,11 +602,10 @@ class NWSAPy:
         """
         self._check_user_agent()
         url = 'https://api.weather.gov'
-        response_tuple = request_from_api(url, self._user_agent_to_d)
-        ping = set_data.for_server_ping(response_tuple)
+        ping = self._get(url, set_data.for_server_ping)
         return ping
     
-    def get_active_alerts(self, **kwargs):
+    def get_active_alerts(self, stream = False, **kwargs):
         """Returns an active alerts object containing all active alerts. This
         object is comprised of :ref:`IndividualAlerts`.
         
@@ -197,19 +646,77 @@ class NWSAPy:
         :param zone: The NWS zone of the alert. Note this has no validation
             checks, so a 404 error can occur.
         :type zone: str or list[str]
+        :param stream: If True, returns a generator that yields each alert
+            (an ``IndividualAlert``) as soon as it's been downloaded, rather
+            than waiting for the whole response. Only one alert is held in
+            memory at a time. Streamed responses aren't cached. If the API
+            gives an error, the generator yields a single ``RequestError``.
+        :type stream: bool
         :return: An object containing information from the ``alerts/active``
             endpoint.
         :rtype: nwsapy.endpoints.alerts.ActiveAlert
         """
         self._check_user_agent() # header
-        dvt = DataValidationChecker() # insantiate dvt
-        dvt.check_active_alerts_dvt(kwargs) # validate the kwargs
-        url = construct_alert_url(kwargs) # construct url
-        response_tuple = request_from_api(url, self._user_agent_to_d) # get data
-        active_alerts = set_data.for_active_alerts(response_tuple) # get alert object
+        url = self._alerts_url(kwargs) # validate the kwargs, construct url
+        if stream:
+            return self._stream_alerts(url)
+        active_alerts = self._get(url, set_data.for_active_alerts) # get data, alert object
         return active_alerts # give back to user
 
-    def get_alerts(self, **kwargs):
+    def watch_active_alerts(self, interval = 30, **kwargs):
+        """Polls the active alerts every ``interval`` seconds and yields only
+        what changed since the last poll, as
+        :class:`nwsapy.services.alert_watch.AlertChange` objects:
+
+        - ``added``: a new alert, with the alert (``change.alert``).
+        - ``updated``: an alert with the same ID that was sent again or
+          changed, with the alert as it is now.
+        - ``removed``: an alert that's no longer active (expired or
+          cancelled). Only the ID is given.
+
+        The first poll gives every active alert as ``added``. Between polls,
+        only the sent time and a hash of each alert is kept, and alert
+        objects are only made for alerts that were added or updated. Polls
+        are conditional requests, so if nothing changed the API doesn't send
+        the alerts again. The generator doesn't end on its own; stop it with
+        ``break``::
+
+            for change in api.watch_active_alerts(60, area = 'FL'):
+                print(change.type, change.id)
+
+        Takes the same keyword arguments as ``get_active_alerts``.
+
+        :param interval: The number of seconds between polls.
+        :type interval: float
+        :return: A generator of changes. If a poll fails, it yields a
+            ``RequestError`` for that poll and carries on.
+        :rtype: generator
+        """
+        self._check_user_agent()
+        url = self._alerts_url(kwargs)
+        return self._watch(url, interval)
+
+    def _watch(self, url, interval):
+        watcher = AlertWatcher()
+        etag = None
+        while True:
+            headers = dict(self._user_agent_to_d)
+            if etag is not None:
+                headers['If-None-Match'] = etag
+            try:
+                values, response_headers = self._request(url, headers = headers)
+            except Exception as err:
+                yield _result_or_error(err)
+            else:
+                # values is None if nothing changed (304 Not Modified).
+                if values is not None and set_data.nws_api_gave_error(values):
+                    yield RequestError((values, response_headers))
+                elif values is not None:
+                    etag = response_headers.get('ETag')
+                    yield from watcher.diff(values['features'])
+            time.sleep(interval)
+
+    def get_alerts(self, stream = False, **kwargs):
         """Returns an alerts object with the previous 500 alerts. Note that
         this is the maximum value and also the default.
         
@@ -226,7 +733,7 @@ class NWSAPy:
             :ref:`Data Validation Table <Product DVT>`
         :type event: str or list[str]
         :param limit: The number of alerts to return at most. Will only retrieve
-            the first n alerts.
+            the first n alerts. At most 500.
         :type limit: int
         :param message_type: :ref:`Data Validation Table <Message Types DVT>`
         :type message_type: str or list[str]
@@ -250,6 +757,12 @@ class NWSAPy:
         :param zone: The NWS zone of the alert. Note this has no validation
             checks, so a 404 error can occur.
         :type zone: str or list[str]
+        :param stream: If True, returns a generator that yields each alert
+            (an ``IndividualAlert``) as soon as it's been downloaded, rather
+            than waiting for the whole response. Only one alert is held in
+            memory at a time. Streamed responses aren't cached. If the API
+            gives an error, the generator yields a single ``RequestError``.
+        :type stream: bool
         :return: An object containing information from the ``alerts/active``
             endpoint.
         :rtype: nwsapy.endpoints.alerts.ActiveAlert
@@ -260,13 +773,62 @@ class NWSAPy:
         #   maybe also put it in data validation table?
         
         self._check_user_agent() # header
-        dvt = DataValidationChecker() # insantiate dvt
-        dvt.check_active_alerts_dvt(kwargs) # validate the kwargs
-        url = construct_alert_url(kwargs, is_active_alerts = False) # construct url
-        response_tuple = request_from_api(url, self._user_agent_to_d) # get data
-        active_alerts = set_data.for_active_alerts(response_tuple) # get alert object
+        url = self._alerts_url(kwargs, is_active_alerts = False) # validate the kwargs, construct url
+        if stream:
+            return self._stream_alerts(url)
+        active_alerts = self._get(url, set_data.for_active_alerts) # get data, alert object
         return active_alerts # give back to user
 
+    def iter_alerts(self, max_alerts = None, since = None, **kwargs):
+        """Iterates over all alerts (not only the previous 500, see
+        ``get_alerts``), newest first, following the API's pagination. Pages
+        are only requested as they're needed, and while the alerts of one
+        page are being iterated over, the next page is requested in the
+        background.
+
+        Takes the same keyword arguments as ``get_alerts`` (``limit`` is the
+        number of alerts per page).
+
+        :param max_alerts: The maximum number of alerts to give back. If
+            None, carries on until the last page.
+        :type max_alerts: int
+        :param since: Stops at the first alert sent before this time. Times
+            without a timezone are taken to be UTC. If None, carries on until
+            the last page.
+        :type since: datetime.datetime
+        :return: A generator of alerts. If the API gives an error, it yields
+            a ``RequestError`` and stops.
+        :rtype: generator
+        """
+        self._check_user_agent()
+        url = self._alerts_url(kwargs, is_active_alerts = False)
+        return self._iter_alert_pages(url, max_alerts, _as_utc(since))
+
+    def _iter_alert_pages(self, url, max_alerts, since):
+        count = 0
+        pool = ThreadPoolExecutor(max_workers = 1)
+        page = pool.submit(self._get, url, set_data.for_alerts)
+        try:
+            while page is not None:
+                alerts = page.result()
+                remaining = None if max_alerts is None else max_alerts - count
+                alerts_to_give, carry_on = _page_of_alerts(alerts, since, remaining)
+
+                # get the next page while this one is being used.
+                page = None
+                if carry_on and alerts.next_url != url:
+                    url = alerts.next_url
+                    page = pool.submit(self._get, url, set_data.for_alerts)
+
+                for alert in alerts_to_give:
+                    yield alert
+                count += len(alerts_to_give)
+        finally:
+            # stopped early, the next page isn't needed.
+            if page is not None:
+                page.cancel()
+            pool.shutdown(wait = False)
+
     def get_alert_by_id(self, id):
         """Retrieves an alert by ID from the ``alerts/active/{id}`` endpoint.
         
@@ -281,8 +843,7 @@ class NWSAPy:
         
         self._check_user_agent()
         url = f'https://api.weather.gov/alerts/{id}'
-        response_tuple = request_from_api(url, self._user_agent_to_d)
-        alert_by_id = set_data.for_alert_by_id(response_tuple)
+        alert_by_id = self._get(url, set_data.for_alert_by_id)
         return alert_by_id
 
     def get_alert_by_area(self, area):
@@ -299,17 +860,13 @@ class NWSAPy:
         """
         
         self._check_user_agent()
-        dvt = DataValidationChecker()
-        dvt.check_if_valid_area(area)
-        
-        # in the event it's not a 2 letter abbreviation, convert it.
-        # Guarenteed to be in there, as data validation happened already.
-        if len(area) != 2:
-            area = full_state_to_two_letter_abbreviation(area)
-        
-        url = f'https://api.weather.gov/alerts/active/area/{area}'
-        response_tuple = request_from_api(url, self._user_agent_to_d)
-        alert_by_area = set_data.for_alert_by_area(response_tuple)
+        if self._snapshot is not None:
+            area = self._area(area)
+            error = self._update_snapshot()
+            return set_data.for_alert_by_area(error or self._snapshot.by_area(area))
+
+        url = self._alert_by_area_url(area)
+        alert_by_area = self._get(url, set_data.for_alert_by_area)
         return alert_by_area
 
     def get_alert_by_zone(self, zone):
@@ -326,11 +883,14 @@ class NWSAPy:
         """
         
         self._check_user_agent()
+        if self._snapshot is not None:
+            error = self._update_snapshot()
+            return set_data.for_alert_by_zone(error or self._snapshot.by_zone(zone))
+
         # There needs to be a data validation table for this. Something for someone
         # to contribute to.
         url = f"https://api.weather.gov/alerts/active/zone/{zone}"
-        response_tuple = request_from_api(url, self._user_agent_to_d)
-        alert_by_zone = set_data.for_alert_by_zone(response_tuple)
+        alert_by_zone = self._get(url, set_data.for_alert_by_zone)
         return alert_by_zone
     
     def get_alert_by_marine_region(self, marine_region):
@@ -347,13 +907,14 @@ class NWSAPy:
         """
         
         self._check_user_agent()
-        dvt = DataValidationChecker()
-        dvt.check_if_valid_marine_region(marine_region)
-        url = f"https://api.weather.gov/alerts/active/region/{marine_region}"
-        # TODO: add into core mapping the marine regions.
-        # TODO: Data validation check: lowercase to uppercase. validator doesn't handle.
-        response_tuple = request_from_api(url, self._user_agent_to_d)
-        alert = set_data.for_alert_by_marine_region(response_tuple)
+        if self._snapshot is not None:
+            marine_region = DataValidationChecker().check_if_valid_marine_region(marine_region)
+            error = self._update_snapshot()
+            return set_data.for_alert_by_marine_region(
+                error or self._snapshot.by_marine_region(marine_region))
+
+        url = self._alert_by_marine_region_url(marine_region)
+        alert = self._get(url, set_data.for_alert_by_marine_region)
         return alert
         
     def get_alert_count(self):
@@ -368,9 +929,12 @@ class NWSAPy:
         :rtype: nwsapy.endpoints.alerts.AlertCount
         """
         self._check_user_agent()
+        if self._snapshot is not None:
+            error = self._update_snapshot()
+            return set_data.for_alert_count(error or self._snapshot.count())
+
         url = "https://api.weather.gov/alerts/active/count"
-        response_tuple = request_from_api(url, self._user_agent_to_d)
-        alert_count = set_data.for_alert_count(response_tuple)
+        alert_count = self._get(url, set_data.for_alert_count)
         return alert_count
 
     def get_alert_types(self):
@@ -398,6 +962,5 @@ class NWSAPy:
         """
         self._check_user_agent()
         url = 'https://api.weather.gov/alerts/types'
-        response_tuple = request_from_api(url, self._user_agent_to_d)
-        types = set_data.for_alert_type(response_tuple)
+        types = self._get(url, set_data.for_alert_type)
         return types
\ No newline at end of file
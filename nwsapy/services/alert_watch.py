@@ -0,0 +1,98 @@
+"""Works out what changed between two polls of the active alerts, so that
+``NWSAPy.watch_active_alerts`` only hands back the alerts that were added,
+updated or removed.
+
+Only a small amount of state is kept per alert: its ``sent`` time (as
+seconds since the epoch) and an 8 byte hash of its content. Alert objects
+are only made for alerts that are new or changed.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+
+from ..endpoints.alerts import IndividualAlert
+
+
+class AlertChange:
+    """A change to the active alerts.
+
+    :ivar type: ``'added'``, ``'updated'`` or ``'removed'``.
+    :ivar id: The ID of the alert.
+    :ivar alert: The alert as it is now. None if it was removed (expired
+        or cancelled alerts drop out of the active alerts).
+    """
+
+    __slots__ = ('type', 'id', 'alert')
+
+    def __init__(self, type, id, alert = None):
+        self.type = type
+        self.id = id
+        self.alert = alert
+
+    def __repr__(self):
+        return f'AlertChange({self.type!r}, {self.id!r})'
+
+
+def _sent(properties):
+    # The sent time as seconds since the epoch, smaller than the string.
+    sent = properties.get('sent')
+    return None if sent is None else int(datetime.fromisoformat(sent).timestamp())
+
+
+# Serializes a feature with its keys sorted, so the same content always
+# gives the same bytes. orjson is a lot faster at it, if it's installed.
+try:
+    import orjson
+
+    def _serialize(feature):
+        return orjson.dumps(feature, option = orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _serialize(feature):
+        return json.dumps(feature, sort_keys = True, separators = (',', ':')).encode()
+
+
+def _content_hash(feature):
+    return hashlib.blake2b(_serialize(feature), digest_size = 8).digest()
+
+
+class AlertWatcher:
+    """Keeps the state of the active alerts between polls.
+
+    :ivar state: The ``(sent, content hash)`` of each alert, by ID.
+    """
+
+    def __init__(self):
+        self.state = {}
+
+    def diff(self, features):
+        """Compares the features of a poll with the previous poll, and
+        updates the state.
+
+        :param features: The ``features`` of an active alerts response.
+        :type features: list[dict]
+        :return: The changes, added and updated in the order of the
+            features, then removed.
+        :rtype: list[AlertChange]
+        """
+        changes = []
+        state = {}
+        for feature in features:
+            properties = feature['properties']
+            id = properties['id']
+            sent = _sent(properties)
+            content = _content_hash(feature)
+            state[id] = (sent, content)
+
+            previous = self.state.get(id)
+            if previous is None:
+                changes.append(AlertChange('added', id, IndividualAlert(feature)))
+            elif previous != (sent, content):
+                changes.append(AlertChange('updated', id, IndividualAlert(feature)))
+
+        for id in self.state:
+            if id not in state:
+                changes.append(AlertChange('removed', id))
+
+        self.state = state
+        return changes
@@ -0,0 +1,458 @@
+"""Caches responses from the NWS API so that repeated requests for the same
+URL don't go back to the network while the API says the data is still fresh.
+
+How long a response is fresh for is taken from the ``Cache-Control: max-age``
+or ``Expires`` headers that the API sends with every response. This can be
+overridden per endpoint, for example to keep ``/glossary`` for a day::
+
+    cache = ResponseCache(maxsize = 512, ttl = {'/glossary': 86400})
+
+Responses can also be kept on disk (see ``DiskCache``), so they survive a
+restart and are shared between processes.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+
+def canonical_url(url):
+    """Normalizes a URL so that equivalent requests map to the same cache key.
+    The scheme and host are lowercased, the path is unquoted (``%2C`` and
+    ``,`` are the same) and the query parameters are sorted.
+
+    :param url: The URL to normalize.
+    :type url: str
+    :return: The normalized URL.
+    :rtype: str
+    """
+    parts = urlsplit(url)
+    path = unquote(parts.path).rstrip('/') or '/'
+    query = '&'.join(f'{k}={v}' for k, v in sorted(parse_qsl(parts.query)))
+    key = f'{parts.scheme.lower()}://{parts.netloc.lower()}{path}'
+    if query:
+        key = f'{key}?{query}'
+    return key
+
+
+def ttl_from_headers(headers):
+    """Returns how many seconds a response is fresh for, according to its
+    ``Cache-Control`` and ``Expires`` headers. ``max-age`` wins over
+    ``Expires``, as per RFC 7234.
+
+    :param headers: The response headers.
+    :type headers: dict-like
+    :return: The number of seconds the response is fresh for (0 if it
+        shouldn't be cached).
+    :rtype: float
+    """
+    cache_control = headers.get('Cache-Control', '')
+    directives = {}
+    for directive in cache_control.split(','):
+        name, _, value = directive.strip().partition('=')
+        directives[name.lower()] = value.strip('"')
+
+    if 'no-store' in directives or 'no-cache' in directives:
+        return 0
+
+    # s-maxage is only for shared caches, this is a private one.
+    if 'max-age' in directives:
+        try:
+            max_age = int(directives['max-age'])
+        except ValueError:
+            return 0
+        # time the response already spent in an upstream cache.
+        age = headers.get('Age', '0')
+        return max(0, max_age - (int(age) if age.isdigit() else 0))
+
+    if 'Expires' in headers:
+        try:
+            expires = parsedate_to_datetime(headers['Expires'])
+            date = headers.get('Date')
+            now = parsedate_to_datetime(date).timestamp() if date else time.time()
+        except (TypeError, ValueError):
+            return 0  # "Expires: 0" and other invalid dates mean already expired.
+        return max(0, expires.timestamp() - now)
+
+    return 0
+
+
+class BaseCache:
+    """What ``ResponseCache`` and ``DiskCache`` have in common: the per-endpoint
+    time to live overrides, the hit/miss counters and decoding cached bodies.
+    Subclasses store the entries (``get_entry``, ``set``, ``clear`` and
+    ``__len__``).
+
+    :param ttl: Overrides of the time to live (in seconds) by endpoint, where
+        the key is the start of the endpoint path (i.e. ``'/points'``). The
+        longest matching path is used. 0 means never cache the endpoint.
+    :type ttl: dict
+    :ivar blocking: True if looking up or storing a response blocks (i.e. on
+        disk), in which case ``AsyncNWSAPy`` does it in a thread.
+    """
+
+    blocking = False
+
+    def __init__(self, ttl = None):
+        self.ttl = dict(ttl or {})
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def __contains__(self, url):
+        return self.get_entry(url) is not None
+
+    def ttl_for(self, url, headers):
+        """Returns the time to live of a response, taking the per-endpoint
+        overrides into account.
+
+        :param url: The URL the response is for.
+        :type url: str
+        :param headers: The response headers.
+        :type headers: dict-like
+        :return: The time to live of the response, in seconds.
+        :rtype: float
+        """
+        path = urlsplit(canonical_url(url)).path
+        matches = [prefix for prefix in self.ttl if path.startswith(prefix)]
+        if matches:
+            return self.ttl[max(matches, key = len)]
+        return ttl_from_headers(headers)
+
+    def get_entry(self, url):
+        """Returns the raw cache entry for a URL if it's still fresh.
+
+        :return: A tuple of the response body (bytes), headers and the time
+            the entry expires, or None.
+        :rtype: tuple or None
+        """
+        raise NotImplementedError
+
+    def get(self, url, decoder = json.loads):
+        """Returns a cached response for a URL.
+
+        :param url: The URL to look up.
+        :type url: str
+        :param decoder: Decodes the cached body from bytes.
+        :type decoder: callable
+        :return: A tuple of the response values and headers (the same as
+            ``request_from_api``), or None if there isn't a fresh response.
+        :rtype: tuple or None
+        """
+        entry = self.get_entry(url)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # Decode on every hit, the endpoint objects modify the values they're
+        # given, so the same dictionary can't be handed out twice.
+        return (decoder(entry[0]), entry[1])
+
+    def set(self, url, content, headers):
+        """Stores a response, if the API (or the per-endpoint override) says
+        it can be cached.
+
+        :param url: The URL that was requested.
+        :type url: str
+        :param content: The body of the response.
+        :type content: bytes
+        :param headers: The response headers.
+        :type headers: dict-like
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Removes all responses from the cache."""
+        raise NotImplementedError
+
+
+class ResponseCache(BaseCache):
+    """In-memory cache of API responses, keyed by canonical URL. Responses
+    expire after the time given by the API (see ``ttl_from_headers``) and the
+    least recently used response is dropped once ``maxsize`` is reached.
+
+    The cache is thread safe, so a single cache can be shared by threads
+    making requests through the same ``NWSAPy`` object.
+
+    :param maxsize: The maximum number of responses to hold.
+    :type maxsize: int
+    :param ttl: Overrides of the time to live (in seconds) by endpoint, see
+        ``BaseCache``.
+    :type ttl: dict
+    """
+
+    def __init__(self, maxsize = 256, ttl = None):
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_entry(self, url):
+        """Returns the raw cache entry for a URL if it's still fresh.
+
+        :return: A tuple of the response body (bytes), headers and the time
+            the entry expires, or None.
+        :rtype: tuple or None
+        """
+        key = canonical_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, url, content, headers):
+        """Stores a response, if the API (or the per-endpoint override) says
+        it can be cached.
+
+        :param url: The URL that was requested.
+        :type url: str
+        :param content: The body of the response.
+        :type content: bytes
+        :param headers: The response headers.
+        :type headers: dict-like
+        """
+        ttl = self.ttl_for(url, headers)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        key = canonical_url(url)
+        with self._lock:
+            self._entries[key] = (content, headers, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+
+    def clear(self):
+        """Removes all responses from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Endpoints that rarely (if ever) change are kept for a long time on disk,
+# alerts change by the minute so they aren't kept at all.
+DISK_CACHE_TTL = {
+    '/points': 7 * 86400,
+    '/glossary': 7 * 86400,
+    '/alerts': 0,
+    '/alerts/types': 86400,
+}
+
+class DiskCache(BaseCache):
+    """Cache of API responses kept in a SQLite database, so responses survive
+    a restart and are shared by every process using the same file. The
+    database is in WAL mode, which lets many processes read while one writes.
+
+    It's used the same way as ``ResponseCache``. Rather than a number of
+    responses, the size is bounded by the total size of the responses in bytes,
+    and the least recently used responses are removed first.
+
+    Reads and writes block, so ``AsyncNWSAPy`` makes them in a thread rather
+    than in the event loop.
+
+    :param path: The path to the SQLite database. Created if it doesn't exist.
+    :type path: str
+    :param ttl: Overrides of the time to live (in seconds) by endpoint. These
+        are added to ``DISK_CACHE_TTL``.
+    :type ttl: dict
+    :param max_bytes: The maximum total size of the responses to hold.
+    :type max_bytes: int
+    """
+
+    blocking = True
+
+    def __init__(self, path, ttl = None, max_bytes = 100 * 1024 ** 2):
+        super().__init__(dict(DISK_CACHE_TTL, **(ttl or {})))
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS responses ('
+                         'key TEXT PRIMARY KEY, content BLOB, headers TEXT, '
+                         'expires REAL, size INTEGER, accessed REAL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS accessed_index '
+                         'ON responses (accessed)')
+
+    def _connect(self):
+        # sqlite connections can't be shared between threads or processes,
+        # so there's one per thread (and a new one after a fork).
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout = 30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get_entry(self, url):
+        """Returns the raw cache entry for a URL if it's still fresh.
+
+        :return: A tuple of the response body (bytes), headers and the time
+            the entry expires, or None.
+        :rtype: tuple or None
+        """
+        key = canonical_url(url)
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute('SELECT content, headers, expires FROM responses '
+                               'WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if row[2] <= now:
+                conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+            conn.execute('UPDATE responses SET accessed = ? WHERE key = ?',
+                         (now, key))
+        return (row[0], CaseInsensitiveDict(json.loads(row[1])), row[2])
+
+    def set(self, url, content, headers):
+        """Stores a response, if the API (or the per-endpoint override) says
+        it can be cached. Removes the least recently used responses if the
+        cache is over ``max_bytes``.
+
+        :param url: The URL that was requested.
+        :type url: str
+        :param content: The body of the response.
+        :type content: bytes
+        :param headers: The response headers.
+        :type headers: dict-like
+        """
+        ttl = self.ttl_for(url, headers)
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                         (canonical_url(url), content, json.dumps(dict(headers)),
+                          now + ttl, len(content), now))
+            self._evict(conn)
+
+    def _evict(self, conn):
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # expired responses go first, then the least recently used.
+        conn.execute('DELETE FROM responses WHERE expires <= ?', (time.time(),))
+        rows = conn.execute('SELECT key, size FROM responses ORDER BY accessed')
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        stale = []
+        for key, size in rows.fetchall():
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany('DELETE FROM responses WHERE key = ?', stale)
+
+    def clear(self):
+        """Removes all responses from the cache."""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM responses')
+
+
+class RevalidationCache:
+    """Remembers the validators (``ETag``/``Last-Modified``) of responses
+    along with the object that was made from each response. Requests for the
+    same URL are then made conditional (``If-None-Match``/``If-Modified-Since``)
+    and when the API answers ``304 Not Modified``, the object is reused
+    instead of decoding and parsing the same data again.
+
+    :param maxsize: The maximum number of URLs to remember. The least recently
+        used URL is dropped first.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize = 64):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def conditional_headers(self, url):
+        """Returns the headers that make a request for the URL conditional.
+
+        :param url: The URL to be requested.
+        :type url: str
+        :return: ``If-None-Match`` and/or ``If-Modified-Since`` headers, empty
+            if nothing is known about the URL.
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._entries.get(canonical_url(url))
+        if entry is None:
+            return {}
+
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        if last_modified is not None:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get(self, url):
+        """Returns the object made from the last response for the URL.
+
+        :param url: The URL that was requested.
+        :type url: str
+        :return: The object, or None if the URL isn't known.
+        """
+        key = canonical_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, url, headers, obj):
+        """Remembers the validators of a response and the object made from it.
+        Responses without an ``ETag`` or ``Last-Modified`` header are skipped.
+
+        :param url: The URL that was requested.
+        :type url: str
+        :param headers: The response headers.
+        :type headers: dict-like
+        :param obj: The object made from the response.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if (etag is None and last_modified is None) or self.maxsize <= 0:
+            return
+
+        key = canonical_url(url)
+        with self._lock:
+            self._entries[key] = (etag, last_modified, obj)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+
+    def clear(self):
+        """Forgets all of the URLs."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,60 @@
+"""Decodes the JSON bodies of responses from the NWS API. Large responses
+(i.e. ``/alerts`` with polygons) spend most of their time being decoded, so
+an accelerated decoder is used if one is installed, falling back to the
+standard library's ``json``.
+
+A decoder takes the raw bytes of a body and returns the decoded values::
+
+    decode = get_decoder('orjson')
+    values = decode(response.content)
+"""
+
+import json
+from importlib import import_module
+
+# The decoders that can be picked by name, fastest first. Each is the module
+# and the function in it that decodes bytes.
+DECODERS = {
+    'orjson': ('orjson', 'loads'),
+    'ujson': ('ujson', 'loads'),
+    'json': ('json', 'loads'),
+}
+
+
+def get_decoder(decoder = None):
+    """Returns a function that decodes a JSON body.
+
+    :param decoder: The name of a decoder in ``DECODERS``, a function that
+        takes bytes and returns the decoded values, or None for the fastest
+        one installed.
+    :type decoder: str, callable or None
+    :raises ValueError: If the name isn't a known decoder.
+    :raises ImportError: If the decoder isn't installed.
+    :return: The decoding function.
+    :rtype: callable
+    """
+    if callable(decoder):
+        return decoder
+
+    if decoder is None:
+        for name in DECODERS:
+            try:
+                return get_decoder(name)
+            except ImportError:
+                continue
+
+    if decoder not in DECODERS:
+        raise ValueError(f"Unknown JSON decoder: {decoder}. "
+                         f"Expected one of: {', '.join(DECODERS)}.")
+
+    module, function = DECODERS[decoder]
+    try:
+        return getattr(import_module(module), function)
+    except ImportError:
+        raise ImportError(f"The {decoder} JSON decoder is not installed. "
+                          f"Install it with `pip install {decoder}`.")
+
+
+# Used when a decoder isn't given.
+default_decoder = get_decoder()
+
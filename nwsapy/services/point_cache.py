@@ -0,0 +1,127 @@
+"""Answers ``/points`` requests from points that have already been resolved.
+
+The metadata of a point (grid, forecast zone, county, CWA, ...) is the same
+for every location in the same 2.5 km forecast grid cell. So, if a location is
+close enough to a point that was already requested, that point's metadata is
+used rather than requesting it again.
+
+Resolved points are kept in a grid hash (a dictionary of cells about
+``radius_km`` wide), so finding the points near a location only looks at the
+surrounding cells.
+"""
+
+import copy
+import math
+import threading
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Returns the great circle distance between 2 points, in km.
+
+    :rtype: float
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + \
+        math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _grid_assignment(point):
+    # The forecast grid cell that a point resolved to.
+    values = point.values
+    return (values.get('gridId'), values.get('gridX'), values.get('gridY'))
+
+
+class PointCache:
+    """Cache of resolved points, looked up by distance.
+
+    A location is answered from the cache when there's at least one resolved
+    point within ``radius_km`` of it, and all of the resolved points within
+    ``radius_km`` are in the same forecast grid cell. If they're in different
+    cells, the location could be in either one, so it isn't answered.
+
+    :param radius_km: How close (in km) a resolved point needs to be.
+    :type radius_km: float
+    :ivar hits: The number of lookups answered from the cache.
+    :ivar misses: The number of lookups without a resolved point nearby.
+    :ivar ambiguous: The number of lookups with nearby points in different
+        grid cells (these also count as misses).
+    """
+
+    def __init__(self, radius_km = 1.0):
+        self.radius_km = radius_km
+        self._cell_size = radius_km / KM_PER_DEGREE  # in degrees latitude.
+        self._cells = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.ambiguous = 0
+
+    def __len__(self):
+        return sum(len(cell) for cell in self._cells.values())
+
+    def _cell(self, lat, lon):
+        return (math.floor(lat / self._cell_size), math.floor(lon / self._cell_size))
+
+    def _nearby(self, lat, lon):
+        # Cells are square in degrees, so towards the poles more cells of
+        # longitude are needed to cover the radius.
+        row, col = self._cell(lat, lon)
+        cos_lat = max(math.cos(math.radians(lat)), 0.01)
+        lon_cells = min(math.ceil(1 / cos_lat), int(360 / self._cell_size))
+        for i in range(row - 1, row + 2):
+            for j in range(col - lon_cells, col + lon_cells + 1):
+                yield from self._cells.get((i, j), ())
+
+    def get(self, lat, lon):
+        """Returns the resolved point that covers a location.
+
+        :param lat: The latitude of the location.
+        :type lat: float
+        :param lon: The longitude of the location.
+        :type lon: float
+        :return: A shallow copy of the resolved point, or None if there isn't
+            one nearby (or it's ambiguous).
+        :rtype: nwsapy.endpoints.point.Point or None
+        """
+        with self._lock:
+            nearest, nearest_km, assignments = None, None, set()
+            for p_lat, p_lon, point in self._nearby(lat, lon):
+                km = haversine_km(lat, lon, p_lat, p_lon)
+                if km > self.radius_km:
+                    continue
+                assignments.add(_grid_assignment(point))
+                if nearest_km is None or km < nearest_km:
+                    nearest, nearest_km = point, km
+
+            if nearest is None or len(assignments) > 1:
+                self.misses += 1
+                self.ambiguous += len(assignments) > 1
+                return None
+
+            self.hits += 1
+            # A copy, so callers don't share state (i.e. iterating over it).
+            return copy.copy(nearest)
+
+    def add(self, lat, lon, point):
+        """Adds a resolved point.
+
+        :param lat: The latitude that was requested.
+        :type lat: float
+        :param lon: The longitude that was requested.
+        :type lon: float
+        :param point: The point that the API resolved it to. A shallow copy of
+            it is kept, so changes made to ``point`` afterwards aren't.
+        :type point: nwsapy.endpoints.point.Point
+        """
+        point = copy.copy(point)
+        with self._lock:
+            self._cells.setdefault(self._cell(lat, lon), []).append((lat, lon, point))
+
+    def clear(self):
+        """Removes all of the resolved points."""
+        with self._lock:
+            self._cells.clear()
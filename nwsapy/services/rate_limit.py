@@ -0,0 +1,163 @@
+"""Keeps requests to the NWS API under a given rate, and retries requests that
+the API throttled (429 Too Many Requests/503 Service Unavailable).
+
+Requests are limited with a token bucket: tokens are added at ``rate`` per
+second up to ``burst``, and every request takes one. Throttled requests are
+retried after the ``Retry-After`` time the API asks for or, if there isn't
+one, after an exponential backoff with jitter so that many threads don't all
+retry at the same time.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# Status codes the API uses when a client is making too many requests.
+RETRY_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value):
+    """Converts a ``Retry-After`` header to seconds.
+
+    :param value: The header, either a number of seconds or an HTTP date.
+    :type value: str or None
+    :return: The number of seconds to wait, or None if it can't be read.
+    :rtype: float or None
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Thread safe token bucket.
+
+    :param rate: The number of tokens added per second.
+    :type rate: float
+    :param burst: The maximum number of tokens the bucket holds.
+    :type burst: int
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token, and returns how long to wait before using it. The
+        bucket can go into debt, so callers are served first come first served.
+
+        :return: The number of seconds to wait.
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Takes a token, sleeping until it's available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Empties the bucket so that no tokens are available for ``seconds``.
+        Used when the API asks to back off, so every thread backs off.
+
+        :param seconds: The number of seconds to pause for.
+        :type seconds: float
+        """
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+            self._updated = time.monotonic()
+
+
+class RateLimiter:
+    """Limits the rate of requests, and decides if and when a throttled
+    request is retried.
+
+    :param rate: The maximum number of requests per second.
+    :type rate: float
+    :param burst: The number of requests that can be made at once, before
+        being limited to ``rate``.
+    :type burst: int
+    :param max_retries: The number of times a throttled request is retried.
+    :type max_retries: int
+    :param backoff: The backoff (in seconds) before the first retry. Doubles
+        with each retry.
+    :type backoff: float
+    :param max_backoff: The longest backoff (in seconds), unless the API asks
+        for longer with ``Retry-After``.
+    :type max_backoff: float
+    :ivar retries: The number of retries made.
+    """
+
+    def __init__(self, rate = 5, burst = 10, max_retries = 3, backoff = 0.5,
+                 max_backoff = 30):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retries = 0
+
+    def acquire(self):
+        """Waits until a request can be made."""
+        self.bucket.acquire()
+
+    async def async_acquire(self):
+        """Waits until a request can be made, without blocking the event loop."""
+        delay = self.bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def should_retry(self, status_code, attempt):
+        """Checks if a response should be retried.
+
+        :param status_code: The HTTP status code of the response.
+        :type status_code: int
+        :param attempt: The number of retries already made for the request.
+        :type attempt: int
+        :rtype: bool
+        """
+        return status_code in RETRY_STATUS_CODES and attempt < self.max_retries
+
+    def retry_delay(self, attempt, headers):
+        """Works out how long to wait before retrying, and pauses the bucket
+        for that long. The retry (and every other request) then waits when it
+        acquires its next token.
+
+        :param attempt: The number of retries already made for the request.
+        :type attempt: int
+        :param headers: The headers of the throttled response.
+        :type headers: dict-like
+        :return: The number of seconds to wait.
+        :rtype: float
+        """
+        with self.bucket._lock:  # retry_delay is called from many threads.
+            self.retries += 1
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if retry_after is not None:
+            # the API's time, plus a little jitter to spread out the retries.
+            delay = retry_after + random.uniform(0, self.backoff)
+        else:
+            # "full jitter" exponential backoff.
+            delay = random.uniform(0, min(self.max_backoff,
+                                          self.backoff * 2 ** attempt))
+        self.bucket.pause(delay)
+        return delay
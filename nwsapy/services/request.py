@@ -1,30 +1,96 @@
+import asyncio
+
 import requests
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
+
+from .json_decoder import default_decoder
+from .stream import FeatureParser
+
+def create_session(pool_connections = 10, pool_maxsize = 10):
+    """Creates a session with a persistent (keep-alive) connection pool. Reusing
+    a session means the TCP and TLS handshake to the NWS API is only done once
+    per connection instead of once per request.
+
+    :param pool_connections: The number of host connection pools to cache.
+    :type pool_connections: int
+    :param pool_maxsize: The maximum number of connections to keep alive per host.
+    :type pool_maxsize: int
+    :return: A session with the connection pool mounted for http and https.
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections = pool_connections,
+                          pool_maxsize = pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
-def request_from_api(url, headers, as_response_object = False):
+def _get_with_retries(requester, url, headers, rate_limiter, stream = False):
+    # Makes the request, waiting on the rate limiter first and retrying if the
+    # API throttled it.
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        response = requester.get(url, headers=headers, stream=stream)
+        if rate_limiter is None or \
+                not rate_limiter.should_retry(response.status_code, attempt):
+            return response
+
+        # Give the connection back to the pool (a streamed body isn't read).
+        response.close()
+        # The wait happens when the next token is acquired.
+        rate_limiter.retry_delay(attempt, response.headers)
+        attempt += 1
+
+def request_from_api(url, headers, as_response_object = False, session = None,
+                     cache = None, rate_limiter = None, decoder = None):
     """Requests data from the NWS API and returns a response.
 
     :param url: The URL to request from.
     :type url: str
     :param headers: The headers to include in the response.
     :type headers: dict
+    :param session: A session (see ``create_session``) to make the request
+        through. If None, a new connection is made for the request.
+    :type session: requests.Session
+    :param cache: A cache to look the URL up in before making the request,
+        and to store the response in. Not used if ``as_response_object``.
+    :type cache: nwsapy.services.cache.ResponseCache
+    :param rate_limiter: Limits the rate of requests and retries throttled
+        (429/503) requests. If None, requests aren't limited or retried.
+    :type rate_limiter: nwsapy.services.rate_limit.RateLimiter
+    :param decoder: Decodes the body of the response from bytes (see
+        ``nwsapy.services.json_decoder``). If None, the default decoder.
+    :type decoder: callable
     :raises Exception: If a bad request is made, raise an exception.
-    :return: A response from the NWS API.
+    :return: A response from the NWS API. If the request was conditional and
+        the API responded with ``304 Not Modified``, the values are None.
     :rtype: requests.Response
     """
     # requests a url. For this purpose, this should be a NWS API url.
     # list of URLs: https://www.weather.gov/documentation/services-web-api#/
 
+    decode = default_decoder if decoder is None else decoder
+    if cache is not None and not as_response_object:
+        cached = cache.get(url, decode)
+        if cached is not None:
+            return cached
+
+    # requests.get and session.get share the same signature.
+    requester = requests if session is None else session
+
     try:
-        response = requests.get(url, headers=headers)
+        response = _get_with_retries(requester, url, headers, rate_limiter)
         response.raise_for_status()
     except HTTPError:
         # Possible error message: requests.exceptions.HTTPError: 503 Server Error:
         #   Service Unavailable for url: https://api.weather.gov/alerts/active
         if as_response_object:
             return response
-        
-        return (response.json(), response.headers)
+
+        return (decode(response.content), response.headers)
     except Exception as err:
         raise Exception(f'Other error occurred: {err}')
 
@@ -32,5 +98,197 @@ def request_from_api(url, headers, as_response_object = False):
     #   help with testing and end-to-end data flow.
     if as_response_object:
         return response
-    
-    return (response.json(), response.headers)
\ No newline at end of file
+
+    # Conditional request and the data hasn't changed - there's no body.
+    if response.status_code == 304:
+        return (None, response.headers)
+
+    if cache is not None:
+        cache.set(url, response.content, response.headers)
+
+    return (decode(response.content), response.headers)
+
+def _stream_features(response, decode, chunk_size):
+    # Yields the features of a response as they arrive, then closes it.
+    parser = FeatureParser(decode)
+    try:
+        for chunk in response.iter_content(chunk_size):
+            yield from parser.feed(chunk)
+    finally:
+        response.close()
+
+def stream_from_api(url, headers, session = None, rate_limiter = None,
+                    decoder = None, chunk_size = 16384):
+    """Requests a feature collection (i.e. ``/alerts``) from the NWS API
+    without reading the body. The features are decoded one at a time as
+    their bytes arrive (see ``nwsapy.services.stream``), so the whole body
+    is never held in memory. Responses aren't cached.
+
+    :param url: The URL to request from.
+    :type url: str
+    :param headers: The headers to include in the response.
+    :type headers: dict
+    :param session: A session (see ``create_session``) to make the request
+        through. If None, a new connection is made for the request.
+    :type session: requests.Session
+    :param rate_limiter: Limits the rate of requests and retries throttled
+        (429/503) requests. If None, requests aren't limited or retried.
+    :type rate_limiter: nwsapy.services.rate_limit.RateLimiter
+    :param decoder: Decodes each feature from bytes. If None, the default
+        decoder.
+    :type decoder: callable
+    :param chunk_size: The number of bytes to read at a time.
+    :type chunk_size: int
+    :raises Exception: If a bad request is made, raise an exception.
+    :return: A generator of the features and the headers. If the API gave
+        an error, the (fully read) error values and the headers instead.
+    :rtype: tuple
+    """
+    decode = default_decoder if decoder is None else decoder
+    requester = requests if session is None else session
+
+    try:
+        response = _get_with_retries(requester, url, headers, rate_limiter,
+                                     stream = True)
+    except Exception as err:
+        raise Exception(f'Other error occurred: {err}')
+
+    if response.status_code >= 400:
+        return (decode(response.content), response.headers)
+
+    return (_stream_features(response, decode, chunk_size), response.headers)
+
+def create_async_session(pool_maxsize = 100, pool_maxsize_per_host = 0):
+    """Creates an ``aiohttp`` session with a keep-alive connection pool. Must
+    be called from within a running event loop.
+
+    :param pool_maxsize: The maximum number of connections in the pool.
+    :type pool_maxsize: int
+    :param pool_maxsize_per_host: The maximum number of connections per host.
+        0 means no per host limit.
+    :type pool_maxsize_per_host: int
+    :raises ImportError: If ``aiohttp`` is not installed.
+    :return: A session to make asynchronous requests through.
+    :rtype: aiohttp.ClientSession
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("aiohttp is required for asynchronous requests. "
+                          "Install it with `pip install nwsapy[async]`.")
+
+    connector = aiohttp.TCPConnector(limit = pool_maxsize,
+                                     limit_per_host = pool_maxsize_per_host)
+    return aiohttp.ClientSession(connector = connector)
+
+async def _in_thread_if_blocking(cache, func, *args):
+    # Caches that block (i.e. on disk) are used from a thread, so the event
+    # loop carries on while they read or write.
+    if cache.blocking:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    return func(*args)
+
+async def async_request_from_api(url, headers, session, as_response_object = False,
+                                 cache = None, rate_limiter = None, decoder = None):
+    """Asynchronous version of ``request_from_api``. Requests data from the
+    NWS API without blocking the event loop.
+
+    :param url: The URL to request from.
+    :type url: str
+    :param headers: The headers to include in the response.
+    :type headers: dict
+    :param session: The session (see ``create_async_session``) to make the
+        request through.
+    :type session: aiohttp.ClientSession
+    :param cache: A cache to look the URL up in before making the request,
+        and to store the response in. Not used if ``as_response_object``.
+        Caches that block (``DiskCache``) are used from a thread.
+    :type cache: nwsapy.services.cache.BaseCache
+    :param rate_limiter: Limits the rate of requests and retries throttled
+        (429/503) requests. If None, requests aren't limited or retried.
+    :type rate_limiter: nwsapy.services.rate_limit.RateLimiter
+    :param decoder: Decodes the body of the response from bytes (see
+        ``nwsapy.services.json_decoder``). If None, the default decoder.
+    :type decoder: callable
+    :raises Exception: If a bad request is made, raise an exception.
+    :return: A response from the NWS API. If the request was conditional and
+        the API responded with ``304 Not Modified``, the values are None.
+    :rtype: aiohttp.ClientResponse
+    """
+    decode = default_decoder if decoder is None else decoder
+    if cache is not None and not as_response_object:
+        cached = await _in_thread_if_blocking(cache, cache.get, url, decode)
+        if cached is not None:
+            return cached
+
+    try:
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                await rate_limiter.async_acquire()
+            async with session.get(url, headers = headers) as response:
+                # read the body before the connection is released back to the
+                # pool. Bad responses (4xx/5xx) still carry a json body from
+                # the API, same as request_from_api.
+                content = await response.read()
+            if rate_limiter is None or \
+                    not rate_limiter.should_retry(response.status, attempt):
+                break
+            rate_limiter.retry_delay(attempt, response.headers)
+            attempt += 1
+    except Exception as err:
+        raise Exception(f'Other error occurred: {err}')
+
+    if as_response_object:
+        return response
+
+    # Conditional request and the data hasn't changed - there's no body.
+    if response.status == 304:
+        return (None, response.headers)
+
+    if cache is not None and response.status < 400:
+        await _in_thread_if_blocking(cache, cache.set, url, content, response.headers)
+
+    return (decode(content), response.headers)
+
+async def _async_stream_features(response, decode, chunk_size):
+    # Yields the features of a response as they arrive, then releases it.
+    parser = FeatureParser(decode)
+    try:
+        async for chunk in response.content.iter_chunked(chunk_size):
+            for feature in parser.feed(chunk):
+                yield feature
+    finally:
+        response.release()
+
+async def async_stream_from_api(url, headers, session, rate_limiter = None,
+                                decoder = None, chunk_size = 16384):
+    """Asynchronous version of ``stream_from_api``.
+
+    :return: An asynchronous generator of the features and the headers. If
+        the API gave an error, the error values and the headers instead.
+    :rtype: tuple
+    """
+    decode = default_decoder if decoder is None else decoder
+
+    try:
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                await rate_limiter.async_acquire()
+            response = await session.get(url, headers = headers)
+            if rate_limiter is None or \
+                    not rate_limiter.should_retry(response.status, attempt):
+                break
+            response.release()
+            rate_limiter.retry_delay(attempt, response.headers)
+            attempt += 1
+    except Exception as err:
+        raise Exception(f'Other error occurred: {err}')
+
+    if response.status >= 400:
+        content = await response.read()
+        response.release()
+        return (decode(content), response.headers)
+
+    return (_async_stream_features(response, decode, chunk_size), response.headers)
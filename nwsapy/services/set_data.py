@@ -6,10 +6,11 @@ Some instances it'll set each value from the request as an attribute.
 
 import copy
 
-from ..endpoints.alerts import ActiveAlerts, AlertByArea, AlertById, AlertByMarineRegion, AlertByType, AlertByZone, AlertCount, Alerts, IndividualAlert, AlertById
+from ..endpoints.alerts import ActiveAlerts, AlertByArea, AlertById, AlertByMarineRegion, AlertByType, AlertByZone, AlertCount, Alerts, AlertTable, AlertById, IndividualAlert
 from ..endpoints.glossary import Glossary
 from ..endpoints.point import Point
 from ..endpoints.server_ping import ServerPing
+from ..core.inheritance.request_error import RequestError
 
 def nws_api_gave_error(response):
     """Checks to see if the API gave an error by checking to see if 
@@ -190,7 +191,8 @@ def for_alerts(response):
         alerts.values = response_values
         alerts.has_any_request_errors = True
     else:
-        alerts.values = [IndividualAlert(x) for x in response_values['features']]
+        alerts.values = AlertTable(response_values['features'])
+        alerts.next_url = (response_values.get('pagination') or {}).get('next')
     
     alerts.response_headers = response_headers
     alerts._set_iterator()
@@ -208,12 +210,28 @@ def for_active_alerts(response):
         alerts.values = response_values
         alerts.has_any_request_errors = True
     else:
-        alerts.values = [IndividualAlert(x) for x in response_values['features']]
+        alerts.values = AlertTable(response_values['features'])
     
     alerts.response_headers = response_headers
     alerts._set_iterator()
     return alerts
 
+def for_alert_stream(response):
+    """Sets the data for a streamed alerts response (see
+    ``request.stream_from_api``).
+
+    :return: A generator of ``IndividualAlert`` objects, made as each feature
+        arrives. If the API gave an error, it yields a single ``RequestError``.
+    :rtype: generator
+    """
+    # unpack
+    response_values, response_headers = response
+
+    if isinstance(response_values, dict):
+        return iter([RequestError(response)])
+
+    return (IndividualAlert(feature) for feature in response_values)
+
 def for_alert_by_id(response):
     # unpack
     response_values, response_headers = response
@@ -225,7 +243,7 @@ def for_alert_by_id(response):
         alerts.values = response_values
         alerts.has_any_request_errors = True
     else:
-        alerts.values = [IndividualAlert(response_values)]
+        alerts.values = AlertTable([response_values])
 
     alerts.response_headers = response_headers
     alerts._set_iterator()
@@ -244,7 +262,7 @@ def for_alert_by_area(response):
         alert.has_any_request_errors = True
     else:
         features = response_values['features']
-        alert.values = [IndividualAlert(x) for x in features]
+        alert.values = AlertTable(features)
 
     alert.response_headers = response_headers
     alert._set_iterator()
@@ -291,7 +309,7 @@ def for_alert_by_zone(response):
         alert.has_any_request_errors = True
     else:
         features = response_values['features']
-        alert.values = [IndividualAlert(x) for x in features]
+        alert.values = AlertTable(features)
     
     alert.response_headers = response_headers
     alert._set_iterator()
@@ -310,7 +328,7 @@ def for_alert_by_marine_region(response):
         alert.has_any_request_errors = True
     else:
         features = response_values['features']
-        alert.values = [IndividualAlert(x) for x in features]
+        alert.values = AlertTable(features)
     
     alert.response_headers = response_headers
     alert._set_iterator()
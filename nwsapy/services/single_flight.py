@@ -0,0 +1,121 @@
+"""Coalesces identical requests that are made at the same time. When many
+threads (or tasks) ask for the same URL while a request for it is already in
+flight, they wait for that request instead of making their own. The caller
+that made the request gets the object back, and each waiting caller gets a
+shallow copy of it. The data is shared, but state on the object (i.e. where a
+``for`` loop over it is up to) isn't.
+"""
+
+import asyncio
+import copy
+import threading
+
+
+class _Call:
+    # A request in flight, and what the callers waiting on it get back.
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces calls with the same key made from different threads.
+
+    :ivar calls: The number of calls that were actually made.
+    :ivar coalesced: The number of calls that waited on (and shared the
+        result of) a call already in flight.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """Calls ``func`` unless a call with the same key is already in
+        flight, in which case it waits for that call and returns a shallow
+        copy of its result (or raises its error).
+
+        :param key: The key of the call, i.e. the canonical URL.
+        :type key: str
+        :param func: The function to call, takes no arguments.
+        :type func: callable
+        :return: The result of the call.
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is None:
+                call = self._in_flight[key] = _Call()
+                self.calls += 1
+                is_leader = True
+            else:
+                self.coalesced += 1
+                is_leader = False
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.copy(call.result)
+
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Coalesces calls with the same key made from different tasks running
+    in the same event loop.
+
+    :ivar calls: The number of calls that were actually made.
+    :ivar coalesced: The number of calls that waited on (and shared the
+        result of) a call already in flight.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight = {}
+
+    async def do(self, key, func):
+        """Awaits ``func()`` unless a call with the same key is already in
+        flight, in which case it waits for that call and returns a shallow
+        copy of its result (or raises its error).
+
+        :param key: The key of the call, i.e. the canonical URL.
+        :type key: str
+        :param func: The coroutine function to call, takes no arguments.
+        :type func: callable
+        :return: The result of the call.
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield it, so a waiter being cancelled doesn't cancel the call.
+            return copy.copy(await asyncio.shield(future))
+
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        self.calls += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            future.exception()  # retrieved, even if nobody else was waiting.
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._in_flight[key]
+        return result
@@ -0,0 +1,154 @@
+"""Answers the alert getters by area, zone and marine region, and the alert
+count, from one copy of the active alerts instead of a request each.
+
+The active alerts (``/alerts/active``) are requested at most once per
+``max_age`` seconds. Each copy is indexed by zone and by area (the first 2
+letters of a zone ID, i.e. ``FL`` for ``FLZ050``), and the getters filter it
+to make the same response the API would have sent::
+
+    snapshot = AlertSnapshot(max_age = 60)
+    if snapshot.is_stale():
+        snapshot.update(request_active_alerts())
+    response = snapshot.by_zone('FLZ050')
+"""
+
+import threading
+import time
+
+from ..core.mapping import marine_region_areas
+
+ACTIVE_ALERTS_URL = 'https://api.weather.gov/alerts/active'
+
+# The areas that are marine areas, rather than states/territories.
+MARINE_AREAS = frozenset(area for areas in marine_region_areas.values() for area in areas)
+
+
+class AlertSnapshot:
+    """The latest copy of the active alerts, indexed by zone and area.
+
+    :param max_age: How long (in seconds) a copy is used for before it's
+        requested again.
+    :type max_age: float
+    :ivar updates: The number of copies of the active alerts that were taken.
+    """
+
+    def __init__(self, max_age = 60):
+        self.max_age = max_age
+        self.updates = 0
+        self._lock = threading.Lock()
+        self._response = None
+        self._taken = None
+        self._features = []
+        self._headers = {}
+        self._zones = {}   # zone ID: indices of the features in it.
+        self._areas = {}   # area: indices of the features in it.
+
+    def is_stale(self):
+        """Whether there's no copy yet or it's older than ``max_age``.
+
+        :rtype: bool
+        """
+        with self._lock:
+            return self._taken is None or time.monotonic() - self._taken >= self.max_age
+
+    def update(self, response):
+        """Replaces the copy with a new ``/alerts/active`` response. Errors
+        from the API aren't kept.
+
+        :param response: The values and headers of the response.
+        :type response: tuple
+        :return: True if the response was kept (or already is the copy),
+            False if the API gave an error.
+        :rtype: bool
+        """
+        values, headers = response
+        if not isinstance(values, dict) or 'features' not in values:
+            return False
+
+        with self._lock:
+            if response is self._response:  # already the copy.
+                return True
+
+            features = values['features']
+            zones = {}
+            areas = {}
+            for index, feature in enumerate(features):
+                feature_zones = {zone.split("/")[-1] for zone in
+                                 feature['properties'].get('affectedZones') or ()}
+                for zone in feature_zones:
+                    zones.setdefault(zone, []).append(index)
+                for area in {zone[:2] for zone in feature_zones}:
+                    areas.setdefault(area, []).append(index)
+
+            self._response = response
+            self._taken = time.monotonic()
+            self._features = features
+            self._headers = headers
+            self._zones = zones
+            self._areas = areas
+            self.updates += 1
+        return True
+
+    def _collection(self, indices):
+        # The response the API would have sent for these features.
+        features = self._features
+        values = {'type': 'FeatureCollection',
+                  'features': [features[i] for i in sorted(set(indices))]}
+        return values, self._headers
+
+    def by_area(self, area):
+        """Returns the alerts for a 2 letter area (state or marine area).
+
+        :rtype: tuple
+        """
+        with self._lock:
+            return self._collection(self._areas.get(area.upper(), ()))
+
+    def by_zone(self, zone):
+        """Returns the alerts for a 6 character NWS zone or county.
+
+        :rtype: tuple
+        """
+        with self._lock:
+            return self._collection(self._zones.get(zone.upper(), ()))
+
+    def by_marine_region(self, marine_region):
+        """Returns the alerts for a 2 letter marine region.
+
+        :rtype: tuple
+        """
+        with self._lock:
+            indices = []
+            for area in marine_region_areas.get(marine_region.upper(), ()):
+                indices.extend(self._areas.get(area, ()))
+            return self._collection(indices)
+
+    def count(self):
+        """Returns the number of alerts, as ``/alerts/active/count`` does.
+        An alert counts towards every area, region and zone it's in, and
+        towards land and/or marine depending on its areas.
+
+        :rtype: tuple
+        """
+        with self._lock:
+            land, marine = set(), set()
+            for area, indices in self._areas.items():
+                (marine if area in MARINE_AREAS else land).update(indices)
+
+            regions = {}
+            for region, region_areas in marine_region_areas.items():
+                indices = set()
+                for area in region_areas:
+                    indices.update(self._areas.get(area, ()))
+                if indices:
+                    regions[region] = len(indices)
+
+            values = {
+                'total': len(self._features),
+                'land': len(land),
+                'marine': len(marine),
+                'regions': regions,
+                'areas': {area: len(indices) for area, indices in self._areas.items()},
+                'zones': {zone: len(indices) for zone, indices in self._zones.items()},
+            }
+            return values, self._headers
@@ -0,0 +1,99 @@
+"""Parses the ``features`` of a GeoJSON feature collection incrementally, as
+the bytes of the response arrive. Each feature is decoded on its own as soon
+as its closing brace has been read, so only the current feature (and the
+chunk being read) is held in memory rather than the whole response::
+
+    parser = FeatureParser()
+    for chunk in response.iter_content(16384):
+        for feature in parser.feed(chunk):
+            ...
+
+Only the JSON structure is tracked (braces, brackets and strings), the
+features themselves are decoded with the regular JSON decoder.
+"""
+
+import re
+
+from .json_decoder import default_decoder
+
+# A whole string (escapes included) or a character that changes the
+# structure. A string that's cut off at the end of the buffer matches without
+# its closing quote.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*(?:"|\\?\Z)|[{}\[\]]', re.DOTALL)
+
+
+class FeatureParser:
+    """Pulls the features out of a feature collection, fed in chunks.
+
+    :param decoder: Decodes a feature from its bytes.
+    :type decoder: callable
+    :param key: The key of the array to pull the items out of.
+    :type key: bytes
+    """
+
+    def __init__(self, decoder = default_decoder, key = b'features'):
+        self.decoder = decoder
+        self.key = b'"' + key + b'"'
+        self._buffer = bytearray()
+        self._pos = 0              # where to carry on scanning the buffer.
+        self._depth = 0
+        self._last_key = None      # the last string read at the top level.
+        self._in_array = False     # inside the features array.
+        self._item_start = None    # where the current feature starts.
+
+    def feed(self, chunk):
+        """Adds the next chunk of the body.
+
+        :param chunk: The next bytes of the body.
+        :type chunk: bytes
+        :return: The features that were completed by this chunk, decoded.
+        :rtype: list[dict]
+        """
+        buffer = self._buffer
+        buffer += chunk
+        items = []
+        pos = self._pos
+        depth = self._depth
+
+        for match in _TOKEN.finditer(buffer, pos):
+            token = match.group()
+            if token[0] == 34:  # a string.
+                if len(token) == 1 or token[-1] != 34 or match.end() == len(buffer) \
+                        and _cut_off(token):
+                    pos = match.start()  # the rest of it is in the next chunk.
+                    break
+                if depth == 1:
+                    self._last_key = token
+            elif token in b'{[':
+                depth += 1
+                if depth == 2 and token == b'[' and self._last_key == self.key:
+                    self._in_array = True
+                elif depth == 3 and self._in_array and self._item_start is None:
+                    self._item_start = match.start()
+            else:
+                depth -= 1
+                if self._in_array and depth == 2 and self._item_start is not None:
+                    items.append(self.decoder(bytes(buffer[self._item_start:match.end()])))
+                    self._item_start = None
+                elif self._in_array and depth == 1:
+                    self._in_array = False
+            pos = match.end()
+        else:
+            pos = len(buffer)
+
+        # Drop what's been read, unless it's part of a feature that isn't
+        # finished yet.
+        start = pos if self._item_start is None else self._item_start
+        del buffer[:start]
+        if self._item_start is not None:
+            self._item_start = 0
+        self._pos = pos - start
+        self._depth = depth
+        return items
+
+
+def _cut_off(string):
+    # A string at the end of the buffer ending in a quote is cut off if the
+    # quote is escaped (an odd number of backslashes before it).
+    backslashes = len(string) - 1 - len(string[1:-1].rstrip(b'\\')) - 1
+    return backslashes % 2 == 1
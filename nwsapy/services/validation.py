@@ -8,7 +8,7 @@ this, then they should import the DataValidationChecker class.
 """
 
 from nwsapy.core.errors import DataValidationError
-from nwsapy.core.mapping import full_state_to_two_letter_abbreviation as fsabbr
+from nwsapy.core.mapping import full_state
 
 class DataValidationChecker:
     """Class to encapsulate all data validation checking against API-related
@@ -44,9 +44,6 @@ class DataValidationChecker:
             'Longitude' : [lon, -180, 180]
         }
         
-        print(type(mapper))
-        print(mapper['Latitude'])
-        
         for name, data in mapper.items():
             # unpack
             val, min_val, max_val = data
@@ -65,7 +62,9 @@ class DataValidationChecker:
     
     def check_active_alerts_dvt(self, params, is_all_alerts = False):
         """Used as the "entrypoint" to checking each parameter against the
-        data validation tables.
+        data validation tables. The whole set of parameters is checked in one
+        pass, and every invalid value of a parameter is reported at once.
+        Values are matched regardless of case.
         
         Used in:
             - ``get_alerts``
@@ -73,55 +72,62 @@ class DataValidationChecker:
 
         :param params: Keyword arugments from instantiation of object.
         :type params: dictionary
-        :raises DataValidationError:
+        :param is_all_alerts: Whether ``limit`` should be checked too.
+        :type is_all_alerts: bool
+        :raises DataValidationError: If a value isn't in its data validation
+            table (or ``limit`` is above the maximum).
+        :return: The parameters, with each value as it's written in its data
+            validation table (i.e. ``severe`` becomes ``Severe``).
+        :rtype: dict
         """
-        url_valid_mapper = {
-            'area' : self.dvt.is_valid_area,
-            'certainty' : self.dvt.is_valid_certainty,
-            'event' : self.dvt.is_valid_product,
-            'message_type' : self.dvt.is_valid_message_type,
-            'region' : self.dvt.is_valid_region,
-            'region_type' : self.dvt.is_valid_region_type,
-            'severity' : self.dvt.is_valid_severity,
-            'status' : self.dvt.is_valid_status,
-            'urgency' : self.dvt.is_valid_urgency
-        }
-        
-        if is_all_alerts:
-            url_valid_mapper['limit'] = self.is_above_limit
-        
-        # iterate through the parameters and check to ensure that the
-        # values are values.
+        checked = {}
         for key, value in params.items():
-            if key not in url_valid_mapper:
+            if key == 'limit' and is_all_alerts:
+                if self.dvt.is_above_limit(value):
+                    raise DataValidationError(value, "Parameter: `limit`")
+                checked[key] = value
+                continue
+
+            normalize = _NORMALIZERS.get(key)
+            if normalize is None:
+                checked[key] = value
                 continue # TODO: look into other ways to handle this.
-            
-            # equivalent to: is_valid = self.is_valid_xyz(value)
-            
+
             # Sometimes, it'll be read in as a list. Other times, it won't.
-            # So, convert it into a list if it's not and then iterate through
-            # it :)
-            if not any([isinstance(value, list), isinstance(value, tuple)]):
-                value = [value]
-            
-            for val in value:    
-                is_valid = url_valid_mapper[key](val)
-            
-                if not is_valid:
-                    raise DataValidationError(value, f"Parameter: `{key}`")
+            values = value if isinstance(value, (list, tuple)) else [value]
+            normalized = [normalize(val) for val in values]
+            invalid = [val for val, norm in zip(values, normalized) if norm is None]
+            if invalid:
+                raise DataValidationError(invalid if values is value else value,
+                                          f"Parameter: `{key}`")
+
+            checked[key] = type(value)(normalized) if values is value else normalized[0]
+        return checked
 
     def check_if_valid_area(self, area):
         """Checks to see if it's a valid area.
         
         Used in:
             - ``get_alert_by_area``
+
+        :return: The area as a 2 letter uppercase abbreviation.
+        :rtype: str
         """
-        if not self.dvt.is_valid_area(area):
+        normalized = normalize_area(area)
+        if normalized is None:
             raise DataValidationError(area, f"Area: `{area}")
+        return normalized
     
     def check_if_valid_marine_region(self, marine_region):
-        if not self.dvt.is_valid_region(marine_region):
+        """Checks to see if it's a valid marine region.
+
+        :return: The marine region as 2 uppercase letters.
+        :rtype: str
+        """
+        normalized = _NORMALIZERS['region'](marine_region)
+        if normalized is None:
             raise DataValidationError(marine_region, f'Region: `{marine_region}`')
+        return normalized
 
 
 class DataValidationTable:
@@ -150,23 +156,16 @@ class DataValidationTable:
         :return: True if it's a valid area, false otherwise
         :rtype: bool
         """
-        # Note that fsabbr handles .title() functionality.
-        if len(area) != 2: # is not a 2 letter abbreviation, make it a 2 letter.
-            area = fsabbr(area)
-        
-        if area in valid_areas():
-            return True
-        
-        return False
+        return normalize_area(area) is not None
     
     @staticmethod
     def is_valid_product(product):
         """Checks to ensure that the product is a valid product.
         
         .. note::
-            The capitalization and spelling _must_ be the same. Under the hood,
-            it's a string comparison, and it doesn't take into account spelling
-            errors.
+            The spelling _must_ be the same (capitalization doesn't matter).
+            Under the hood, it's a string comparison, and it doesn't take into
+            account spelling errors.
             
         See the Data Validation Table section of the documentation for
         a full and complete list of valid entries.
@@ -176,10 +175,7 @@ class DataValidationTable:
         :return: True if it's valid, False otherwise.
         :rtype: bool
         """
-        if product in valid_products():
-            return True
-        
-        return False
+        return _NORMALIZERS['event'](product) is not None
 
     @staticmethod
     def is_valid_certainty(certainty):
@@ -193,10 +189,7 @@ class DataValidationTable:
         :return: True if it's valid, False otherwise.
         :rtype: bool
         """
-        if certainty in valid_certainties():
-            return True
-        
-        return False
+        return _NORMALIZERS['certainty'](certainty) is not None
     
     @staticmethod
     def is_valid_message_type(message_type):
@@ -210,45 +203,32 @@ class DataValidationTable:
         :return: True if it's valid, False otherwise.
         :rtype: bool
         """
-        if message_type in valid_message_types():
-            return True
-        
-        return False
+        return _NORMALIZERS['message_type'](message_type) is not None
 
     @staticmethod
     def is_valid_region(region):
         # TODO: Add in docstring similar to above.
-        if region in valid_regions():
-            return True
-        return False
+        return _NORMALIZERS['region'](region) is not None
     
     @staticmethod
     def is_valid_region_type(region_type):
         # TODO: Add in docstring similar to above.
-        if region_type in valid_region_types():
-            return True
-        return False
+        return _NORMALIZERS['region_type'](region_type) is not None
     
     @staticmethod 
     def is_valid_severity(severity):
         # TODO: Add in docstring similar to above.
-        if severity in valid_severity():
-            return True
-        return False
+        return _NORMALIZERS['severity'](severity) is not None
     
     @staticmethod
     def is_valid_status(status):
         # TODO: Add in docstring similar to above.
-        if status in valid_status():
-            return True
-        return False
+        return _NORMALIZERS['status'](status) is not None
     
     @staticmethod
     def is_valid_urgency(urgency):
         # TODO: Add in docstring similar to above.
-        if urgency in valid_urgency():
-            return True
-        return False
+        return _NORMALIZERS['urgency'](urgency) is not None
 
 # these functions aren't built into the above class for a few reasons:
 #   1. Maybe the users want to breach outside of the entrypoint and use
@@ -389,3 +369,64 @@ def valid_products():
             'Wind Chill Watch', 'Winter Storm Warning', 'Winter Storm Watch', 
             'Winter Weather Advisory'
             ]
+
+
+# The data validation tables, built once. Each is a frozenset of the valid
+# values as they're written in the table, plus a lookup from the case-folded
+# value to that, so checks are a hash lookup regardless of case.
+VALID_AREAS = frozenset(valid_areas())
+VALID_CERTAINTIES = frozenset(valid_certainties())
+VALID_MESSAGE_TYPES = frozenset(valid_message_types())
+VALID_PRODUCTS = frozenset(valid_products())
+VALID_REGIONS = frozenset(valid_regions())
+VALID_REGION_TYPES = frozenset(valid_region_types())
+VALID_SEVERITIES = frozenset(valid_severity())
+VALID_STATUSES = frozenset(valid_status())
+VALID_URGENCIES = frozenset(valid_urgency())
+
+_CASE_FOLDED = {table: {value.casefold(): value for value in table} for table in
+                (VALID_AREAS, VALID_CERTAINTIES, VALID_MESSAGE_TYPES, VALID_PRODUCTS,
+                 VALID_REGIONS, VALID_REGION_TYPES, VALID_SEVERITIES, VALID_STATUSES,
+                 VALID_URGENCIES)}
+
+# Full state names (case-folded) to their 2 letter abbreviations.
+_AREA_NAMES = {name.casefold(): abbr for name, abbr in full_state.items()
+               if abbr in VALID_AREAS}
+
+def _normalizer(table):
+    # A function returning a value as it's written in the table, or None if
+    # it isn't in it.
+    lookup = _CASE_FOLDED[table]
+
+    def normalize(value):
+        if not isinstance(value, str):
+            return None
+        return lookup.get(value.casefold())
+    return normalize
+
+def normalize_area(area):
+    """Returns an area as its 2 letter uppercase abbreviation.
+
+    :param area: The 2 letter abbreviation or full name of a state (any case).
+    :type area: str
+    :return: The abbreviation, or None if it isn't a valid area.
+    :rtype: str or None
+    """
+    if not isinstance(area, str):
+        return None
+    if len(area) == 2:
+        return _CASE_FOLDED[VALID_AREAS].get(area.casefold())
+    return _AREA_NAMES.get(area.casefold())
+
+# How each parameter of ``get_alerts``/``get_active_alerts`` is checked.
+_NORMALIZERS = {
+    'area': normalize_area,
+    'certainty': _normalizer(VALID_CERTAINTIES),
+    'event': _normalizer(VALID_PRODUCTS),
+    'message_type': _normalizer(VALID_MESSAGE_TYPES),
+    'region': _normalizer(VALID_REGIONS),
+    'region_type': _normalizer(VALID_REGION_TYPES),
+    'severity': _normalizer(VALID_SEVERITIES),
+    'status': _normalizer(VALID_STATUSES),
+    'urgency': _normalizer(VALID_URGENCIES),
+}
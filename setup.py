@@ -24,12 +24,16 @@ setup(
   download_url = f'https://github.com/WxBDM/nwsapy/archive/refs/tags/v{version}.tar.gz',    # I explain this later on
   keywords = ['national weather service', 'nws', 'nws api'],   # Keywords that define your package best
   install_requires=[        # dependencies requried for the package.
-          'shapely>=1.7.1',
+          'shapely>=2.0',
           'pandas>=1.2.4',
           'numpy>=1.20.3',
           'pint>=0.17',
           'requests>=2.25.1'
       ],
+  extras_require={          # optional dependencies, i.e. pip install nwsapy[async]
+          'async': ['aiohttp>=3.8'],
+          'fast': ['orjson>=3.6'],
+      },
   python_requires = '>=3.8',
   classifiers=[
     'Development Status :: 3 - Alpha',      # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
@@ -0,0 +1,231 @@
+"""A local stub of the NWS API for the tests, so they don't depend on
+api.weather.gov. Responses are canned JSON served over plain HTTP on a random
+localhost port, and ``redirect`` points an ``NWSAPy``/``AsyncNWSAPy`` object
+at it::
+
+    with StubServer() as server:
+        api = NWSAPy()
+        redirect(api, server)
+        server.routes['/glossary'] = glossary_payload()
+        glossary = api.get_glossary()
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+API_URL = 'https://api.weather.gov'
+
+EVENTS = ['Tornado Warning', 'Flood Watch', 'Winter Storm Warning',
+          'Heat Advisory', 'Special Weather Statement']
+SEVERITIES = ['Extreme', 'Severe', 'Moderate', 'Minor', 'Unknown']
+URGENCIES = ['Immediate', 'Expected', 'Future']
+AREAS = ['FL', 'TX', 'OK']
+BASE_TIME = datetime(2026, 10, 17, 12, 0, tzinfo = timezone(timedelta(hours = -5)))
+
+
+class Route:
+    """A canned response: a status, a JSON-serializable payload and headers."""
+
+    def __init__(self, payload, status = 200, headers = None):
+        self.payload = payload
+        self.status = status
+        self.headers = dict(headers or {})
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+    server_version = 'stub'
+
+    def do_GET(self):
+        stub = self.server.stub
+        path = unquote(self.path.split('?')[0])
+        with stub.lock:
+            stub.requests.append((self.path, dict(self.headers), self.client_address))
+        route = stub.route_for(path, self)
+        if route is None:
+            route = Route({'correlationId': 'stub', 'title': 'Not Found',
+                           'status': 404, 'detail': self.path}, status = 404)
+        if not isinstance(route, Route):
+            route = Route(route)
+
+        body = b'' if route.status == 304 else json.dumps(route.payload).encode()
+        self.send_response(route.status)
+        self.send_header('Content-Type', 'application/geo+json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in route.headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """Runs the stub on a random localhost port in a background thread.
+
+    ``routes`` maps a path to a payload, a ``Route``, or a function that takes
+    the request handler and returns either. Paths without a route get a 404
+    problem response, as from the API. ``requests`` holds the path, headers
+    and client address of every request made.
+    """
+
+    def __init__(self, routes = None):
+        self.routes = dict(routes or {})
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def route_for(self, path, handler):
+        route = self.routes.get(path)
+        if route is None:
+            # the longest route ending in '/' that the path starts with.
+            prefixes = [p for p in self.routes if p.endswith('/') and path.startswith(p)]
+            if prefixes:
+                route = self.routes[max(prefixes, key = len)]
+        return route(handler) if callable(route) else route
+
+    def paths(self):
+        """The paths (without the query) that were requested, in order."""
+        with self.lock:
+            return [unquote(path.split('?')[0]) for path, _, _ in self.requests]
+
+    def __enter__(self):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub = self
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        self._thread = threading.Thread(target = self.httpd.serve_forever,
+                                        kwargs = {'poll_interval': 0.01},
+                                        daemon = True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def redirect(api, server):
+    """Sends the requests of an ``NWSAPy``/``AsyncNWSAPy`` object to the stub
+    server instead of api.weather.gov.
+    """
+    for name in ('_request', '_stream_alerts'):
+        setattr(api, name, _redirected(getattr(api, name), server))
+    return api
+
+
+def _redirected(method, server):
+    if asyncio.iscoroutinefunction(method):
+        async def redirected(url, *args, **kwargs):
+            return await method(url.replace(API_URL, server.url), *args, **kwargs)
+    else:
+        def redirected(url, *args, **kwargs):
+            return method(url.replace(API_URL, server.url), *args, **kwargs)
+    return redirected
+
+
+def iso(time):
+    return None if time is None else time.isoformat()
+
+
+def alert_feature(i, geometry = True, sent = None):
+    """An alert feature. Every third alert has no geometry, like zone based
+    alerts from the API. The rest are a 0.5 degree square.
+    """
+    sent = sent or BASE_TIME + timedelta(minutes = i)
+    lon, lat = -100 + i % 40, 30 + i % 15
+    polygon = {'type': 'Polygon',
+               'coordinates': [[[lon, lat], [lon + 0.5, lat], [lon + 0.5, lat + 0.5],
+                                [lon, lat + 0.5], [lon, lat]]]}
+    area = AREAS[i % 3]
+    zones = [f'{area}Z{100 + i % 50:03d}', f'{area}C{i % 7:03d}']
+    alert_id = f'urn:oid:2.49.0.1.840.0.{i:08x}.001.1'
+    return {
+        'id': f'{API_URL}/alerts/{alert_id}',
+        'type': 'Feature',
+        'geometry': polygon if geometry and i % 3 else None,
+        'properties': {
+            '@id': f'{API_URL}/alerts/{alert_id}',
+            '@type': 'wx:Alert',
+            'id': alert_id,
+            'areaDesc': '; '.join(f'County {zone}' for zone in zones),
+            'geocode': {'SAME': ['012345'], 'UGC': zones},
+            'affectedZones': [f'{API_URL}/zones/forecast/{zone}' for zone in zones],
+            'references': [],
+            'sent': iso(sent),
+            'effective': iso(sent),
+            'onset': iso(sent + timedelta(minutes = 10)),
+            'expires': iso(sent + timedelta(hours = 1 + i % 4)),
+            'ends': iso(sent + timedelta(hours = 2 + i % 5)) if i % 2 else None,
+            'status': 'Actual',
+            'messageType': 'Alert',
+            'category': 'Met',
+            'severity': SEVERITIES[i % 5],
+            'certainty': 'Likely',
+            'urgency': URGENCIES[i % 3],
+            'event': EVENTS[i % 5],
+            'sender': 'w-nws.webmaster@noaa.gov',
+            'senderName': f'NWS Office {area}',
+            'headline': f'Alert {i}',
+            'description': 'A description of the hazard.',
+            'instruction': 'Take the recommended actions.',
+            'response': 'Shelter',
+            'parameters': {'NWSheadline': ['HEADLINE']},
+        },
+    }
+
+
+def alerts_payload(n = 50, start = 0, next_url = None, **kwargs):
+    """An ``/alerts`` response with ``n`` features."""
+    payload = {'@context': [], 'type': 'FeatureCollection',
+               'features': [alert_feature(i, **kwargs) for i in range(start, start + n)],
+               'title': 'Current watches, warnings, and advisories',
+               'updated': iso(BASE_TIME)}
+    if next_url is not None:
+        payload['pagination'] = {'next': next_url}
+    return payload
+
+
+def point_payload(lat = 33.0, lon = -90.0, grid = (47, 51)):
+    """A ``/points/{lat},{lon}`` response."""
+    x, y = grid
+    return {'properties': {
+        '@id': f'{API_URL}/points/{lat},{lon}', '@type': 'wx:Point',
+        'cwa': 'JAN', 'forecastOffice': f'{API_URL}/offices/JAN',
+        'gridId': 'JAN', 'gridX': x, 'gridY': y,
+        'forecast': f'{API_URL}/gridpoints/JAN/{x},{y}/forecast',
+        'forecastHourly': f'{API_URL}/gridpoints/JAN/{x},{y}/forecast/hourly',
+        'forecastGridData': f'{API_URL}/gridpoints/JAN/{x},{y}',
+        'observationStations': f'{API_URL}/gridpoints/JAN/{x},{y}/stations',
+        'relativeLocation': {'properties': {'city': 'Yazoo City', 'state': 'MS',
+                                            'distance': {'value': 1024.2},
+                                            'bearing': {'value': 131}}},
+        'forecastZone': f'{API_URL}/zones/forecast/MSZ041',
+        'county': f'{API_URL}/zones/county/MSC163',
+        'fireWeatherZone': f'{API_URL}/zones/fire/MSZ041',
+        'timeZone': 'America/Chicago', 'radarStation': 'KDGX'}}
+
+
+def glossary_payload(n = 3):
+    """A ``/glossary`` response with ``n`` terms."""
+    return {'glossary': [{'term': f'Term {i}', 'definition': f'Definition {i}.'}
+                         for i in range(n)]}
+
+
+def count_payload():
+    """An ``/alerts/active/count`` response."""
+    return {'total': 10, 'land': 8, 'marine': 2,
+            'regions': {'AL': 1, 'GM': 1},
+            'areas': {'TX': 3, 'FL': 4, 'OK': 1, 'AM': 2},
+            'zones': {'TXZ001': 1, 'TXZ002': 2, 'FLZ100': 3, 'FLC001': 1, 'AMZ250': 2}}
+
+
+def error_payload(status = 500):
+    """A problem response from the API."""
+    return Route({'correlationId': 'stub', 'title': 'Error', 'status': status,
+                  'detail': 'Something went wrong.'}, status = status)
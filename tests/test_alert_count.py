@@ -0,0 +1,95 @@
+import unittest
+
+import numpy as np
+
+from nwsapy.core.errors import DataValidationError
+from nwsapy.services import set_data
+from tests.stub_api import count_payload, error_payload
+
+
+def payload():
+    values = count_payload()
+    for i in range(300):
+        values['zones'][f'{("TX", "FL", "OK", "GM")[i % 4]}{"ZC"[i % 2]}{i:03d}'] = 1 + i % 5
+    return values
+
+
+def brute_force(counts, codes, check = lambda code: code):
+    found = {}
+    for code in codes:
+        code = code.upper()
+        if code.endswith('*'):
+            found.update({c: n for c, n in counts.items() if c.startswith(code[:-1])})
+        else:
+            found[check(code)] = counts.get(check(code), 0)
+    return found
+
+
+class TestAlertCountFilters(unittest.TestCase):
+
+    def setUp(self):
+        self.count = set_data.for_alert_count((payload(), {}))
+
+    def test_filter_zones(self):
+        zones = self.count.values['zones']
+        queries = [['TXZ001'], 'TXZ002', ['TXZ*'], ['txc*', 'FLZ100'], ['GM*', 'OKZ999'],
+                   ['*'], ['TXZ0*', 'TXZ001'], [], ['AKZ*']]
+        for codes in queries:
+            expected = brute_force(zones, [codes] if isinstance(codes, str) else codes)
+            self.assertEqual(self.count.filter_zones(codes), expected, codes)
+
+    def test_filter_land_areas(self):
+        self.assertEqual(self.count.filter_land_areas('TX'), {'TX': 3})
+        self.assertEqual(self.count.filter_land_areas(['Florida', 'ok', 'KS']),
+                         {'FL': 4, 'OK': 1, 'KS': 0})
+        self.assertEqual(self.count.filter_land_areas('A*'), {'AM': 2})
+        with self.assertRaises(DataValidationError):
+            self.count.filter_land_areas('XX')
+
+    def test_filter_marine_regions(self):
+        self.assertEqual(self.count.filter_marine_regions(['gm', 'PA']), {'GM': 1, 'PA': 0})
+        self.assertEqual(self.count.filter_marine_regions('*'), {'AL': 1, 'GM': 1})
+        with self.assertRaises(DataValidationError):
+            self.count.filter_marine_regions('TX')
+
+    def test_changed_in_place_then_invalidated(self):
+        self.assertEqual(self.count.filter_zones('TXZ*')['TXZ001'], 1)
+        zones = self.count.values['zones']
+        zones['TXZ001'] = 5            # a count changed in place is seen.
+        self.assertEqual(self.count.filter_zones('TXZ*')['TXZ001'], 5)
+        zones['TXZ777'] = 2
+        del zones['TXZ002']
+        self.count.invalidate()
+        self.assertEqual(self.count.filter_zones('TXZ*'), brute_force(zones, ['TXZ*']))
+        self.assertIn('TXZ777', self.count.filter_zones('TXZ7*'))
+
+    def test_values_set_again(self):
+        self.count.filter_zones('TXZ*')
+        self.count.values = dict(payload(), zones = {'TXZ500': 1})
+        self.assertEqual(self.count.filter_zones('TXZ*'), {'TXZ500': 1})
+
+    def test_errors(self):
+        count = set_data.for_alert_count((error_payload(500).payload, {}))
+        self.assertTrue(count.has_any_request_errors)
+        self.assertEqual(count.filter_zones('TXZ*'), {})
+        self.assertEqual(count.filter_land_areas('TX'), {})
+
+
+class TestAlertCountToDf(unittest.TestCase):
+
+    def test_layout(self):
+        values = payload()
+        df = set_data.for_alert_count((values, {})).to_df()
+        self.assertEqual(list(df.columns), ['kind', 'code', 'count'])
+        self.assertEqual(list(df['kind'].cat.categories), ['area', 'region', 'zone'])
+        self.assertEqual(df['count'].dtype, np.int64)
+        self.assertEqual(len(df), len(values['areas']) + len(values['regions']) + len(values['zones']))
+        rows = {(kind, code): n for kind, code, n in zip(df['kind'], df['code'], df['count'])}
+        for kind, key in (('area', 'areas'), ('region', 'regions'), ('zone', 'zones')):
+            for code, n in values[key].items():
+                self.assertEqual(rows[(kind, code)], n)
+
+    def test_errors(self):
+        df = set_data.for_alert_count((error_payload(500).payload, {})).to_df()
+        self.assertEqual(len(df), 1)
+        self.assertEqual(df['status'][0], 500)
@@ -0,0 +1,133 @@
+import copy
+import pickle
+import unittest
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from nwsapy.endpoints.alerts import AlertRow, AlertTable, IndividualAlert
+from tests.stub_api import alert_feature, alerts_payload
+
+
+def baseline_df(features):
+    # How BaseAlert.to_df() built the dataframe before AlertTable: one
+    # IndividualAlert per alert.
+    d = OrderedDict()
+    for index, feature in enumerate(features):
+        d[index] = IndividualAlert(feature).to_dict()
+    df = pd.DataFrame.from_dict(d).transpose()
+    df = df.reindex(sorted(df.columns), axis = 1)
+    return df.fillna(value = np.nan)
+
+
+def same_value(a, b):
+    if not isinstance(a, (list, dict)) and not isinstance(b, (list, dict)) \
+            and pd.isna(a) and pd.isna(b):
+        return True
+    return a == b
+
+
+class TestAlertTable(unittest.TestCase):
+
+    def setUp(self):
+        self.features = alerts_payload(30)['features']
+        self.table = AlertTable(self.features)
+
+    def test_rows(self):
+        self.assertEqual(len(self.table), 30)
+        rows = list(self.table)
+        self.assertTrue(all(isinstance(row, AlertRow) for row in rows))
+        self.assertIs(self.table[3], rows[3])
+        self.assertIs(self.table[-1], rows[29])
+        self.assertEqual(self.table[2:5], rows[2:5])
+
+    def test_rows_match_individual_alerts(self):
+        for row, feature in zip(self.table, self.features):
+            alert = IndividualAlert(feature)
+            self.assertEqual(row.to_dict(), alert.to_dict())
+            self.assertEqual(list(row.to_dict()), list(alert.to_dict()))
+            self.assertEqual(row.sent, alert.sent)
+            self.assertEqual(row.sent.utcoffset(), alert.sent.utcoffset())
+            self.assertEqual(row.polygon, alert.polygon)
+
+    def test_typed_columns(self):
+        self.assertEqual(self.table.columns['sent_utc'].dtype, np.dtype('datetime64[ns]'))
+        self.assertNotIn('sent', self.table.columns)
+        self.assertIsInstance(self.table.columns['event'], pd.Categorical)
+        self.assertEqual(self.table.value('event', 1), 'Flood Watch')
+        self.assertEqual(self.table.columns['headline'].dtype, object)
+        # even alerts don't end.
+        self.assertTrue(np.isnat(self.table.columns['ends_utc'][0]))
+        self.assertIsNone(self.table[0].ends)
+
+    def test_missing_categorical_value(self):
+        self.features[1]['properties']['severity'] = None
+        table = AlertTable(self.features)
+        self.assertIsNone(table.value('severity', 1))
+        self.assertIsNone(table[1].severity)
+
+    def test_feature_round_trip(self):
+        for i, feature in enumerate(self.features):
+            self.assertEqual(IndividualAlert(self.table.feature(i)).to_dict(),
+                             IndividualAlert(feature).to_dict())
+            self.assertEqual(self.table.feature(i)['properties']['sent'],
+                             feature['properties']['sent'])
+
+    def test_unknown_property(self):
+        self.features[4]['properties']['newProperty'] = 'new'
+        table = AlertTable(self.features)
+        self.assertEqual(table[4].newProperty, 'new')
+        self.assertIsNone(table[5].newProperty)
+        with self.assertRaises(AttributeError):
+            table[4].not_a_property
+
+    def test_to_df_matches_the_baseline(self):
+        df, baseline = self.table.to_df(), baseline_df(self.features)
+        self.assertEqual(list(df.columns), list(baseline.columns))
+        self.assertEqual(len(df), len(baseline))
+        for name in df.columns:
+            for i in range(len(df)):
+                self.assertTrue(same_value(df[name][i], baseline[name][i]),
+                                f'{name}[{i}]: {df[name][i]!r} != {baseline[name][i]!r}')
+
+    def test_to_df_without_derived_columns(self):
+        df = self.table.to_df(derived = False)
+        self.assertEqual(list(df.columns), sorted(df.columns))
+        for name in ('sent', 'points', 'polygon', 'affected_zones', 'sender_name'):
+            self.assertNotIn(name, df.columns)
+        self.assertEqual(str(df['sent_utc'].dtype), 'datetime64[ns, UTC]')
+        self.assertEqual(str(df['event'].dtype), 'category')
+        self.assertEqual(df['sent_utc'][0], self.table[0].sent_utc)
+
+    def test_empty(self):
+        table = AlertTable([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(list(table), [])
+        self.assertEqual(len(table.to_df()), 0)
+
+
+class TestAlertRowCopies(unittest.TestCase):
+
+    def setUp(self):
+        self.table = AlertTable(alerts_payload(5)['features'])
+        self.row = self.table[1]
+
+    def check(self, alert):
+        self.assertIs(type(alert), IndividualAlert)
+        self.assertEqual(alert.to_dict(), self.row.to_dict())
+
+    def test_copy(self):
+        self.check(copy.copy(self.row))
+
+    def test_deepcopy(self):
+        self.check(copy.deepcopy(self.row))
+
+    def test_pickle(self):
+        data = pickle.dumps(self.row)
+        self.check(pickle.loads(data))
+        # the rest of the table isn't pickled with it.
+        self.assertLess(len(data), len(pickle.dumps(self.table[0:5])) / 3)
+
+    def test_feature_of_a_single_alert(self):
+        self.assertEqual(IndividualAlert(alert_feature(1)).to_dict(), self.row.to_dict())
@@ -0,0 +1,129 @@
+import unittest
+from datetime import timedelta
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.core.inheritance.request_error import RequestError
+from nwsapy.endpoints.alerts import IndividualAlert
+from nwsapy.services.alert_watch import AlertWatcher
+from tests.stub_api import BASE_TIME, Route, StubServer, alert_feature, error_payload, redirect
+
+
+def features(ids, changed = ()):
+    result = [alert_feature(i) for i in ids]
+    for feature in result:
+        if int(feature['properties']['headline'].split()[-1]) in changed:
+            feature['properties']['headline'] += ' (changed)'
+    return result
+
+
+def alert_id(i):
+    return alert_feature(i)['properties']['id']
+
+
+class TestAlertWatcher(unittest.TestCase):
+
+    def test_first_poll_is_all_added(self):
+        changes = AlertWatcher().diff(features(range(3)))
+        self.assertEqual([c.type for c in changes], ['added'] * 3)
+        self.assertEqual([c.id for c in changes], [alert_id(i) for i in range(3)])
+        self.assertIsInstance(changes[0].alert, IndividualAlert)
+
+    def test_added_updated_removed(self):
+        watcher = AlertWatcher()
+        watcher.diff(features(range(4)))
+        changes = watcher.diff(features([1, 2, 3, 4], changed = [2]))
+        self.assertEqual([(c.type, c.id) for c in changes],
+                         [('updated', alert_id(2)), ('added', alert_id(4)),
+                          ('removed', alert_id(0))])
+        self.assertEqual(changes[0].alert.headline, 'Alert 2 (changed)')
+        self.assertIsNone(changes[2].alert)
+
+    def test_sent_again_is_updated(self):
+        watcher = AlertWatcher()
+        watcher.diff(features([1]))
+        again = [alert_feature(1, sent = BASE_TIME + timedelta(hours = 1))]
+        self.assertEqual([c.type for c in watcher.diff(again)], ['updated'])
+
+    def test_nothing_changed(self):
+        watcher = AlertWatcher()
+        watcher.diff(features(range(3)))
+        # the same alerts, in another order and with the keys in another order.
+        reordered = [dict(reversed(list(f.items()))) for f in reversed(features(range(3)))]
+        self.assertEqual(watcher.diff(reordered), [])
+        self.assertEqual(len(watcher.state), 3)
+
+    def test_everything_removed(self):
+        watcher = AlertWatcher()
+        watcher.diff(features(range(2)))
+        self.assertEqual([c.type for c in watcher.diff([])], ['removed'] * 2)
+        self.assertEqual(watcher.state, {})
+
+
+def polls():
+    # The responses of /alerts/active, one per poll, then 304s.
+    responses = [
+        Route({'features': features(range(3))}, headers = {'ETag': '"1"'}),
+        Route(None, status = 304, headers = {'ETag': '"1"'}),
+        Route({'features': features([1, 2, 3], changed = [1])}, headers = {'ETag': '"2"'}),
+        error_payload(500),
+        # a new ETag, but the same alerts.
+        Route({'features': features([1, 2, 3], changed = [1])}, headers = {'ETag': '"3"'}),
+        Route({'features': features([1, 2, 3, 4], changed = [1])}, headers = {'ETag': '"4"'}),
+    ]
+
+    def route(handler):
+        if responses:
+            return responses.pop(0)
+        return Route(None, status = 304, headers = {'ETag': '"4"'})
+    return route
+
+
+EXPECTED = [('added', alert_id(0)), ('added', alert_id(1)), ('added', alert_id(2)),
+            ('updated', alert_id(1)), ('added', alert_id(3)), ('removed', alert_id(0)),
+            ('error', None),
+            ('added', alert_id(4))]
+
+
+def describe(change):
+    if isinstance(change, RequestError):
+        return ('error', None)
+    return (change.type, change.id)
+
+
+class TestWatchActiveAlerts(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': polls()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_changes(self):
+        seen = []
+        for change in self.api.watch_active_alerts(interval = 0):
+            seen.append(describe(change))
+            if len(seen) == len(EXPECTED):
+                break
+        self.assertEqual(seen, EXPECTED)
+        headers = [headers for _, headers, _ in self.server.requests]
+        self.assertEqual([h.get('If-None-Match') for h in headers[:6]],
+                         [None, '"1"', '"1"', '"2"', '"2"', '"3"'])
+
+
+class TestAsyncWatchActiveAlerts(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': polls()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def test_changes(self):
+        seen = []
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            # an asynchronous generator, it isn't awaited.
+            async for change in api.watch_active_alerts(interval = 0):
+                seen.append(describe(change))
+                if len(seen) == len(EXPECTED):
+                    break
+        self.assertEqual(seen, EXPECTED)
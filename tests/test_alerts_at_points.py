@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+from shapely.geometry import Point
+
+from nwsapy.endpoints.alerts import ActiveAlerts, IndividualAlert
+from nwsapy.services import set_data
+from tests.stub_api import alerts_payload, error_payload
+
+
+def brute_force(alerts, lats, lons):
+    pairs = []
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        for j, alert in enumerate(alerts):
+            if alert.polygon is not None and alert.polygon.intersects(Point(lon, lat)):
+                pairs.append((i, j))
+    return pairs
+
+
+class TestAlertsAtPoints(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.alerts = set_data.for_active_alerts((alerts_payload(200), {}))
+        rng = np.random.default_rng(0)
+        # some of them well outside of every alert.
+        cls.lats = rng.uniform(25, 50, 1000)
+        cls.lons = rng.uniform(-105, -55, 1000)
+        cls.expected = brute_force(cls.alerts, cls.lats, cls.lons)
+
+    def check(self, alerts, **kwargs):
+        point_index, alert_index = alerts.alerts_at_points(self.lats, self.lons, **kwargs)
+        self.assertEqual(point_index.dtype, np.int64)
+        self.assertEqual(list(zip(point_index.tolist(), alert_index.tolist())), self.expected)
+
+    def test_matches_brute_force(self):
+        self.check(self.alerts)
+
+    def test_chunks(self):
+        self.check(self.alerts, chunk_size = 7)
+
+    def test_list_of_alerts(self):
+        alerts = ActiveAlerts()
+        alerts.values = [IndividualAlert(f) for f in alerts_payload(200)['features']]
+        alerts._set_iterator()
+        self.check(alerts)
+
+    def test_lists_of_floats(self):
+        point_index, alert_index = self.alerts.alerts_at_points([31.25, 10.0], [-98.75, 10.0])
+        # alerts 1 and 121.
+        self.assertEqual(point_index.tolist(), [0, 0])
+        self.assertEqual(alert_index.tolist(), [1, 121])
+
+    def test_alerts_for_a_location(self):
+        point_index, alert_index = self.alerts.alerts_at_points(self.lats, self.lons)
+        i = point_index[0]
+        self.assertEqual([self.alerts[j].id for j in alert_index[point_index == i]],
+                         [alert.id for alert in self.alerts.alerts_at(self.lats[i], self.lons[i])])
+
+    def test_no_matches(self):
+        for alerts in (set_data.for_active_alerts((alerts_payload(0), {})),
+                       set_data.for_active_alerts((error_payload(500).payload, {})),
+                       self.alerts):
+            point_index, alert_index = alerts.alerts_at_points([0.0], [0.0])
+            self.assertEqual((len(point_index), len(alert_index)), (0, 0))
@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from tests.stub_api import (StubServer, alerts_payload, error_payload, glossary_payload,
+                            point_payload, redirect)
+
+
+class TestAsyncNWSAPy(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/glossary': glossary_payload(),
+                                  '/points/': point_payload(),
+                                  '/alerts/active': alerts_payload(20),
+                                  '/alerts/active/count': error_payload(500)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def asyncSetUp(self):
+        self.api = redirect(AsyncNWSAPy(max_concurrency = 4), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    async def test_getters_are_awaitable(self):
+        glossary = await self.api.get_glossary()
+        self.assertEqual(dict(glossary.values), {f'Term {i}': f'Definition {i}.'
+                                                 for i in range(3)})
+        point = await self.api.get_point(33, -90)
+        self.assertEqual(point.grid_x, 47)
+
+    async def test_same_objects_as_sync(self):
+        sync_api = redirect(NWSAPy(), self.server)
+        sync_api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(sync_api.close)
+
+        alerts = await self.api.get_active_alerts()
+        sync_alerts = sync_api.get_active_alerts()
+        self.assertIs(type(alerts), type(sync_alerts))
+        self.assertEqual([alert.to_dict() for alert in alerts],
+                         [alert.to_dict() for alert in sync_alerts])
+
+    async def test_concurrent_requests(self):
+        points = await asyncio.gather(*[self.api.get_point(30 + i, -90)
+                                        for i in range(10)])
+        self.assertEqual(len(points), 10)
+        self.assertTrue(all(point.grid_id == 'JAN' for point in points))
+        self.assertEqual(self.server.paths().count('/points/30,-90'), 1)
+
+    async def test_api_errors_are_flagged(self):
+        count = await self.api.get_alert_count()
+        self.assertTrue(count.has_any_request_errors)
+        self.assertEqual(count.values['status'], 500)
+
+    async def test_context_manager_closes_the_session(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            await api.get_glossary()
+            session = api._session
+        self.assertTrue(session.closed)
+        self.assertIsNone(api._session)
@@ -0,0 +1,165 @@
+import time
+import unittest
+from email.utils import formatdate
+from unittest import mock
+
+from nwsapy import NWSAPy
+from nwsapy.services.cache import ResponseCache, canonical_url, ttl_from_headers
+from tests.stub_api import Route, StubServer, glossary_payload, point_payload, redirect
+
+
+class TestTTLFromHeaders(unittest.TestCase):
+
+    def test_max_age(self):
+        self.assertEqual(ttl_from_headers({'Cache-Control': 'public, max-age=60'}), 60)
+
+    def test_age_is_taken_off(self):
+        headers = {'Cache-Control': 'max-age=60', 'Age': '45'}
+        self.assertEqual(ttl_from_headers(headers), 15)
+        headers['Age'] = '90'
+        self.assertEqual(ttl_from_headers(headers), 0)
+
+    def test_s_maxage_is_ignored(self):
+        # s-maxage is for shared caches only.
+        headers = {'Cache-Control': 'public, max-age=60, s-maxage=120'}
+        self.assertEqual(ttl_from_headers(headers), 60)
+        self.assertEqual(ttl_from_headers({'Cache-Control': 's-maxage=120'}), 0)
+
+    def test_no_store_and_no_cache(self):
+        self.assertEqual(ttl_from_headers({'Cache-Control': 'no-store, max-age=60'}), 0)
+        self.assertEqual(ttl_from_headers({'Cache-Control': 'no-cache'}), 0)
+
+    def test_invalid_max_age(self):
+        self.assertEqual(ttl_from_headers({'Cache-Control': 'max-age=soon'}), 0)
+
+    def test_expires(self):
+        now = time.time()
+        headers = {'Expires': formatdate(now + 100, usegmt = True),
+                   'Date': formatdate(now, usegmt = True)}
+        self.assertAlmostEqual(ttl_from_headers(headers), 100, delta = 1)
+
+    def test_max_age_wins_over_expires(self):
+        headers = {'Cache-Control': 'max-age=5',
+                   'Expires': formatdate(time.time() + 100, usegmt = True)}
+        self.assertEqual(ttl_from_headers(headers), 5)
+
+    def test_invalid_expires_is_expired(self):
+        self.assertEqual(ttl_from_headers({'Expires': '0'}), 0)
+
+    def test_no_headers(self):
+        self.assertEqual(ttl_from_headers({}), 0)
+
+
+class TestCanonicalURL(unittest.TestCase):
+
+    def test_equivalent_urls(self):
+        self.assertEqual(canonical_url('HTTPS://API.weather.gov/points/33%2C-90/'),
+                         canonical_url('https://api.weather.gov/points/33,-90'))
+        self.assertEqual(canonical_url('https://api.weather.gov/alerts?b=2&a=1'),
+                         canonical_url('https://api.weather.gov/alerts?a=1&b=2'))
+
+    def test_different_urls(self):
+        self.assertNotEqual(canonical_url('https://api.weather.gov/alerts?a=1'),
+                            canonical_url('https://api.weather.gov/alerts?a=2'))
+
+
+class TestResponseCache(unittest.TestCase):
+
+    headers = {'Cache-Control': 'max-age=60'}
+
+    def test_get_decodes_a_new_copy(self):
+        cache = ResponseCache()
+        cache.set('https://api.weather.gov/glossary', b'{"a": [1]}', self.headers)
+        first, headers = cache.get('https://api.weather.gov/glossary/')
+        second, _ = cache.get('https://api.weather.gov/glossary')
+        self.assertEqual(first, {'a': [1]})
+        self.assertEqual(headers, self.headers)
+        self.assertIsNot(first, second)
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+
+    def test_miss(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get('https://api.weather.gov/glossary'))
+        self.assertEqual(cache.misses, 1)
+
+    def test_not_cacheable_is_not_kept(self):
+        cache = ResponseCache()
+        cache.set('https://api.weather.gov/glossary', b'{}', {'Cache-Control': 'no-store'})
+        self.assertEqual(len(cache), 0)
+
+    def test_expires(self):
+        cache = ResponseCache()
+        with mock.patch('nwsapy.services.cache.time.monotonic', return_value = 1000):
+            cache.set('https://api.weather.gov/glossary', b'{}', self.headers)
+        with mock.patch('nwsapy.services.cache.time.monotonic', return_value = 1059):
+            self.assertIn('https://api.weather.gov/glossary', cache)
+        with mock.patch('nwsapy.services.cache.time.monotonic', return_value = 1060):
+            self.assertNotIn('https://api.weather.gov/glossary', cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_is_dropped(self):
+        cache = ResponseCache(maxsize = 2)
+        for name in ('a', 'b'):
+            cache.set(f'https://api.weather.gov/{name}', b'{}', self.headers)
+        cache.get('https://api.weather.gov/a')
+        cache.set('https://api.weather.gov/c', b'{}', self.headers)
+        self.assertIn('https://api.weather.gov/a', cache)
+        self.assertNotIn('https://api.weather.gov/b', cache)
+        self.assertIn('https://api.weather.gov/c', cache)
+
+    def test_ttl_overrides(self):
+        cache = ResponseCache(ttl = {'/points': 3600, '/points/1': 0})
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/points/33,-90', {}), 3600)
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/points/1,2', self.headers), 0)
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/glossary', self.headers), 60)
+
+    def test_clear(self):
+        cache = ResponseCache()
+        cache.set('https://api.weather.gov/glossary', b'{}', self.headers)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestNWSAPyCache(unittest.TestCase):
+
+    def setUp(self):
+        cache_control = {'Cache-Control': 'public, max-age=60'}
+        self.server = StubServer({'/glossary': Route(glossary_payload(), headers = cache_control),
+                                  '/points/': point_payload()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_fresh_responses_are_not_requested_again(self):
+        self.api.set_cache()
+        first = self.api.get_glossary()
+        second = self.api.get_glossary()
+        self.assertEqual(self.server.paths(), ['/glossary'])
+        self.assertEqual(dict(first.values), dict(second.values))
+        stats = self.api.stats()
+        self.assertEqual((stats['cache_hits'], stats['cache_misses']), (1, 1))
+
+    def test_uncacheable_responses_are_requested_again(self):
+        self.api.set_cache()
+        self.api.get_point(33, -90)
+        self.api.get_point(33, -90)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_ttl_override(self):
+        self.api.set_cache(ttl = {'/points': 3600})
+        self.api.get_point(33, -90)
+        self.api.get_point(33, -90)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_clear_cache(self):
+        self.api.set_cache()
+        self.api.get_glossary()
+        self.api.clear_cache()
+        self.api.get_glossary()
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_off_by_default(self):
+        self.api.get_glossary()
+        self.api.get_glossary()
+        self.assertEqual(len(self.server.requests), 2)
@@ -0,0 +1,151 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.services.cache import DiskCache
+from tests.stub_api import StubServer, glossary_payload, point_payload, redirect
+
+
+class ThreadRecordingDiskCache(DiskCache):
+    # Records the threads the database is used from.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def get_entry(self, url):
+        self.threads.add(threading.current_thread())
+        return super().get_entry(url)
+
+    def set(self, url, content, headers):
+        self.threads.add(threading.current_thread())
+        super().set(url, content, headers)
+
+
+class TestDiskCache(unittest.TestCase):
+
+    headers = {'Cache-Control': 'max-age=60'}
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cache.sqlite')
+
+    def test_len_counts_the_stored_responses(self):
+        cache = DiskCache(self.path)
+        self.assertEqual(len(cache), 0)
+        cache.set('https://api.weather.gov/points/33,-90', b'{"a": 1}', {})
+        cache.set('https://api.weather.gov/zones/1', b'{"b": 2}', self.headers)
+        self.assertEqual(len(cache), 2)
+
+    def test_byte_limit_is_max_bytes(self):
+        cache = DiskCache(self.path, max_bytes = 1000)
+        self.assertEqual(cache.max_bytes, 1000)
+        self.assertFalse(hasattr(cache, 'maxsize'))
+
+    def test_survives_a_restart(self):
+        DiskCache(self.path).set('https://api.weather.gov/glossary', b'{"a": 1}', {})
+        cache = DiskCache(self.path)
+        values, headers = cache.get('https://api.weather.gov/glossary/')
+        self.assertEqual(values, {'a': 1})
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_default_ttls(self):
+        cache = DiskCache(self.path)
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/points/33,-90', {}), 7 * 86400)
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/alerts/types', {}), 86400)
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/alerts/active', self.headers), 0)
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/zones/1', self.headers), 60)
+        cache = DiskCache(self.path, ttl = {'/alerts': 30})
+        self.assertEqual(cache.ttl_for('https://api.weather.gov/alerts/active', {}), 30)
+
+    def test_expires(self):
+        cache = DiskCache(self.path)
+        with mock.patch('nwsapy.services.cache.time.time', return_value = 1000):
+            cache.set('https://api.weather.gov/zones/1', b'{}', self.headers)
+        with mock.patch('nwsapy.services.cache.time.time', return_value = 1060):
+            self.assertIsNone(cache.get('https://api.weather.gov/zones/1'))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_are_removed_over_max_bytes(self):
+        cache = DiskCache(self.path, max_bytes = 250)
+        body = b'x' * 100
+        with mock.patch('nwsapy.services.cache.time.time', return_value = 1000):
+            cache.set('https://api.weather.gov/points/1,1', body, {})
+        with mock.patch('nwsapy.services.cache.time.time', return_value = 1001):
+            cache.set('https://api.weather.gov/points/2,2', body, {})
+        with mock.patch('nwsapy.services.cache.time.time', return_value = 1002):
+            cache.get_entry('https://api.weather.gov/points/1,1')
+        with mock.patch('nwsapy.services.cache.time.time', return_value = 1003):
+            cache.set('https://api.weather.gov/points/3,3', body, {})
+            self.assertEqual(len(cache), 2)
+            self.assertIn('https://api.weather.gov/points/1,1', cache)
+            self.assertNotIn('https://api.weather.gov/points/2,2', cache)
+
+    def test_too_large_responses_are_skipped(self):
+        cache = DiskCache(self.path, max_bytes = 10)
+        cache.set('https://api.weather.gov/glossary', b'x' * 11, {})
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = DiskCache(self.path)
+        cache.set('https://api.weather.gov/glossary', b'{}', {})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestNWSAPyDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cache.sqlite')
+        self.server = StubServer({'/glossary': glossary_payload(),
+                                  '/points/': point_payload()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    def api(self):
+        api = redirect(NWSAPy(), self.server)
+        api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(api.close)
+        return api
+
+    def test_warm_then_get_point_from_another_instance(self):
+        api = self.api()
+        api.set_disk_cache(self.path)
+        points = api.warm([(33, -90), (34, -91)])
+        self.assertEqual(len(points), 2)
+
+        other = self.api()
+        other.set_disk_cache(self.path)
+        point = other.get_point(34, -91)
+        self.assertEqual(point.grid_x, 47)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_warm_without_a_cache_warns(self):
+        with self.assertWarns(UserWarning):
+            self.api().warm([(33, -90)])
+
+
+class TestAsyncNWSAPyDiskCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.server = StubServer({'/glossary': glossary_payload()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.cache = ThreadRecordingDiskCache(os.path.join(directory.name, 'cache.sqlite'))
+
+    async def test_database_is_used_outside_the_event_loop(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            api._cache = self.cache
+            first = await api.get_glossary()
+            second = await api.get_glossary()
+        self.assertEqual(dict(first.values), dict(second.values))
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertTrue(self.cache.threads)
+        self.assertNotIn(threading.current_thread(), self.cache.threads)
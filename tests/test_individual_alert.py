@@ -0,0 +1,122 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+from shapely.geometry import Point, Polygon
+
+from nwsapy.endpoints.alerts import IndividualAlert
+from tests.stub_api import alert_feature
+
+
+class TestLazyIndividualAlert(unittest.TestCase):
+
+    def test_nothing_is_built_until_used(self):
+        alert = IndividualAlert(alert_feature(1))
+        for slot in ('_geometry_d_memo', '_time_d_memo', '_d_memo', '_series_memo'):
+            self.assertIsNone(getattr(alert, slot))
+        self.assertEqual(alert.event, 'Flood Watch')
+        self.assertIsNone(alert._geometry_d_memo)
+
+    def test_times(self):
+        alert = IndividualAlert(alert_feature(1))
+        local = datetime(2026, 10, 17, 12, 1, tzinfo = timezone(timedelta(hours = -5)))
+        self.assertEqual(alert.sent, local)
+        self.assertEqual(alert.sent.utcoffset(), timedelta(hours = -5))
+        self.assertEqual(alert.sent_utc, local)
+        self.assertEqual(alert.sent_utc.utcoffset(), timedelta(0))
+        self.assertEqual(alert.expires_utc - alert.sent_utc, timedelta(hours = 2))
+        self.assertIsNotNone(alert._time_d_memo)
+
+    def test_missing_time(self):
+        alert = IndividualAlert(alert_feature(2))  # even alerts don't end.
+        self.assertIsNone(alert.ends)
+        self.assertIsNone(alert.ends_utc)
+
+    def test_polygon(self):
+        alert = IndividualAlert(alert_feature(1))  # -99, 31 to -98.5, 31.5
+        self.assertIsInstance(alert.polygon, Polygon)
+        self.assertEqual(alert.points[0], Point(-99, 31))
+        self.assertTrue(alert.polygon.contains(Point(-98.75, 31.25)))
+
+    def test_no_geometry(self):
+        alert = IndividualAlert(alert_feature(3))
+        self.assertIsNone(alert.points)
+        self.assertIsNone(alert.polygon)
+
+    def test_multipolygon_points_are_lon_lat(self):
+        feature = alert_feature(1)
+        ring = feature['geometry']['coordinates']
+        feature['geometry'] = {'type': 'MultiPolygon', 'coordinates': [ring, ring]}
+        alert = IndividualAlert(feature)
+        self.assertEqual(len(alert.polygon), 2)
+        self.assertEqual(alert.points[0][0], Point(-99, 31))
+        self.assertTrue(alert.polygon[0].contains(Point(-98.75, 31.25)))
+
+    def test_renamed_attributes(self):
+        alert = IndividualAlert(alert_feature(1))
+        self.assertEqual(alert.affected_zones, ['TXZ101', 'TXC001'])
+        self.assertEqual(alert.area_desc, ['County TXZ101', ' County TXC001'])
+        self.assertEqual(alert.message_type, 'Alert')
+        self.assertEqual(alert.sender_name, 'NWS Office TX')
+
+    def test_to_dict_and_series(self):
+        alert = IndividualAlert(alert_feature(1))
+        d = alert.to_dict()
+        self.assertIs(alert.to_dict(), d)
+        self.assertEqual(d['@id'], alert_feature(1)['properties']['@id'])
+        self.assertEqual(d['sent_utc'], alert.sent_utc)
+        self.assertEqual(d['polygon'], alert.polygon)
+        self.assertEqual(d['affected_zones'], ['TXZ101', 'TXC001'])
+        self.assertIsInstance(alert.series, pd.Series)
+        self.assertEqual(alert.series['event'], 'Flood Watch')
+
+    def test_comparisons(self):
+        first, second = IndividualAlert(alert_feature(1)), IndividualAlert(alert_feature(2))
+        self.assertTrue(first.sent_before(second))
+        self.assertFalse(first.sent_after(second))
+        self.assertTrue(second.sent_after(first))
+        # a missing end time never ends.
+        self.assertTrue(first.ends_before(second))
+        self.assertFalse(second.ends_before(first))
+        self.assertTrue(second.ends_after(first))
+
+
+class TestSlottedIndividualAlert(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        alert = IndividualAlert(alert_feature(1))
+        self.assertFalse(hasattr(alert, '__dict__'))
+        with self.assertRaises(AttributeError):
+            alert.not_a_property = 1
+
+    def test_repeated_values_are_shared(self):
+        features = [alert_feature(1), alert_feature(6)]
+        for feature in features:
+            # separate copies of the same string, as from decoding a response.
+            feature['properties']['event'] = ''.join(['Flood', ' Watch'])
+        first, second = (IndividualAlert(feature) for feature in features)
+        self.assertIsNot(features[0]['properties']['event'], features[1]['properties']['event'])
+        self.assertIs(first.event, second.event)
+
+    def test_properties_without_a_slot(self):
+        feature = alert_feature(1)
+        feature['properties']['newProperty'] = 'new'
+        alert = IndividualAlert(feature)
+        self.assertEqual(getattr(alert, '@id'), feature['properties']['@id'])
+        self.assertEqual(alert.newProperty, 'new')
+        self.assertEqual(alert.to_dict()['newProperty'], 'new')
+        with self.assertRaises(AttributeError):
+            alert.not_a_property
+
+    def test_missing_properties(self):
+        feature = alert_feature(1)
+        del feature['properties']['instruction']
+        alert = IndividualAlert(feature)
+        self.assertFalse(hasattr(alert, 'instruction'))
+        self.assertNotIn('instruction', alert.to_dict())
+
+    def test_response_is_not_kept(self):
+        feature = alert_feature(1)
+        alert = IndividualAlert(feature)
+        feature['properties']['headline'] = 'Changed'
+        self.assertEqual(alert.headline, 'Alert 1')
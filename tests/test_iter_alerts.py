@@ -0,0 +1,108 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlsplit
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.core.inheritance.request_error import RequestError
+from tests.stub_api import (API_URL, BASE_TIME, Route, StubServer, alert_feature,
+                            error_payload, redirect)
+
+PER_PAGE = 10
+
+
+def paged(n_pages, error_on = None):
+    # /alerts in pages of PER_PAGE alerts, newest first, each pointing at the
+    # next one with a cursor.
+    def route(handler):
+        query = parse_qs(urlsplit(handler.path).query)
+        page = int(query.get('cursor', ['0'])[0])
+        if page == error_on:
+            return error_payload(500)
+        start = page * PER_PAGE
+        features = [alert_feature(i, sent = BASE_TIME - timedelta(minutes = i))
+                    for i in range(start, start + PER_PAGE)]
+        payload = {'type': 'FeatureCollection', 'features': features}
+        if page + 1 < n_pages:
+            payload['pagination'] = {'next': f'{API_URL}/alerts?cursor={page + 1}'}
+        return Route(payload)
+    return route
+
+
+def alert_ids(start, stop):
+    return [alert_feature(i)['properties']['id'] for i in range(start, stop)]
+
+
+class TestIterAlerts(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts': paged(5)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_every_page(self):
+        alerts = list(self.api.iter_alerts())
+        self.assertEqual([alert.id for alert in alerts], alert_ids(0, 50))
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_pages_are_requested_lazily(self):
+        alerts = self.api.iter_alerts()
+        self.assertEqual(self.server.requests, [])
+        for _ in range(PER_PAGE):
+            next(alerts)
+        # the first page, and the next one in the background.
+        alerts.close()
+        self.assertLessEqual(len(self.server.requests), 2)
+
+    def test_max_alerts(self):
+        alerts = list(self.api.iter_alerts(max_alerts = 25))
+        self.assertEqual([alert.id for alert in alerts], alert_ids(0, 25))
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_max_alerts_at_the_end_of_a_page(self):
+        alerts = list(self.api.iter_alerts(max_alerts = 20))
+        self.assertEqual(len(alerts), 20)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_since(self):
+        # alert i was sent i minutes before BASE_TIME.
+        since = BASE_TIME - timedelta(minutes = 14, seconds = 30)
+        alerts = list(self.api.iter_alerts(since = since))
+        self.assertEqual([alert.id for alert in alerts], alert_ids(0, 15))
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_since_without_a_timezone_is_utc(self):
+        since = (BASE_TIME - timedelta(minutes = 4, seconds = 30)) \
+            .astimezone(timezone.utc).replace(tzinfo = None)
+        self.assertEqual(len(list(self.api.iter_alerts(since = since))), 5)
+
+    def test_errors(self):
+        self.server.routes['/alerts'] = paged(5, error_on = 1)
+        alerts = list(self.api.iter_alerts())
+        self.assertEqual(len(alerts), PER_PAGE + 1)
+        self.assertIsInstance(alerts[-1], RequestError)
+        self.assertEqual(alerts[-1].status, 500)
+        self.assertEqual(len(self.server.requests), 2)
+
+
+class TestAsyncIterAlerts(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts': paged(5)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def test_async_for(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            # used directly with async for, it isn't awaited.
+            alerts = [alert async for alert in api.iter_alerts(max_alerts = 25)]
+        self.assertEqual([alert.id for alert in alerts], alert_ids(0, 25))
+        self.assertEqual(len(self.server.requests), 3)
+
+    async def test_since(self):
+        since = datetime(2026, 10, 17, 16, 50, 30, tzinfo = timezone.utc)  # 11:50:30 -05:00
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            alerts = [alert async for alert in api.iter_alerts(since = since)]
+        self.assertEqual(len(alerts), 10)
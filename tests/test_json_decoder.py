@@ -0,0 +1,71 @@
+import json
+import sys
+import unittest
+from unittest import mock
+
+from nwsapy import NWSAPy
+from nwsapy.services.json_decoder import get_decoder
+from tests.stub_api import StubServer, glossary_payload, redirect
+
+BODY = json.dumps(glossary_payload()).encode()
+
+
+class TestGetDecoder(unittest.TestCase):
+
+    def test_by_name(self):
+        self.assertIs(get_decoder('json'), json.loads)
+        self.assertEqual(get_decoder('json')(BODY), glossary_payload())
+
+    def test_orjson(self):
+        try:
+            import orjson
+        except ImportError:
+            self.skipTest('orjson is not installed')
+        self.assertIs(get_decoder('orjson'), orjson.loads)
+        self.assertEqual(get_decoder('orjson')(BODY), glossary_payload())
+
+    def test_function(self):
+        decode = lambda body: {'decoded': body}
+        self.assertIs(get_decoder(decode), decode)
+
+    def test_unknown_name(self):
+        with self.assertRaises(ValueError):
+            get_decoder('simplejson')
+
+    def test_not_installed(self):
+        with mock.patch.dict(sys.modules, {'ujson': None}):
+            with self.assertRaises(ImportError):
+                get_decoder('ujson')
+
+    def test_default_falls_back(self):
+        with mock.patch.dict(sys.modules, {'orjson': None, 'ujson': None}):
+            self.assertIs(get_decoder(), json.loads)
+
+
+class TestSetJsonDecoder(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/glossary': glossary_payload()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_decoder_is_used(self):
+        bodies = []
+
+        def decode(body):
+            bodies.append(body)
+            return json.loads(body)
+
+        self.api.set_json_decoder(decode)
+        glossary = self.api.get_glossary()
+        self.assertFalse(glossary.has_any_request_errors)
+        self.assertEqual(len(bodies), 1)
+        self.assertIsInstance(bodies[0], bytes)
+
+    def test_by_name(self):
+        self.api.set_json_decoder('json')
+        self.assertFalse(self.api.get_glossary().has_any_request_errors)
+        with self.assertRaises(ValueError):
+            self.api.set_json_decoder('simplejson')
@@ -0,0 +1,78 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from nwsapy.endpoints.alerts import AlertTable, _parse_times, _parse_times_slowly
+from tests.stub_api import alerts_payload
+
+
+def expected(values):
+    # One datetime.fromisoformat() at a time.
+    utc, offsets = [], []
+    for value in values:
+        if value is None:
+            utc.append(None)
+            offsets.append(0)
+            continue
+        time = datetime.fromisoformat(value)
+        if time.tzinfo is None:
+            time = time.replace(tzinfo = timezone.utc)
+        utc.append(time)
+        offsets.append(time.utcoffset() // timedelta(minutes = 1))
+    return utc, offsets
+
+
+class TestParseTimes(unittest.TestCase):
+
+    def check(self, values):
+        utc, offsets = _parse_times(values)
+        expected_utc, expected_offsets = expected(values)
+        self.assertEqual(utc.dtype, np.dtype('datetime64[ns]'))
+        self.assertEqual(list(offsets), expected_offsets)
+        for parsed, time in zip(utc, expected_utc):
+            if time is None:
+                self.assertTrue(np.isnat(parsed))
+            else:
+                self.assertEqual(pd.Timestamp(parsed).tz_localize('UTC'), time)
+
+    def test_api_layout(self):
+        self.check(['2022-05-01T19:14:00-05:00', '2022-12-31T23:59:59+00:00',
+                    '2023-01-01T05:30:00+05:30', '2021-03-14T01:59:00-10:00'])
+
+    def test_missing_times(self):
+        self.check(['2022-05-01T19:14:00-05:00', None, None])
+        self.check([None, None])
+
+    def test_other_layouts_are_parsed_one_at_a_time(self):
+        # fractions of a second, a Z and no timezone.
+        self.check(['2022-05-01T19:14:00.250-05:00', '2022-05-01T19:14:00Z',
+                    '2022-05-01T19:14:00-05:00', None])
+        self.check(['2022-05-01T19:14:00', '2022-05-01T19:14:00-05:00'])
+        # the right length, but not an offset.
+        self.check(['2022-05-01T19:14:00.123456', '2022-05-01T19:14:00-05:00'])
+
+    def test_matches_the_slow_parser(self):
+        values = [alert['properties']['expires'] for alert in alerts_payload(50)['features']]
+        values[3] = None
+        fast, slow = _parse_times(values), _parse_times_slowly(values)
+        self.assertTrue((fast[0] == slow[0])[~np.isnat(slow[0])].all())
+        self.assertEqual(list(np.isnat(fast[0])), list(np.isnat(slow[0])))
+        self.assertEqual(list(fast[1]), list(slow[1]))
+
+    def test_empty(self):
+        utc, offsets = _parse_times([])
+        self.assertEqual((len(utc), len(offsets)), (0, 0))
+
+    def test_local_times_of_a_table(self):
+        features = alerts_payload(10)['features']
+        features[2]['properties']['sent'] = '2022-05-01T19:14:00+09:30'
+        table = AlertTable(features)
+        for feature, local in zip(features, table.local_times('sent')):
+            time = datetime.fromisoformat(feature['properties']['sent'])
+            self.assertEqual(local, time)
+            self.assertEqual(local.utcoffset(), time.utcoffset())
+        self.assertEqual(table[2].sent,
+                         datetime.fromisoformat('2022-05-01T19:14:00+09:30'))
+        self.assertEqual(table[2].sent.utcoffset(), timedelta(hours = 9, minutes = 30))
@@ -0,0 +1,103 @@
+import unittest
+
+from nwsapy import NWSAPy
+from nwsapy.endpoints.point import Point
+from nwsapy.services.point_cache import PointCache, haversine_km
+from tests.stub_api import StubServer, point_payload, redirect
+
+
+def point(grid = ('JAN', 47, 51)):
+    grid_id, x, y = grid
+    obj = Point()
+    obj.values = {'gridId': grid_id, 'gridX': x, 'gridY': y}
+    obj._set_iterator()
+    return obj
+
+
+class TestHaversine(unittest.TestCase):
+
+    def test_distances(self):
+        self.assertEqual(haversine_km(33, -90, 33, -90), 0)
+        # a degree of latitude is about 111 km.
+        self.assertAlmostEqual(haversine_km(33, -90, 34, -90), 111.2, delta = 0.1)
+        self.assertAlmostEqual(haversine_km(0, 179.9, 0, -179.9), 22.2, delta = 0.1)
+
+
+class TestPointCache(unittest.TestCase):
+
+    def test_nearby_point_is_a_hit(self):
+        cache = PointCache(radius_km = 1)
+        cache.add(33, -90, point())
+        found = cache.get(33.005, -90.005)  # ~0.7 km away.
+        self.assertEqual(found.values['gridX'], 47)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_far_point_is_a_miss(self):
+        cache = PointCache(radius_km = 1)
+        cache.add(33, -90, point())
+        self.assertIsNone(cache.get(33.02, -90))  # ~2.2 km away.
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_points_in_different_cells_are_ambiguous(self):
+        cache = PointCache(radius_km = 1)
+        cache.add(33, -90, point(('JAN', 47, 51)))
+        cache.add(33.008, -90, point(('JAN', 47, 52)))
+        self.assertIsNone(cache.get(33.004, -90))
+        self.assertEqual((cache.misses, cache.ambiguous), (1, 1))
+
+    def test_points_in_the_same_cell_are_not_ambiguous(self):
+        cache = PointCache(radius_km = 1)
+        cache.add(33, -90, point())
+        cache.add(33.008, -90, point())
+        self.assertIsNotNone(cache.get(33.004, -90))
+
+    def test_near_the_poles(self):
+        cache = PointCache(radius_km = 1)
+        cache.add(89.9, 0, point())
+        self.assertIsNotNone(cache.get(89.9, 0.05))  # ~0.01 km away at 89.9 N.
+
+    def test_each_hit_is_a_copy(self):
+        cache = PointCache()
+        original = point()
+        cache.add(33, -90, original)
+        first, second = cache.get(33, -90), cache.get(33, -90)
+        self.assertIsNot(first, second)
+        self.assertIsNot(first, original)
+        self.assertIs(first.values, original.values)
+        first.city = 'Changed'
+        original.city = 'Also changed'
+        self.assertFalse(hasattr(cache.get(33, -90), 'city'))
+
+    def test_clear(self):
+        cache = PointCache()
+        cache.add(33, -90, point())
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get(33, -90))
+
+
+class TestNWSAPyPointCache(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/points/': point_payload()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_nearby_points_are_not_requested(self):
+        self.api.set_point_cache(radius_km = 1)
+        first = self.api.get_point(33, -90)
+        second = self.api.get_point(33.001, -90.001)
+        third = self.api.get_point(33.002, -90.002)
+        self.assertEqual(self.server.paths(), ['/points/33,-90'])
+        self.assertEqual(second.grid_x, first.grid_x)
+        self.assertEqual(len({id(first), id(second), id(third)}), 3)
+        stats = self.api.stats()
+        self.assertEqual((stats['point_cache_hits'], stats['point_cache_misses']), (2, 1))
+
+    def test_off_by_default(self):
+        self.api.get_point(33, -90)
+        self.api.get_point(33.001, -90.001)
+        self.assertEqual(len(self.server.requests), 2)
@@ -0,0 +1,76 @@
+import unittest
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.core.inheritance.request_error import RequestError
+from nwsapy.endpoints.point import Point
+from tests.stub_api import StubServer, error_payload, point_payload, redirect
+
+
+class TestGetPoints(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/points/': point_payload(),
+                                  '/points/10,10': error_payload(500)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_points_in_input_order(self):
+        coords = [(33, -90), (34, -91), (35, -92)]
+        points = self.api.get_points(coords)
+        self.assertEqual(len(points), 3)
+        self.assertTrue(all(isinstance(point, Point) for point in points))
+        self.assertEqual(sorted(self.server.paths()),
+                         ['/points/33,-90', '/points/34,-91', '/points/35,-92'])
+
+    def test_duplicates_are_requested_once(self):
+        coords = [(33, -90), (33.00001, -90.00001), (33, -90), (34, -91)]
+        points = self.api.get_points(coords)
+        self.assertEqual(len(points), 4)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_repeats_are_separate_objects(self):
+        p = (33, -90)
+        points = self.api.get_points([p, p, p])
+        self.assertEqual(len({id(point) for point in points}), 3)
+        self.assertTrue(all(point.values is points[0].values for point in points))
+        # iterating over one doesn't affect the others.
+        iterators = [iter(point) for point in points]
+        first = [next(iterators[0]) for _ in range(3)]
+        self.assertEqual([next(iterators[1]) for _ in range(3)], first)
+
+    def test_errors_are_request_errors(self):
+        points = self.api.get_points([(33, -90), (10, 10), (100, 0), ('a', 0)])
+        self.assertIsInstance(points[0], Point)
+        self.assertIsInstance(points[1], RequestError)
+        self.assertEqual(points[1].status, 500)
+        self.assertIsInstance(points[2], RequestError)
+        self.assertEqual(points[2].title, 'ValueError')
+        self.assertIsInstance(points[3], RequestError)
+
+    def test_as_df(self):
+        df = self.api.get_points([(33, -90), (10, 10), (33, -90)], as_df = True)
+        self.assertEqual(list(df['latitude']), [33, 10, 33])
+        self.assertEqual(list(df['longitude']), [-90, 10, -90])
+        self.assertEqual(list(df['gridX'].isna()), [False, True, False])
+        self.assertEqual(df['error'][1], 'Something went wrong.')
+
+
+class TestAsyncGetPoints(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/points/': point_payload(),
+                                  '/points/10,10': error_payload(500)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def test_points(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            p = (33, -90)
+            points = await api.get_points([p, (10, 10), p, (34, -91)], max_concurrency = 2)
+        self.assertIsInstance(points[0], Point)
+        self.assertIsInstance(points[1], RequestError)
+        self.assertIsNot(points[0], points[2])
+        self.assertEqual(points[0].values, points[2].values)
+        self.assertEqual(len(self.server.requests), 3)
@@ -0,0 +1,136 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from unittest import mock
+
+from nwsapy import NWSAPy
+from nwsapy.services.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+from tests.stub_api import Route, StubServer, glossary_payload, redirect
+
+
+def throttled(times, payload, retry_after = '0'):
+    # Answers 429 Too Many Requests `times` times, then the payload.
+    answered = []
+
+    def route(handler):
+        answered.append(1)
+        if len(answered) <= times:
+            return Route({'correlationId': 'stub', 'title': 'Too Many Requests',
+                          'status': 429, 'detail': 'slow down'},
+                         status = 429, headers = {'Retry-After': retry_after})
+        return payload
+    return route
+
+
+class TestParseRetryAfter(unittest.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after('5'), 5.0)
+        self.assertEqual(parse_retry_after(' 0 '), 0.0)
+
+    def test_http_date(self):
+        value = formatdate(time.time() + 30, usegmt = True)
+        self.assertAlmostEqual(parse_retry_after(value), 30, delta = 1.5)
+        self.assertEqual(parse_retry_after(formatdate(time.time() - 30, usegmt = True)), 0)
+
+    def test_unreadable(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_rate(self):
+        with mock.patch('nwsapy.services.rate_limit.time.monotonic', return_value = 100):
+            bucket = TokenBucket(rate = 2, burst = 3)
+            self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+            # in debt: first come first served, half a second per token.
+            self.assertEqual([bucket.reserve() for _ in range(2)], [0.5, 1.0])
+
+    def test_refills_up_to_burst(self):
+        with mock.patch('nwsapy.services.rate_limit.time.monotonic') as monotonic:
+            monotonic.return_value = 100
+            bucket = TokenBucket(rate = 2, burst = 3)
+            for _ in range(3):
+                bucket.reserve()
+            monotonic.return_value = 200
+            self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+            self.assertEqual(bucket.reserve(), 0.5)
+
+    def test_pause(self):
+        with mock.patch('nwsapy.services.rate_limit.time.monotonic', return_value = 100):
+            bucket = TokenBucket(rate = 2, burst = 3)
+            bucket.pause(4)
+            self.assertEqual(bucket.reserve(), 4.5)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_should_retry(self):
+        limiter = RateLimiter(max_retries = 2)
+        self.assertTrue(limiter.should_retry(429, 0))
+        self.assertTrue(limiter.should_retry(503, 1))
+        self.assertFalse(limiter.should_retry(429, 2))
+        self.assertFalse(limiter.should_retry(500, 0))
+        self.assertFalse(limiter.should_retry(200, 0))
+
+    def test_retry_after_is_followed(self):
+        limiter = RateLimiter(backoff = 0.5)
+        delay = limiter.retry_delay(0, {'Retry-After': '3'})
+        self.assertGreaterEqual(delay, 3)
+        self.assertLessEqual(delay, 3.5)
+
+    def test_backoff_is_capped(self):
+        limiter = RateLimiter(backoff = 1, max_backoff = 4)
+        for attempt in range(10):
+            self.assertLessEqual(limiter.retry_delay(attempt, {}), 4)
+        self.assertEqual(limiter.retries, 10)
+
+    def test_retries_are_counted_from_many_threads(self):
+        limiter = RateLimiter(rate = 1000, burst = 1000, backoff = 0)
+        with ThreadPoolExecutor(max_workers = 16) as pool:
+            for _ in pool.map(lambda _: limiter.retry_delay(0, {}), range(16 * 500)):
+                pass
+        self.assertEqual(limiter.retries, 16 * 500)
+
+
+class TestNWSAPyRateLimit(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_throttled_requests_are_retried(self):
+        self.server.routes['/glossary'] = throttled(2, glossary_payload())
+        self.api.set_rate_limit(rate = 100, burst = 10, backoff = 0.01)
+        glossary = self.api.get_glossary()
+        self.assertFalse(glossary.has_any_request_errors)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.api.stats()['retries'], 2)
+
+    def test_gives_up_after_max_retries(self):
+        self.server.routes['/glossary'] = throttled(10, glossary_payload())
+        self.api.set_rate_limit(rate = 100, max_retries = 2, backoff = 0.01)
+        glossary = self.api.get_glossary()
+        self.assertTrue(glossary.has_any_request_errors)
+        self.assertEqual(glossary.values['status'], 429)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_not_retried_without_a_rate_limit(self):
+        self.server.routes['/glossary'] = throttled(1, glossary_payload())
+        glossary = self.api.get_glossary()
+        self.assertTrue(glossary.has_any_request_errors)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_rate_is_limited(self):
+        self.server.routes['/glossary'] = glossary_payload()
+        self.api.set_rate_limit(rate = 20, burst = 1)
+        start = time.monotonic()
+        for _ in range(5):
+            self.api.get_glossary()
+        # the first request is free, the other 4 wait 1/20 s each.
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
@@ -0,0 +1,108 @@
+import unittest
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.services.cache import RevalidationCache
+from tests.stub_api import Route, StubServer, alerts_payload, error_payload, redirect
+
+
+def conditional(etag, payload):
+    # Answers 304 Not Modified when the client already has `etag`.
+    def route(handler):
+        if handler.headers.get('If-None-Match') == etag:
+            return Route(None, status = 304, headers = {'ETag': etag})
+        return Route(payload, headers = {'ETag': etag})
+    return route
+
+
+class TestRevalidationCache(unittest.TestCase):
+
+    def test_conditional_headers(self):
+        cache = RevalidationCache()
+        self.assertEqual(cache.conditional_headers('https://api.weather.gov/alerts'), {})
+        cache.set('https://api.weather.gov/alerts',
+                  {'ETag': '"v1"', 'Last-Modified': 'Sat, 17 Oct 2026 12:00:00 GMT'}, 'obj')
+        self.assertEqual(cache.conditional_headers('https://api.weather.gov/alerts/'),
+                         {'If-None-Match': '"v1"',
+                          'If-Modified-Since': 'Sat, 17 Oct 2026 12:00:00 GMT'})
+        self.assertEqual(cache.get('https://api.weather.gov/alerts'), 'obj')
+
+    def test_responses_without_validators_are_skipped(self):
+        cache = RevalidationCache()
+        cache.set('https://api.weather.gov/alerts', {}, 'obj')
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('https://api.weather.gov/alerts'))
+
+    def test_least_recently_used_is_dropped(self):
+        cache = RevalidationCache(maxsize = 2)
+        for name in ('a', 'b'):
+            cache.set(f'https://api.weather.gov/{name}', {'ETag': name}, name)
+        cache.get('https://api.weather.gov/a')
+        cache.set('https://api.weather.gov/c', {'ETag': 'c'}, 'c')
+        self.assertEqual(cache.get('https://api.weather.gov/a'), 'a')
+        self.assertIsNone(cache.get('https://api.weather.gov/b'))
+
+
+class TestNWSAPyRevalidation(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': conditional('"v1"', alerts_payload(20)),
+                                  '/alerts/active/count': error_payload(500)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.api.set_revalidation()
+        self.addCleanup(self.api.close)
+
+    def test_not_modified_reuses_the_data(self):
+        first = self.api.get_active_alerts()
+        second = self.api.get_active_alerts()
+        self.assertFalse(first.revalidated)
+        self.assertTrue(second.revalidated)
+        self.assertIs(second.values, first.values)
+        self.assertEqual(len(second), 20)
+        _, headers, _ = self.server.requests[1]
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+
+    def test_flag_is_per_call(self):
+        first = self.api.get_active_alerts()
+        second = self.api.get_active_alerts()
+        third = self.api.get_active_alerts()
+        self.assertEqual([first.revalidated, second.revalidated, third.revalidated],
+                         [False, True, True])
+        self.assertFalse(self.api._revalidation.get(
+            'https://api.weather.gov/alerts/active').revalidated)
+
+    def test_changed_data_is_rebuilt(self):
+        first = self.api.get_active_alerts()
+        self.server.routes['/alerts/active'] = conditional('"v2"', alerts_payload(5))
+        second = self.api.get_active_alerts()
+        self.assertFalse(second.revalidated)
+        self.assertEqual((len(first), len(second)), (20, 5))
+
+    def test_errors_are_not_remembered(self):
+        self.api.get_alert_count()
+        self.assertEqual(len(self.api._revalidation), 0)
+
+    def test_forgotten_urls_are_requested_in_full(self):
+        self.api.get_active_alerts()
+        self.api._revalidation.clear()
+        alerts = self.api.get_active_alerts()
+        self.assertFalse(alerts.revalidated)
+        self.assertEqual(len(alerts), 20)
+
+
+class TestAsyncNWSAPyRevalidation(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': conditional('"v1"', alerts_payload(20))}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def test_flag_is_per_call(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            api.set_revalidation()
+            first = await api.get_active_alerts()
+            second = await api.get_active_alerts()
+        self.assertFalse(first.revalidated)
+        self.assertTrue(second.revalidated)
+        self.assertEqual(len(second), 20)
@@ -0,0 +1,47 @@
+import unittest
+
+from nwsapy import NWSAPy
+from tests.stub_api import StubServer, glossary_payload, redirect
+
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/glossary': glossary_payload()}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def client_ports(self):
+        return [address[1] for _, _, address in self.server.requests]
+
+    def test_requests_reuse_one_connection(self):
+        for _ in range(5):
+            glossary = self.api.get_glossary()
+            self.assertEqual(len(glossary), 3)
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(set(self.client_ports())), 1)
+
+    def test_user_agent_is_sent(self):
+        self.api.get_glossary()
+        _, headers, _ = self.server.requests[0]
+        self.assertEqual(headers['User-Agent'], '(NWSAPy Tests, tests@example.com)')
+
+    def test_set_connection_pool_replaces_the_session(self):
+        self.api.get_glossary()
+        session = self.api._session
+        self.api.set_connection_pool(pool_connections = 2, pool_maxsize = 4)
+        self.assertIsNot(self.api._session, session)
+        self.api.get_glossary()
+        self.assertEqual(len(set(self.client_ports())), 2)
+
+    def test_reconnects_after_close(self):
+        self.api.get_glossary()
+        self.api.close()
+        self.assertEqual(len(self.api.get_glossary()), 3)
+
+    def test_make_request_returns_the_response(self):
+        response = self.api.make_request('https://api.weather.gov/glossary')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['glossary']), 3)
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.services.single_flight import AsyncSingleFlight, SingleFlight
+from tests.stub_api import StubServer, alerts_payload, redirect
+
+
+def slow(payload, seconds = 0.3):
+    # Holds the response back so that callers pile up on the request.
+    def route(handler):
+        time.sleep(seconds)
+        return payload
+    return route
+
+
+class Result:
+    pass
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_are_made_once(self):
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def func():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return Result()
+
+        with ThreadPoolExecutor(max_workers = 5) as pool:
+            leader = pool.submit(flight.do, 'key', func)
+            started.wait()
+            waiters = [pool.submit(flight.do, 'key', func) for _ in range(4)]
+            results = [leader.result()] + [waiter.result() for waiter in waiters]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((flight.calls, flight.coalesced), (1, 4))
+        # every caller gets its own object.
+        self.assertEqual(len({id(result) for result in results}), 5)
+
+    def test_errors_are_raised_for_every_caller(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def func():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError('failed')
+
+        with ThreadPoolExecutor(max_workers = 2) as pool:
+            leader = pool.submit(flight.do, 'key', func)
+            started.wait()
+            waiter = pool.submit(flight.do, 'key', func)
+            for future in (leader, waiter):
+                with self.assertRaises(ValueError):
+                    future.result()
+
+    def test_calls_after_the_first_one_finished_are_made_again(self):
+        flight = SingleFlight()
+        flight.do('key', Result)
+        flight.do('key', Result)
+        self.assertEqual((flight.calls, flight.coalesced), (2, 0))
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_are_made_once(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return Result()
+
+        results = await asyncio.gather(*[flight.do('key', func) for _ in range(5)])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((flight.calls, flight.coalesced), (1, 4))
+        self.assertEqual(len({id(result) for result in results}), 5)
+
+    async def test_errors_are_raised_for_every_caller(self):
+        flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.05)
+            raise ValueError('failed')
+
+        results = await asyncio.gather(*[flight.do('key', func) for _ in range(3)],
+                                       return_exceptions = True)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+
+class TestCoalescedAlerts(unittest.TestCase):
+    # Regression: merged callers got the same object, and since iteration
+    # state lives on the object, loops over it took alerts from each other.
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': slow(alerts_payload(300))}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_each_thread_sees_every_alert(self):
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+
+        def loop():
+            alerts = self.api.get_active_alerts()
+            barrier.wait()  # loop over the results at the same time.
+            seen = []
+            for alert in alerts:
+                seen.append(alert.id)
+                time.sleep(0)
+            return seen
+
+        with ThreadPoolExecutor(max_workers = n_threads) as pool:
+            seen = list(pool.map(lambda _: loop(), range(n_threads)))
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.api.stats()['coalesced'], n_threads - 1)
+        expected = [alert['properties']['id'] for alert in alerts_payload(300)['features']]
+        for ids in seen:
+            self.assertEqual(ids, expected)
+
+
+class TestAsyncCoalescedAlerts(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': slow(alerts_payload(300))}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def test_each_task_sees_every_alert(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+
+            async def loop():
+                alerts = await api.get_active_alerts()
+                seen = []
+                for alert in alerts:
+                    seen.append(alert.id)
+                    await asyncio.sleep(0)
+                return seen
+
+            seen = await asyncio.gather(*[loop() for _ in range(8)])
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual([len(ids) for ids in seen], [300] * 8)
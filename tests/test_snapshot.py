@@ -0,0 +1,167 @@
+import unittest
+from unittest import mock
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.core.mapping import marine_region_areas
+from nwsapy.services.snapshot import MARINE_AREAS, AlertSnapshot
+from tests.stub_api import API_URL, StubServer, alert_feature, error_payload, redirect
+
+MARINE_ZONES = ['GMZ130', 'AMZ250', 'ANZ330', 'GMZ155']
+
+
+def active_features():
+    # Land alerts (FL, TX, OK) and a few marine ones, one of them in two
+    # regions.
+    features = [alert_feature(i) for i in range(60)]
+    for i, zone in enumerate(MARINE_ZONES):
+        zones = [zone] + (['ANZ335'] if i == 1 else [])
+        features[i]['properties']['affectedZones'] = [f'{API_URL}/zones/forecast/{z}'
+                                                      for z in zones]
+    return features
+
+
+def zones_of(feature):
+    return {zone.split('/')[-1] for zone in feature['properties']['affectedZones']}
+
+
+def brute_force_count(features):
+    def count(matches):
+        return sum(1 for feature in features if matches(zones_of(feature)))
+    areas = sorted({zone[:2] for feature in features for zone in zones_of(feature)})
+    zones = sorted({zone for feature in features for zone in zones_of(feature)})
+    regions = {region: count(lambda z: any(zone[:2] in region_areas for zone in z))
+               for region, region_areas in marine_region_areas.items()}
+    return {
+        'total': len(features),
+        'land': count(lambda z: any(zone[:2] not in MARINE_AREAS for zone in z)),
+        'marine': count(lambda z: any(zone[:2] in MARINE_AREAS for zone in z)),
+        'regions': {region: n for region, n in regions.items() if n},
+        'areas': {area: count(lambda z: any(zone[:2] == area for zone in z)) for area in areas},
+        'zones': {zone: count(lambda z: zone in z) for zone in zones},
+    }
+
+
+def api_routes(features):
+    # The API, answering each endpoint by checking every alert.
+    def collection(matches):
+        def route(handler):
+            code = handler.path.split('/')[-1]
+            return {'type': 'FeatureCollection',
+                    'features': [f for f in features if matches(zones_of(f), code)]}
+        return route
+
+    return {
+        '/alerts/active': {'type': 'FeatureCollection', 'features': features},
+        '/alerts/active/area/': collection(lambda z, area: any(zone[:2] == area for zone in z)),
+        '/alerts/active/zone/': collection(lambda z, zone: zone in z),
+        '/alerts/active/region/': collection(
+            lambda z, region: any(zone[:2] in marine_region_areas[region] for zone in z)),
+        '/alerts/active/count': brute_force_count(features),
+    }
+
+
+def ids(alerts):
+    return [alert.id for alert in alerts]
+
+
+class TestAlertSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.features = active_features()
+        self.snapshot = AlertSnapshot(max_age = 60)
+        self.assertTrue(self.snapshot.update(({'features': self.features}, {'ETag': '1'})))
+
+    def test_filters(self):
+        values, headers = self.snapshot.by_zone('txz101')
+        self.assertEqual(values['features'], [f for f in self.features if 'TXZ101' in zones_of(f)])
+        self.assertEqual(headers, {'ETag': '1'})
+        values, _ = self.snapshot.by_area('FL')
+        self.assertEqual(values['features'],
+                         [f for f in self.features if any(z.startswith('FL') for z in zones_of(f))])
+        values, _ = self.snapshot.by_marine_region('AT')
+        self.assertEqual(len(values['features']), 2)  # once each, even if in 2 areas.
+
+    def test_count(self):
+        values, _ = self.snapshot.count()
+        self.assertEqual(values, brute_force_count(self.features))
+
+    def test_errors_are_not_kept(self):
+        self.assertFalse(self.snapshot.update((error_payload(500).payload, {})))
+        self.assertEqual(self.snapshot.count()[0]['total'], 60)
+        self.assertEqual(self.snapshot.updates, 1)
+
+    def test_max_age(self):
+        with mock.patch('nwsapy.services.snapshot.time.monotonic') as monotonic:
+            monotonic.return_value = 100
+            snapshot = AlertSnapshot(max_age = 60)
+            self.assertTrue(snapshot.is_stale())
+            snapshot.update(({'features': []}, {}))
+            monotonic.return_value = 159
+            self.assertFalse(snapshot.is_stale())
+            monotonic.return_value = 160
+            self.assertTrue(snapshot.is_stale())
+
+
+class TestSnapshotMode(unittest.TestCase):
+    # The same getters, with and without snapshot mode, give the same alerts.
+
+    def setUp(self):
+        self.server = StubServer(api_routes(active_features())).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+        self.snapshot_api = redirect(NWSAPy(), self.server)
+        self.snapshot_api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.snapshot_api.set_snapshot(max_age = 60)
+        self.addCleanup(self.snapshot_api.close)
+
+    def test_same_results(self):
+        calls = [('get_alert_by_area', area) for area in ('FL', 'TX', 'OK', 'GM', 'AN', 'Texas')] + \
+                [('get_alert_by_zone', zone) for zone in ('TXZ101', 'FLC002', 'GMZ130', 'AKZ001')] + \
+                [('get_alert_by_marine_region', region) for region in ('GM', 'AT', 'PA')]
+        for method, arg in calls:
+            expected = getattr(self.api, method)(arg)
+            found = getattr(self.snapshot_api, method)(arg)
+            self.assertIs(type(found), type(expected))
+            self.assertEqual(ids(found), ids(expected), f'{method}({arg!r})')
+        self.assertEqual(self.snapshot_api.get_alert_count().values,
+                         self.api.get_alert_count().values)
+
+    def test_one_request(self):
+        self.snapshot_api.get_alert_by_area('FL')
+        self.snapshot_api.get_alert_by_zone('TXZ101')
+        self.snapshot_api.get_alert_count()
+        self.assertEqual(self.server.paths(), ['/alerts/active'])
+        self.assertEqual(self.snapshot_api.stats()['snapshot_updates'], 1)
+
+    def test_errors(self):
+        self.server.routes['/alerts/active'] = error_payload(500)
+        alerts = self.snapshot_api.get_alert_by_area('FL')
+        self.assertTrue(alerts.has_any_request_errors)
+        self.assertEqual(alerts.values['status'], 500)
+        count = self.snapshot_api.get_alert_count()
+        self.assertTrue(count.has_any_request_errors)
+
+
+class TestAsyncSnapshotMode(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer(api_routes(active_features())).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def test_new_client(self):
+        # a new client has every setting, including snapshot mode's.
+        async with AsyncNWSAPy() as api:
+            self.assertEqual(api.stats()['snapshot_updates'], 0)
+
+    async def test_same_results(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            expected = await api.get_alert_by_area('TX')
+            api.set_snapshot(max_age = 60)
+            found = await api.get_alert_by_area('TX')
+            count = await api.get_alert_count()
+            self.assertEqual(api.stats()['snapshot_updates'], 1)
+        self.assertEqual(ids(found), ids(expected))
+        self.assertEqual(count.values, brute_force_count(active_features()))
@@ -0,0 +1,116 @@
+import unittest
+
+from nwsapy.endpoints.alerts import ORDINAL_PROPERTIES, ActiveAlerts, IndividualAlert
+from nwsapy.services import set_data
+from tests.stub_api import alert_feature, error_payload
+
+KEYS = [('sent',), ('-sent',), ('severity',), ('-severity',), ('urgency',), ('-certainty',),
+        ('event',), ('-event',), ('headline',), ('-ends',), ('ends_utc',),
+        ('-severity', 'expires'), ('event', '-urgency', 'sent'), ('severity', '-headline')]
+
+
+def features(n = 100):
+    result = [alert_feature(i) for i in range(n)]
+    for i, feature in enumerate(result):
+        properties = feature['properties']
+        if i % 9 == 0:
+            properties['severity'] = None
+        if i % 17 == 0:
+            properties['severity'] = 'Not a severity'  # sorts with the missing ones.
+        if i % 6 == 0:
+            properties['headline'] = None
+        if i % 4 == 0:
+            properties['certainty'] = 'Possible'
+    return result
+
+
+def brute_force_sort(alerts, keys):
+    # sorted() with a key per alert: missing values last, ties in order.
+    def key_for(key):
+        name = key.lstrip('-')
+        if name.endswith('_utc'):
+            name = name[:-len('_utc')]
+        if name in ORDINAL_PROPERTIES:
+            ranks = {value: rank for rank, value in enumerate(ORDINAL_PROPERTIES[name])}
+            values = [ranks.get(getattr(alert, name)) for alert in alerts]
+        else:
+            attribute = name + '_utc' if name in ('sent', 'effective', 'onset', 'expires', 'ends') \
+                else name
+            raw = [getattr(alert, attribute) for alert in alerts]
+            ranks = {value: rank for rank, value in enumerate(sorted(set(raw) - {None}))}
+            values = [ranks.get(value) for value in raw]
+        sign = -1 if key.startswith('-') else 1
+        return [(value is None, 0 if value is None else sign * value) for value in values]
+
+    columns = [key_for(key) for key in keys]
+    order = sorted(range(len(alerts)), key = lambda i: tuple(column[i] for column in columns))
+    return [alerts[i].id for i in order]
+
+
+def opposite(key):
+    return key[1:] if key.startswith('-') else '-' + key
+
+
+def ids(alerts):
+    return [alert.id for alert in alerts]
+
+
+class SortQueries:
+
+    def test_sort_by(self):
+        alerts = list(self.alerts)
+        for keys in KEYS:
+            self.assertEqual(ids(self.alerts.sort_by(*keys)), brute_force_sort(alerts, keys), keys)
+
+    def test_top_k(self):
+        alerts = list(self.alerts)
+        for key in ('severity', '-severity', 'sent', '-expires', 'event', 'headline'):
+            for k in (0, 1, 5, 17, 100, 150):
+                self.assertEqual(ids(self.alerts.top_k(key, k)),
+                                 brute_force_sort(alerts, [opposite(key)])[:k], (key, k))
+
+    def test_extreme_first(self):
+        found = self.alerts.sort_by('-severity')
+        self.assertEqual(found[0].severity, 'Extreme')
+        self.assertTrue(found[-1].severity in (None, 'Not a severity'))
+
+    def test_same_objects(self):
+        found = self.alerts.sort_by('sent')
+        self.assertTrue(all(any(alert is a for a in self.alerts) for alert in found))
+
+    def test_no_keys(self):
+        with self.assertRaises(ValueError):
+            self.alerts.sort_by()
+
+    def test_values_set_again(self):
+        self.alerts.sort_by('-sent')
+        self.alerts.values = self.alerts.values[:10]
+        self.alerts._set_iterator()
+        self.assertEqual(len(self.alerts.sort_by('-sent')), 10)
+
+
+class TestTableSort(SortQueries, unittest.TestCase):
+
+    def setUp(self):
+        self.alerts = set_data.for_active_alerts(({'features': features()}, {}))
+
+    def test_unknown_property(self):
+        with self.assertRaises(KeyError):
+            self.alerts.sort_by('not_a_property')
+
+
+class TestListSort(SortQueries, unittest.TestCase):
+
+    def setUp(self):
+        self.alerts = ActiveAlerts()
+        self.alerts.values = [IndividualAlert(feature) for feature in features()]
+        self.alerts._set_iterator()
+
+
+class TestSortWithoutAlerts(unittest.TestCase):
+
+    def test_no_alerts(self):
+        for payload in ({'features': []}, error_payload(500).payload):
+            alerts = set_data.for_active_alerts((payload, {}))
+            self.assertEqual(alerts.sort_by('sent'), [])
+            self.assertEqual(alerts.top_k('severity', 3), [])
@@ -0,0 +1,108 @@
+import random
+import unittest
+
+from shapely.geometry import Point, box
+
+from nwsapy.endpoints.alerts import ActiveAlerts, IndividualAlert
+from nwsapy.services import set_data
+from tests.stub_api import alert_feature, alerts_payload, error_payload
+
+
+def table_alerts(n = 200):
+    return set_data.for_active_alerts((alerts_payload(n), {}))
+
+
+def list_alerts(n = 200):
+    alerts = ActiveAlerts()
+    alerts.values = [IndividualAlert(feature) for feature in alerts_payload(n)['features']]
+    alerts._set_iterator()
+    return alerts
+
+
+def ids(alerts):
+    return [alert.id for alert in alerts]
+
+
+class SpatialQueries:
+    # Checked against every alert's polygon, one at a time.
+
+    def setUp(self):
+        self.alerts = self.make()
+        self.rng = random.Random(0)
+
+    def brute_force(self, predicate):
+        return [alert.id for alert in self.alerts
+                if alert.polygon is not None and predicate(alert.polygon)]
+
+    def test_alerts_at(self):
+        for _ in range(200):
+            lat, lon = self.rng.uniform(29, 46), self.rng.uniform(-101, -59)
+            self.assertEqual(ids(self.alerts.alerts_at(lat, lon)),
+                             self.brute_force(lambda p: p.intersects(Point(lon, lat))))
+
+    def test_alerts_at_an_edge(self):
+        # alert 1 is -99, 31 to -98.5, 31.5.
+        self.assertIn(alert_feature(1)['properties']['id'], ids(self.alerts.alerts_at(31, -99)))
+        self.assertIn(alert_feature(1)['properties']['id'],
+                      ids(self.alerts.alerts_at(31.25, -98.5)))
+
+    def test_alerts_intersecting(self):
+        for _ in range(50):
+            lat, lon = self.rng.uniform(29, 46), self.rng.uniform(-101, -59)
+            geometry = box(lon, lat, lon + self.rng.uniform(0, 3), lat + self.rng.uniform(0, 3))
+            self.assertEqual(ids(self.alerts.alerts_intersecting(geometry)),
+                             self.brute_force(geometry.intersects))
+
+    def test_alerts_within_bbox(self):
+        for _ in range(50):
+            lat, lon = self.rng.uniform(29, 46), self.rng.uniform(-101, -59)
+            size = self.rng.uniform(0, 5)
+            found = self.alerts.alerts_within_bbox(lat, lon, lat + size, lon + size)
+            geometry = box(lon, lat, lon + size, lat + size)
+            self.assertEqual(ids(found), self.brute_force(geometry.contains))
+
+    def test_alerts_without_a_polygon_are_skipped(self):
+        # alert 0 (-100, 30) has no geometry.
+        self.assertEqual(self.alerts.alerts_at(30.25, -99.75), [])
+
+    def test_index_is_kept(self):
+        self.alerts.alerts_at(31, -99)
+        tree = self.alerts._tree
+        self.alerts.alerts_at(32, -98)
+        self.assertIs(self.alerts._tree, tree)
+
+
+class TestTableSpatialQueries(SpatialQueries, unittest.TestCase):
+    make = staticmethod(table_alerts)
+
+
+class TestListSpatialQueries(SpatialQueries, unittest.TestCase):
+    make = staticmethod(list_alerts)
+
+
+class TestChangedAlerts(unittest.TestCase):
+
+    def test_setting_values_rebuilds_the_index(self):
+        alerts = table_alerts(10)
+        self.assertEqual(len(alerts.alerts_at(31.25, -98.75)), 1)
+        alerts.values = list_alerts(0).values
+        self.assertEqual(alerts.alerts_at(31.25, -98.75), [])
+        self.assertIsNone(alerts._zones)
+
+    def test_changed_in_place_then_invalidated(self):
+        alerts = list_alerts(10)
+        self.assertEqual(len(alerts.alerts_at(31.25, -98.75)), 1)
+        self.assertEqual(len(alerts.by_zone('TXZ101')), 1)
+        alerts.values[1] = IndividualAlert(alert_feature(2))
+        alerts.values.append(IndividualAlert(alert_feature(121)))  # same place as 1.
+        alerts.invalidate()
+        self.assertEqual(ids(alerts.alerts_at(31.25, -98.75)),
+                         [alert_feature(121)['properties']['id']])
+        self.assertEqual(alerts.by_zone('TXZ101'), [])
+
+    def test_errors(self):
+        alerts = set_data.for_active_alerts((error_payload(500).payload, {}))
+        self.assertTrue(alerts.has_any_request_errors)
+        self.assertEqual(alerts.alerts_at(31, -99), [])
+        self.assertEqual(alerts.alerts_intersecting(box(-100, 30, -90, 40)), [])
+        self.assertEqual(alerts.alerts_within_bbox(30, -100, 40, -90), [])
@@ -0,0 +1,145 @@
+import json
+import random
+import unittest
+
+from nwsapy import AsyncNWSAPy, NWSAPy
+from nwsapy.core.inheritance.request_error import RequestError
+from nwsapy.endpoints.alerts import IndividualAlert
+from nwsapy.services.rate_limit import RateLimiter
+from nwsapy.services.request import _get_with_retries
+from nwsapy.services.stream import FeatureParser
+from tests.stub_api import StubServer, alerts_payload, error_payload, redirect
+
+
+def tricky_payload():
+    # Strings with quotes, backslashes, braces and brackets in them, and a
+    # "features" key that isn't the top level one.
+    payload = alerts_payload(20)
+    features = payload['features']
+    features[1]['properties']['description'] = 'a "quoted" {brace} [bracket] \\ end\\'
+    features[2]['properties']['instruction'] = '\\"\\\\"'
+    features[3]['properties']['features'] = [{'not': 'a feature'}]
+    features[4]['properties']['headline'] = 'snow ❄ and été'
+    payload['@context'] = [{'features': {'@id': 'x'}}]
+    return payload
+
+
+class TestFeatureParser(unittest.TestCase):
+
+    def setUp(self):
+        self.payload = tricky_payload()
+        self.body = json.dumps(self.payload).encode()
+
+    def parse(self, chunks):
+        parser = FeatureParser(json.loads)
+        features = []
+        for chunk in chunks:
+            features.extend(parser.feed(chunk))
+        return features
+
+    def test_whole_body(self):
+        self.assertEqual(self.parse([self.body]), self.payload['features'])
+
+    def test_one_byte_at_a_time(self):
+        chunks = [self.body[i:i + 1] for i in range(len(self.body))]
+        self.assertEqual(self.parse(chunks), self.payload['features'])
+
+    def test_random_chunks(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            cuts = sorted(rng.sample(range(1, len(self.body)), 30))
+            chunks = [self.body[i:j] for i, j in zip([0] + cuts, cuts + [len(self.body)])]
+            self.assertEqual(self.parse(chunks), self.payload['features'])
+
+    def test_features_before_other_keys(self):
+        body = json.dumps({'features': self.payload['features'][:2],
+                           'title': 'later'}).encode()
+        self.assertEqual(self.parse([body]), self.payload['features'][:2])
+
+    def test_no_features(self):
+        self.assertEqual(self.parse([json.dumps(alerts_payload(0)).encode()]), [])
+
+    def test_only_the_current_feature_is_held(self):
+        parser = FeatureParser(json.loads)
+        for i in range(0, len(self.body), 100):
+            parser.feed(self.body[i:i + 100])
+            longest = max(len(json.dumps(f)) for f in self.payload['features'])
+            self.assertLess(len(parser._buffer), longest + 200)
+
+
+class FakeResponse:
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {'Retry-After': '0'}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRequester:
+
+    def __init__(self, statuses):
+        self.responses = [FakeResponse(status) for status in statuses]
+
+    def get(self, url, headers = None, stream = False):
+        return self.responses[len([r for r in self.responses if r.closed])]
+
+
+class TestThrottledStreams(unittest.TestCase):
+
+    def test_throttled_responses_are_closed(self):
+        requester = FakeRequester([429, 503, 200])
+        limiter = RateLimiter(rate = 1000, backoff = 0)
+        response = _get_with_retries(requester, 'url', {}, limiter, stream = True)
+        self.assertIs(response, requester.responses[2])
+        self.assertEqual([r.closed for r in requester.responses], [True, True, False])
+
+
+class TestStreamedAlerts(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': tricky_payload(),
+                                  '/alerts': error_payload(500)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_alerts_are_streamed(self):
+        alerts = self.api.get_active_alerts(stream = True)
+        self.assertFalse(isinstance(alerts, (list, tuple)))
+        alerts = list(alerts)
+        self.assertTrue(all(isinstance(alert, IndividualAlert) for alert in alerts))
+        expected = [IndividualAlert(f).to_dict() for f in tricky_payload()['features']]
+        self.assertEqual([alert.to_dict() for alert in alerts], expected)
+
+    def test_streams_are_not_cached(self):
+        self.api.set_cache()
+        list(self.api.get_active_alerts(stream = True))
+        list(self.api.get_active_alerts(stream = True))
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_errors(self):
+        alerts = list(self.api.get_alerts(stream = True))
+        self.assertEqual(len(alerts), 1)
+        self.assertIsInstance(alerts[0], RequestError)
+        self.assertEqual(alerts[0].status, 500)
+
+
+class TestAsyncStreamedAlerts(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts/active': tricky_payload(),
+                                  '/alerts': error_payload(500)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def test_alerts_are_streamed(self):
+        async with redirect(AsyncNWSAPy(), self.server) as api:
+            api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+            alerts = [alert async for alert in await api.get_active_alerts(stream = True)]
+            errors = [alert async for alert in await api.get_alerts(stream = True)]
+        self.assertEqual([alert.id for alert in alerts],
+                         [f['properties']['id'] for f in tricky_payload()['features']])
+        self.assertIsInstance(errors[0], RequestError)
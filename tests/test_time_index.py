@@ -0,0 +1,143 @@
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from nwsapy.endpoints.alerts import ActiveAlerts, IndividualAlert
+from nwsapy.services import set_data
+from tests.stub_api import BASE_TIME, alert_feature, error_payload
+
+TIMES = ('sent', 'effective', 'onset', 'expires', 'ends')
+
+
+def features(n = 120):
+    result = [alert_feature(i) for i in range(n)]
+    for i, feature in enumerate(result):
+        properties = feature['properties']
+        if i % 7 == 0:  # never ends.
+            properties['expires'] = properties['ends'] = None
+        if i % 11 == 0:  # starts when it was sent.
+            properties['effective'] = properties['onset'] = None
+        if i % 13 == 0:  # no start.
+            properties['effective'] = properties['onset'] = properties['sent'] = None
+    return result
+
+
+def start_of(alert):
+    return alert.effective_utc or alert.onset_utc or alert.sent_utc
+
+
+def end_of(alert):
+    return alert.ends_utc or alert.expires_utc
+
+
+def in_effect(alert, after, before, inclusive):
+    start, end = start_of(alert), end_of(alert)
+    started = start is None or (start <= before if inclusive else start < before)
+    return started and (end is None or end > after)
+
+
+def table_alerts():
+    return set_data.for_active_alerts(({'features': features()}, {}))
+
+
+def list_alerts():
+    alerts = ActiveAlerts()
+    alerts.values = [IndividualAlert(feature) for feature in features()]
+    alerts._set_iterator()
+    return alerts
+
+
+def ids(alerts):
+    return [alert.id for alert in alerts]
+
+
+class TimeQueries:
+
+    def setUp(self):
+        self.alerts = self.make()
+        rng = random.Random(0)
+        self.times = [BASE_TIME + timedelta(minutes = rng.uniform(-60, 600)) for _ in range(100)]
+        # the start and end of alerts exactly.
+        for alert in list(self.alerts)[:30]:
+            self.times.extend(t for t in (start_of(alert), end_of(alert)) if t is not None)
+
+    def test_active_at(self):
+        for time in self.times:
+            self.assertEqual(ids(self.alerts.active_at(time)),
+                             [a.id for a in self.alerts if in_effect(a, time, time, True)])
+
+    def test_active_at_without_a_timezone_is_utc(self):
+        time = BASE_TIME + timedelta(hours = 2)
+        naive = time.astimezone(timezone.utc).replace(tzinfo = None)
+        self.assertEqual(ids(self.alerts.active_at(naive)), ids(self.alerts.active_at(time)))
+
+    def test_active_now(self):
+        now = datetime.now(timezone.utc)
+        self.assertEqual(ids(self.alerts.active_at()),
+                         [a.id for a in self.alerts if in_effect(a, now, now, True)])
+
+    def test_overlapping(self):
+        rng = random.Random(1)
+        for start in self.times:
+            end = start + timedelta(minutes = rng.uniform(0, 240))
+            self.assertEqual(ids(self.alerts.overlapping(start, end)),
+                             [a.id for a in self.alerts if in_effect(a, start, end, False)])
+        self.assertEqual(self.alerts.overlapping(BASE_TIME, BASE_TIME), [])
+        self.assertEqual(self.alerts.overlapping(BASE_TIME, BASE_TIME - timedelta(1)), [])
+
+    def test_expiring_within(self):
+        for now in self.times:
+            delta = timedelta(minutes = 90)
+            self.assertEqual(ids(self.alerts.expiring_within(delta, now = now)),
+                             [a.id for a in self.alerts if a.expires_utc is not None
+                              and now <= a.expires_utc <= now + delta])
+
+    def test_same_objects(self):
+        found = self.alerts.active_at(BASE_TIME + timedelta(hours = 1))
+        self.assertTrue(all(any(alert is a for a in self.alerts) for alert in found))
+
+
+class TestTableTimeQueries(TimeQueries, unittest.TestCase):
+    make = staticmethod(table_alerts)
+
+
+class TestListTimeQueries(TimeQueries, unittest.TestCase):
+    make = staticmethod(list_alerts)
+
+
+class TestTimeQueriesWithoutAlerts(unittest.TestCase):
+
+    def test_no_alerts(self):
+        for payload in ({'features': []}, error_payload(500).payload):
+            alerts = set_data.for_active_alerts((payload, {}))
+            self.assertEqual(alerts.active_at(BASE_TIME), [])
+            self.assertEqual(alerts.overlapping(BASE_TIME, BASE_TIME + timedelta(1)), [])
+            self.assertEqual(alerts.expiring_within(timedelta(1), BASE_TIME), [])
+
+
+class TestComparisons(unittest.TestCase):
+    # Regression: *_before() returned whether the alert was after the other
+    # one, and the other way around.
+
+    def test_against_the_times(self):
+        alerts = [IndividualAlert(feature) for feature in features(30)]
+        for time in TIMES:
+            for a in alerts:
+                for b in alerts:
+                    mine, theirs = getattr(a, time + '_utc'), getattr(b, time + '_utc')
+                    if mine is not None and theirs is not None:
+                        before, after = mine < theirs, mine > theirs
+                    elif time in ('expires', 'ends'):
+                        # a missing time never comes.
+                        before = mine is not None and theirs is None
+                        after = mine is None and theirs is not None
+                    else:
+                        before = after = False
+                    self.assertEqual(getattr(a, time + '_before')(b), before, (time, a.id, b.id))
+                    self.assertEqual(getattr(a, time + '_after')(b), after, (time, a.id, b.id))
+
+    def test_sent_before(self):
+        earlier, later = IndividualAlert(alert_feature(1)), IndividualAlert(alert_feature(2))
+        self.assertTrue(earlier.sent_before(later))
+        self.assertFalse(earlier.sent_after(later))
+        self.assertFalse(earlier.sent_before(earlier))
@@ -0,0 +1,95 @@
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+from nwsapy import NWSAPy
+from nwsapy.core.errors import DataValidationError
+from nwsapy.services import validation
+from nwsapy.services.validation import DataValidationChecker, DataValidationTable
+from tests.stub_api import StubServer, alerts_payload, redirect
+
+
+class TestTables(unittest.TestCase):
+
+    def test_tables_hold_the_lists(self):
+        for table, values in ((validation.VALID_AREAS, validation.valid_areas()),
+                              (validation.VALID_PRODUCTS, validation.valid_products()),
+                              (validation.VALID_SEVERITIES, validation.valid_severity()),
+                              (validation.VALID_MESSAGE_TYPES, validation.valid_message_types())):
+            self.assertIsInstance(table, frozenset)
+            self.assertEqual(table, set(values))
+
+    def test_any_case(self):
+        table = DataValidationTable()
+        self.assertTrue(table.is_valid_product('tornado WARNING'))
+        self.assertTrue(table.is_valid_severity('EXTREME'))
+        self.assertTrue(table.is_valid_area('tx'))
+        self.assertTrue(table.is_valid_area('new mexico'))
+        self.assertFalse(table.is_valid_area('Atlantis'))
+        self.assertFalse(table.is_valid_urgency('Soon'))
+        self.assertFalse(table.is_valid_status(None))
+
+    def test_areas_and_regions(self):
+        checker = DataValidationChecker()
+        self.assertEqual(checker.check_if_valid_area('Texas'), 'TX')
+        self.assertEqual(checker.check_if_valid_area('gm'), 'GM')
+        self.assertEqual(checker.check_if_valid_marine_region('pi'), 'PI')
+        with self.assertRaises(DataValidationError):
+            checker.check_if_valid_area('XX')
+        with self.assertRaises(DataValidationError):
+            checker.check_if_valid_marine_region('TX')
+
+
+class TestCheckActiveAlertsDvt(unittest.TestCase):
+
+    def setUp(self):
+        self.checker = DataValidationChecker()
+
+    def test_values_as_written_in_the_tables(self):
+        checked = self.checker.check_active_alerts_dvt(
+            {'severity': 'severe', 'area': ['texas', 'fl'], 'event': ('tornado warning',),
+             'message_type': 'ALERT', 'region_type': 'land', 'start': '2022-01-01'})
+        self.assertEqual(checked, {'severity': 'Severe', 'area': ['TX', 'FL'],
+                                   'event': ('Tornado Warning',), 'message_type': 'alert',
+                                   'region_type': 'Land', 'start': '2022-01-01'})
+
+    def test_every_invalid_value_is_reported(self):
+        with self.assertRaises(DataValidationError) as raised:
+            self.checker.check_active_alerts_dvt({'area': ['TX', 'XX', 'Atlantis']})
+        self.assertIn("'XX'", str(raised.exception))
+        self.assertIn("'Atlantis'", str(raised.exception))
+        self.assertNotIn("'TX'", str(raised.exception))
+
+    def test_limit(self):
+        for limit in (1, 500, 20.0):
+            self.assertEqual(self.checker.check_active_alerts_dvt(
+                {'limit': limit}, is_all_alerts = True), {'limit': limit})
+        with self.assertRaises(DataValidationError):
+            self.checker.check_active_alerts_dvt({'limit': 501}, is_all_alerts = True)
+        with self.assertRaises(TypeError):
+            self.checker.check_active_alerts_dvt({'limit': '10'}, is_all_alerts = True)
+        # only checked for /alerts.
+        self.assertEqual(self.checker.check_active_alerts_dvt({'limit': 501}), {'limit': 501})
+
+
+class TestAlertsUrl(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer({'/alerts': alerts_payload(3),
+                                  '/alerts/active': alerts_payload(3)}).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.api = redirect(NWSAPy(), self.server)
+        self.api.set_user_agent('NWSAPy Tests', 'tests@example.com')
+        self.addCleanup(self.api.close)
+
+    def test_values_are_sent_as_written_in_the_tables(self):
+        self.api.get_active_alerts(severity = ['severe', 'EXTREME'], area = 'texas')
+        query = parse_qs(urlsplit(self.server.requests[0][0]).query)
+        self.assertEqual(query, {'severity': ['Severe,Extreme'], 'area': ['TX']})
+
+    def test_limit_is_checked_for_all_alerts(self):
+        with self.assertRaises(DataValidationError):
+            self.api.get_alerts(limit = 501)
+        with self.assertRaises(DataValidationError):
+            self.api.iter_alerts(limit = 1000)
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(len(self.api.get_alerts(limit = 500)), 3)
@@ -0,0 +1,70 @@
+import unittest
+
+from nwsapy.endpoints.alerts import ActiveAlerts, IndividualAlert
+from nwsapy.services import set_data
+from tests.stub_api import alerts_payload, error_payload
+
+
+def zones_of(alert):
+    return [zone.split('/')[-1] for zone in alert.affectedZones or ()]
+
+
+def brute_force(alerts, zones):
+    def matches(zone_id, zone):
+        zone = zone.upper()
+        return zone_id.startswith(zone[:-1]) if zone.endswith('*') else zone_id == zone
+    return [alert.id for alert in alerts
+            if any(matches(zone_id, zone) for zone_id in zones_of(alert) for zone in zones)]
+
+
+class ZoneQueries:
+
+    def test_by_zone(self):
+        all_zones = sorted({zone for alert in self.alerts for zone in zones_of(alert)})
+        for zone in all_zones + ['TXZ999', 'XXC000']:
+            self.assertEqual([alert.id for alert in self.alerts.by_zone(zone)],
+                             brute_force(self.alerts, [zone]))
+
+    def test_lists_and_prefixes(self):
+        queries = [['FLZ*'], ['txc*'], ['OK*', 'OKZ102'], ['TXZ101', 'FLZ*', 'TXZ101'],
+                   ['*'], ['Z*'], [], ['FLZ1*']]
+        for zones in queries:
+            self.assertEqual([alert.id for alert in self.alerts.by_zone(zones)],
+                             brute_force(self.alerts, zones))
+
+    def test_zones_with_alerts(self):
+        all_zones = sorted({zone for alert in self.alerts for zone in zones_of(alert)})
+        self.assertEqual(self.alerts.zones_with_alerts(), all_zones)
+        self.assertEqual(self.alerts.zones_with_alerts('FLZ'),
+                         [zone for zone in all_zones if zone.startswith('FLZ')])
+        self.assertEqual(self.alerts.zones_with_alerts('txc*'),
+                         [zone for zone in all_zones if zone.startswith('TXC')])
+        self.assertEqual(self.alerts.zones_with_alerts('AK'), [])
+
+    def test_same_objects(self):
+        alert = self.alerts.by_zone('TXZ101')[0]
+        self.assertIs(alert, self.alerts[1])
+
+
+class TestTableZoneQueries(ZoneQueries, unittest.TestCase):
+
+    def setUp(self):
+        self.alerts = set_data.for_active_alerts((alerts_payload(150), {}))
+
+
+class TestListZoneQueries(ZoneQueries, unittest.TestCase):
+
+    def setUp(self):
+        self.alerts = ActiveAlerts()
+        self.alerts.values = [IndividualAlert(f) for f in alerts_payload(150)['features']]
+        self.alerts._set_iterator()
+
+
+class TestZoneQueriesWithoutAlerts(unittest.TestCase):
+
+    def test_no_alerts(self):
+        for payload in (alerts_payload(0), error_payload(500).payload):
+            alerts = set_data.for_active_alerts((payload, {}))
+            self.assertEqual(alerts.by_zone('TXZ101'), [])
+            self.assertEqual(alerts.by_zone('TX*'), [])
+            self.assertEqual(alerts.zones_with_alerts(), [])